@@ -1,12 +1,18 @@
-from flask import Flask, request, jsonify
+from flask import Flask, Response, request, jsonify
 from config import Config
+import hashlib
+import itertools
+import json
 import logging
 from database.init_db import init_database
 from services.line_bot import handle_webhook
 from services.zoom_api import test_zoom_connection
 from services.google_calendar import test_google_calendar_connection
 from services.google_calendar import google_calendar_api
+from database.connection import connection_manager
+from utils.health import health_prober
 import os
+from datetime import datetime, timezone
 
 # ログ設定
 logging.basicConfig(
@@ -23,6 +29,32 @@ logger = logging.getLogger(__name__)
 app = Flask(__name__)
 app.config.from_object(Config)
 
+ZOOM_CONFIGURED = bool(Config.ZOOM_API_KEY and Config.ZOOM_API_SECRET and Config.ZOOM_ACCOUNT_ID)
+GOOGLE_CONFIGURED = bool(Config.GOOGLE_CREDENTIALS_JSON)
+
+# 依存サービスのヘルスチェック（バックグラウンドで定期実行し、エンドポイントは最新結果を返す）
+health_prober.register('database', connection_manager.ping, Config.HEALTH_DB_INTERVAL, Config.HEALTH_PROBE_TIMEOUT)
+if ZOOM_CONFIGURED:
+    health_prober.register('zoom_api', test_zoom_connection, Config.HEALTH_API_INTERVAL, Config.HEALTH_PROBE_TIMEOUT)
+if GOOGLE_CONFIGURED:
+    health_prober.register('google_calendar', test_google_calendar_connection, Config.HEALTH_API_INTERVAL, Config.HEALTH_PROBE_TIMEOUT)
+
+def _health_snapshot(required=None):
+    """ヘルスチェック結果取得（?refresh=1 の場合は全件をその場で並列実行）
+
+    required のうち起動直後でまだ結果がないものだけはその場で確認する
+    """
+    health_prober.start()
+    if request.args.get('refresh') == '1':
+        return health_prober.probe_now()
+
+    snapshot = health_prober.snapshot()
+    pending = [name for name in (required if required is not None else snapshot)
+               if snapshot[name]['status'] == 'pending']
+    if pending:
+        snapshot.update(health_prober.probe_now(pending))
+    return snapshot
+
 @app.route('/')
 def index():
     """トップページ"""
@@ -37,34 +69,26 @@ def index():
 
 @app.route('/health')
 def health_check():
-    """ヘルスチェック"""
+    """ヘルスチェック（バックグラウンドで取得した最新結果を返す）"""
     try:
-        from datetime import datetime
-        
-        # データベース接続確認
-        from database.init_db import get_connection
-        conn = get_connection()
-        cursor = conn.cursor()
-        cursor.execute('SELECT 1')
-        conn.close()
-        
-        # サービス設定確認
-        zoom_configured = bool(Config.ZOOM_API_KEY and Config.ZOOM_API_SECRET and Config.ZOOM_ACCOUNT_ID)
-        google_configured = bool(Config.GOOGLE_CREDENTIALS_JSON)
+        checks = _health_snapshot(['database'])
+        database = checks['database']
         line_configured = bool(Config.LINE_CHANNEL_ACCESS_TOKEN and Config.LINE_CHANNEL_SECRET)
         
-        return {
-            "status": "healthy",
+        body = {
+            "status": "healthy" if database['healthy'] else "unhealthy",
             "timestamp": datetime.now().isoformat(),
-            "database": "connected",
+            "database": "connected" if database['healthy'] else "disconnected",
             "services": {
-                "zoom_api": "configured" if zoom_configured else "not_configured",
-                "google_calendar": "configured" if google_configured else "not_configured",
+                "zoom_api": "configured" if ZOOM_CONFIGURED else "not_configured",
+                "google_calendar": "configured" if GOOGLE_CONFIGURED else "not_configured",
                 "line_bot": "configured" if line_configured else "not_configured"
             },
+            "checks": checks,
             "environment": "railway" if Config.IS_RAILWAY else "local",
             "calendar_id": getattr(Config, 'GOOGLE_CALENDAR_ID', None)
         }
+        return (body, 200) if database['healthy'] else (body, 500)
     except Exception as e:
         logger.error(f"ヘルスチェックエラー: {str(e)}")
         return {
@@ -73,6 +97,38 @@ def health_check():
             "error": str(e)
         }, 500
 
+@app.route('/metrics')
+def metrics():
+    """内部メトリクス取得"""
+    try:
+        from database.connection import get_db_stats
+        from database.models import meeting_cache
+        from services.line_bot import meeting_executor, event_dispatcher, webhook_dedup
+        from services.line_client import line_client
+        from services.zoom_api import zoom_api
+        from utils.credential_store import credential_store
+        from utils.conversation_store import conversation_store
+        from utils.outbound import get_breaker_stats
+        
+        return jsonify({
+            "database": get_db_stats(),
+            "meeting_cache": meeting_cache.get_stats(),
+            "meeting_executor": meeting_executor.get_stats(),
+            "webhook_dispatcher": event_dispatcher.get_stats(),
+            "webhook_dedup": webhook_dedup.get_stats(),
+            "line_api": line_client.get_stats(),
+            "zoom_rate_limit": zoom_api.get_rate_limit_stats(),
+            "zoom_token": zoom_api.get_token_stats(),
+            "credential_store": credential_store.get_stats(),
+            "conversation_store": conversation_store.get_stats(),
+            "google_transport_pool": google_calendar_api.get_transport_stats(),
+            "circuit_breakers": get_breaker_stats()
+        })
+        
+    except Exception as e:
+        logger.error(f"メトリクス取得エラー: {str(e)}")
+        return jsonify({"status": "error", "message": str(e)}), 500
+
 @app.route('/webhook', methods=['POST'])
 def webhook():
     """LINE Bot Webhook"""
@@ -123,30 +179,22 @@ def test_google_calendar_list():
 
 @app.route('/test/all')
 def test_all():
-    """全API接続テスト"""
+    """全API接続テスト（最新のヘルスチェック結果を返す。?refresh=1 でその場で並列実行）"""
     try:
+        checks = _health_snapshot()
         results = {
-            "zoom_api": test_zoom_connection(),
-            "google_calendar": test_google_calendar_connection(),
-            "database": True
+            "zoom_api": False,
+            "google_calendar": False
         }
-        
-        # データベーステスト
-        try:
-            from database.init_db import get_connection
-            conn = get_connection()
-            cursor = conn.cursor()
-            cursor.execute('SELECT 1')
-            conn.close()
-        except Exception as e:
-            results["database"] = False
-            logger.error(f"データベーステストエラー: {str(e)}")
+        for name, check in checks.items():
+            results[name] = bool(check['healthy'])
         
         all_success = all(results.values())
         
         return jsonify({
             "status": "success" if all_success else "partial",
             "results": results,
+            "checks": checks,
             "message": "全API接続テスト完了" if all_success else "一部API接続に問題があります"
         })
         
@@ -206,21 +254,76 @@ def debug_env():
 
 @app.route('/meetings/<user_id>')
 def get_user_meetings(user_id):
-    """ユーザーの会議一覧取得"""
+    """ユーザーの会議一覧取得（開始日時の降順、cursor で次ページ取得）"""
     try:
-        from database.models import Meeting
+        from database.models import Meeting, decode_page_cursor
         
-        meetings = Meeting.get_by_user_id(user_id)
+        try:
+            limit = min(max(int(request.args.get('limit', Config.MEETINGS_PAGE_SIZE)), 1), Config.MEETINGS_MAX_PAGE_SIZE)
+            cursor = request.args.get('cursor')
+            after = decode_page_cursor(cursor) if cursor else None
+        except ValueError as e:
+            return jsonify({"status": "error", "message": str(e)}), 400
         
-        return jsonify({
-            "status": "success",
-            "meetings": meetings
-        })
+        # 一覧のバージョン（最後に追加した会議の ID・作成日時）から ETag / Last-Modified を作成
+        last_id, last_created_at = Meeting.get_list_version(user_id)
+        etag = hashlib.sha1(f"{last_id}:{last_created_at}:{limit}:{cursor}".encode('utf-8')).hexdigest()[:20]
+        last_modified = None
+        if last_created_at:
+            last_modified = datetime.strptime(last_created_at, '%Y-%m-%d %H:%M:%S').replace(tzinfo=timezone.utc)
+        
+        # 変わっていなければ一覧の取得も JSON の組み立てもせずに 304 を返す
+        if request.if_none_match:
+            # プロキシが弱い ETag（W/"..."）にして返してくる場合も一致とみなす
+            not_modified = request.if_none_match.contains_weak(etag)
+        else:
+            not_modified = bool(last_modified and request.if_modified_since
+                                and last_modified <= request.if_modified_since)
+        
+        if not_modified:
+            response = Response(status=304)
+        else:
+            response = Response(_stream_meetings(Meeting.iter_by_user_id(user_id, limit + 1, after), limit),
+                                mimetype='application/json')
+        
+        response.set_etag(etag)
+        if last_modified:
+            response.last_modified = last_modified
+        response.headers['Cache-Control'] = 'no-cache'
+        return response
         
     except Exception as e:
         logger.error(f"会議一覧取得エラー: {str(e)}")
         return jsonify({"status": "error", "message": str(e)}), 500
 
+def _stream_meetings(rows, limit: int):
+    """会議一覧の JSON を1件ずつ組み立てて送信（limit + 1 件目があれば次ページのカーソルを付ける）"""
+    from database.models import encode_page_cursor
+    
+    # クエリのエラーは呼び出し元で 500 にするため先頭行だけ先に読む
+    first = next(rows, None)
+    
+    def generate():
+        yield '{"status":"success","meetings":['
+        next_cursor = None
+        last = None
+        try:
+            for index, meeting in enumerate(itertools.chain([first] if first else [], rows)):
+                if index == limit:
+                    next_cursor = encode_page_cursor(last['start_time'], last['id'])
+                    break
+                yield (',' if index else '') + json.dumps(meeting, ensure_ascii=False, default=str)
+                last = meeting
+        except Exception as e:
+            # 送信途中のエラーは閉じ括弧を送らずに応答を中断する（途中までの一覧を最終ページに見せないため）
+            logger.error(f"会議一覧取得エラー（送信中断）: {str(e)}")
+            raise
+        finally:
+            rows.close()
+        yield '],"next_cursor":' + json.dumps(next_cursor) + '}'
+    
+    return generate()
+
 @app.errorhandler(404)
 def not_found(error):
     """404エラーハンドリング"""
@@ -248,6 +351,18 @@ def main():
         init_database()
         logger.info("データベース初期化完了")
         
+        # Zoom トークンを事前取得（以降は期限前にバックグラウンドで更新）
+        if ZOOM_CONFIGURED:
+            from services.zoom_api import zoom_api
+            zoom_api.prefetch_token()
+        
+        # Google Calendar クライアントを事前に組み立て
+        if GOOGLE_CONFIGURED:
+            google_calendar_api.warm_up()
+        
+        # ヘルスチェックをバックグラウンドで開始
+        health_prober.start()
+        
         # アプリケーション起動
         logger.info(f"アプリケーション起動: {Config.HOST}:{Config.PORT}")
         
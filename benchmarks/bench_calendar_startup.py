@@ -0,0 +1,67 @@
+"""Google Calendar クライアント初回リクエスト準備時間のベンチマーク
+
+従来（build() + 毎回 service.events()）と、同梱 Discovery ドキュメントを
+一度だけパースしてリソースを使い回す現在の方式を、それぞれ新しいプロセスで計測する。
+ネットワークには接続しない（リクエストオブジェクトの組み立てまでを計測）。
+
+使い方: python benchmarks/bench_calendar_startup.py [回数]
+"""
+import json
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+LEGACY = '''
+import time
+t0 = time.perf_counter()
+from googleapiclient.discovery import build
+from google.auth.credentials import AnonymousCredentials
+t1 = time.perf_counter()
+service = build('calendar', 'v3', credentials=AnonymousCredentials())
+service.events().insert(calendarId='primary', body={})
+t2 = time.perf_counter()
+for _ in range(100):
+    service.events().insert(calendarId='primary', body={})
+t3 = time.perf_counter()
+print(json.dumps({'import': t1 - t0, 'first_request': t2 - t1, 'per_request': (t3 - t2) / 100}))
+'''
+
+CURRENT = '''
+import time
+t0 = time.perf_counter()
+from googleapiclient.discovery import build_from_document
+from google.auth.credentials import AnonymousCredentials
+from services.google_calendar import get_discovery_document
+t1 = time.perf_counter()
+service = build_from_document(get_discovery_document(), credentials=AnonymousCredentials())
+events = service.events()
+events.insert(calendarId='primary', body={})
+t2 = time.perf_counter()
+for _ in range(100):
+    events.insert(calendarId='primary', body={})
+t3 = time.perf_counter()
+print(json.dumps({'import': t1 - t0, 'first_request': t2 - t1, 'per_request': (t3 - t2) / 100}))
+'''
+
+def run(code: str) -> dict:
+    """新しいプロセスで計測コードを実行"""
+    output = subprocess.check_output(
+        [sys.executable, '-c', 'import json\n' + code],
+        cwd=ROOT,
+        env=dict(os.environ, PYTHONPATH=ROOT),
+        stderr=subprocess.DEVNULL
+    )
+    return json.loads(output.decode().strip().splitlines()[-1])
+
+def main():
+    rounds = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    for label, code in (('legacy', LEGACY), ('current', CURRENT)):
+        results = [run(code) for _ in range(rounds)]
+        first = sorted(r['first_request'] for r in results)[rounds // 2]
+        per_request = sorted(r['per_request'] for r in results)[rounds // 2]
+        print(f"{label:8s} 初回リクエスト準備: {first * 1000:7.2f}ms  2回目以降: {per_request * 1000:6.3f}ms/件  (中央値, {rounds}回)")
+
+if __name__ == '__main__':
+    main()
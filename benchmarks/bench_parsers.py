@@ -0,0 +1,75 @@
+"""日付・時間・会議時間パーサーのマイクロベンチマーク
+
+従来の datetime.strptime を形式毎に試す実装と、正規化してから
+コンパイル済みの正規表現で一度に解析する現在の実装を比較する。
+
+使い方: python benchmarks/bench_parsers.py [回数]
+"""
+import os
+import re
+import sys
+import timeit
+from datetime import datetime
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.helpers import validate_date, validate_time, validate_duration
+
+def legacy_validate_date(date_str):
+    """従来の日付検証"""
+    for fmt in ['%Y/%m/%d', '%Y-%m-%d', '%m/%d/%Y', '%m-%d-%Y', '%Y年%m月%d日']:
+        try:
+            date_obj = datetime.strptime(date_str, fmt)
+            if date_obj.year < 2024:
+                return None
+            return date_obj
+        except ValueError:
+            continue
+    return None
+
+def legacy_validate_time(time_str):
+    """従来の時間検証"""
+    for fmt in ['%H:%M', '%H時%M分', '%I:%M %p', '%I時%M分 %p']:
+        try:
+            return datetime.strptime(time_str, fmt)
+        except ValueError:
+            continue
+    return None
+
+def legacy_validate_duration(duration_str):
+    """従来の会議時間検証"""
+    if duration_str.isdigit():
+        duration = int(duration_str)
+        if 1 <= duration <= 480:
+            return duration
+    if '分' in duration_str:
+        numbers = re.findall(r'\d+', duration_str)
+        if numbers:
+            duration = int(numbers[0])
+            if 1 <= duration <= 480:
+                return duration
+    return None
+
+# (ラベル, 従来実装, 現在の実装, 入力例)
+CASES = [
+    ('date', legacy_validate_date, validate_date,
+     ['2025/01/15', '2025-01-15', '01/15/2025', '01-15-2025', '2025年1月15日', '２０２５／０１／１５', 'あした']),
+    ('time', legacy_validate_time, validate_time,
+     ['14:00', '14時00分', '2:00 PM', '2時00分 PM', '１４：００', '午後']),
+    ('duration', legacy_validate_duration, validate_duration,
+     ['60', '60分', '６０分', '1時間30分', 'たくさん']),
+]
+
+def main():
+    number = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    for label, legacy, current, inputs in CASES:
+        print(f"[{label}]")
+        for text in inputs:
+            legacy_time = min(timeit.repeat(lambda: legacy(text), number=number, repeat=3)) / number
+            current_time = min(timeit.repeat(lambda: current(text), number=number, repeat=3)) / number
+            accepted = f"{'OK' if legacy(text) else 'NG'} -> {'OK' if current(text) else 'NG'}"
+            print(f"  {text:<14s} 従来: {legacy_time * 1e6:6.2f}us  現在: {current_time * 1e6:6.2f}us  "
+                  f"({legacy_time / current_time:4.1f}倍)  {accepted}")
+
+if __name__ == '__main__':
+    main()
@@ -10,6 +10,10 @@ class Config:
     # LINE Bot
     LINE_CHANNEL_ACCESS_TOKEN = os.getenv('LINE_CHANNEL_ACCESS_TOKEN')
     LINE_CHANNEL_SECRET = os.getenv('LINE_CHANNEL_SECRET')
+    LINE_POOL_SIZE = int(os.getenv('LINE_POOL_SIZE', 10))  # Keep-Alive 接続数
+    LINE_COALESCE_WINDOW = float(os.getenv('LINE_COALESCE_WINDOW', 0.2))  # プッシュメッセージをまとめる待ち時間（秒）
+    LINE_CONNECT_TIMEOUT = float(os.getenv('LINE_CONNECT_TIMEOUT', 3.05))
+    LINE_READ_TIMEOUT = float(os.getenv('LINE_READ_TIMEOUT', 10))
     
     # デバッグ用：環境変数の直接確認
     if not LINE_CHANNEL_SECRET:
@@ -22,15 +26,66 @@ class Config:
     ZOOM_API_KEY = os.getenv('ZOOM_API_KEY')  # Client ID
     ZOOM_API_SECRET = os.getenv('ZOOM_API_SECRET')  # Client Secret
     ZOOM_ACCOUNT_ID = os.getenv('ZOOM_ACCOUNT_ID')  # Account ID
+    ZOOM_RATE_LIMIT_PER_SECOND = float(os.getenv('ZOOM_RATE_LIMIT_PER_SECOND', 10))  # 秒間リクエスト数
+    ZOOM_RATE_LIMIT_BURST = int(os.getenv('ZOOM_RATE_LIMIT_BURST', 10))  # 瞬間的に許容するリクエスト数
+    ZOOM_MAX_RETRIES = int(os.getenv('ZOOM_MAX_RETRIES', 3))  # 429 受信時の再試行回数
+    ZOOM_MAX_RATE_LIMIT_WAIT = float(os.getenv('ZOOM_MAX_RATE_LIMIT_WAIT', 30))  # レート制限で待機する最大秒数
+    ZOOM_CONNECT_TIMEOUT = float(os.getenv('ZOOM_CONNECT_TIMEOUT', 3.05))  # 接続タイムアウト（秒）
+    ZOOM_TIMEOUT = float(os.getenv('ZOOM_TIMEOUT', 15))  # 読み込みタイムアウト（秒）
+    ZOOM_TOKEN_REFRESH_AHEAD = float(os.getenv('ZOOM_TOKEN_REFRESH_AHEAD', 300))  # 有効期限の何秒前にバックグラウンド更新するか
     
     # Google Calendar
     GOOGLE_CREDENTIALS_JSON = os.getenv('GOOGLE_CREDENTIALS_JSON')
     # 正式名が未設定でも、誤綴り GOOGLE_CALENDER_ID をフォールバックで参照
     _gcid_env = os.getenv('GOOGLE_CALENDAR_ID') or os.getenv('GOOGLE_CALENDER_ID')
     GOOGLE_CALENDAR_ID = _gcid_env.strip() if isinstance(_gcid_env, str) else None  # 例: yourname@gmail.com or xxxxx@group.calendar.google.com
+    GOOGLE_HTTP_POOL_SIZE = int(os.getenv('GOOGLE_HTTP_POOL_SIZE', os.getenv('MEETING_WORKERS', 4)))  # 並列に使うトランスポート数
+    GOOGLE_TIMEOUT = float(os.getenv('GOOGLE_TIMEOUT', 30))  # リクエストタイムアウト（秒）
     
     # データベース
     DATABASE_URL = 'meetings.db'
+    DB_BUSY_TIMEOUT_MS = int(os.getenv('DB_BUSY_TIMEOUT_MS', 5000))  # ロック待ち時間（ミリ秒）
+    DB_CACHED_STATEMENTS = int(os.getenv('DB_CACHED_STATEMENTS', 128))  # 接続毎のプリペアドステートメントキャッシュ数
+    MEETINGS_PAGE_SIZE = int(os.getenv('MEETINGS_PAGE_SIZE', 50))  # 会議一覧の1ページの件数
+    MEETINGS_MAX_PAGE_SIZE = int(os.getenv('MEETINGS_MAX_PAGE_SIZE', 200))  # limit で指定できる件数の上限
+    MEETING_CACHE_SIZE = int(os.getenv('MEETING_CACHE_SIZE', 1000))  # 会議読み込みキャッシュの件数上限
+    MEETING_CACHE_TTL = float(os.getenv('MEETING_CACHE_TTL', 30))  # 会議読み込みキャッシュの有効期限（秒）
+    
+    # 認証情報ストア（Zoom / Google のトークンを暗号化してプロセス間で共有）
+    TOKEN_STORE_PATH = os.getenv('TOKEN_STORE_PATH', 'credentials.db')
+    TOKEN_STORE_SECRET = os.getenv('TOKEN_STORE_SECRET')  # 未設定の場合は永続化しない
+    
+    # 会話状態ストア（複数プロセスで運用する場合は sqlite にして共有ボリューム上のパスを指定）
+    CONVERSATION_STORE = os.getenv('CONVERSATION_STORE', 'memory')  # memory / sqlite
+    CONVERSATION_STORE_PATH = os.getenv('CONVERSATION_STORE_PATH', 'conversations.db')
+    CONVERSATION_TTL = float(os.getenv('CONVERSATION_TTL', 1800))  # 会話状態の有効期限（秒）
+    CONVERSATION_MAX_ENTRIES = int(os.getenv('CONVERSATION_MAX_ENTRIES', 10000))  # メモリに保持する会話状態の上限（超えたら古いものから破棄）
+    CONVERSATION_SWEEP_INTERVAL = float(os.getenv('CONVERSATION_SWEEP_INTERVAL', 60))  # 期限切れ削除の間隔（秒）
+    CONVERSATION_EXPIRY_NOTIFY = os.getenv('CONVERSATION_EXPIRY_NOTIFY', 'False').lower() == 'true'  # 期限切れ時にユーザーへ通知
+    
+    # 会議作成ワーカープール
+    MEETING_WORKERS = int(os.getenv('MEETING_WORKERS', 4))  # 同時に会議作成を行うスレッド数
+    MEETING_QUEUE_SIZE = int(os.getenv('MEETING_QUEUE_SIZE', 20))  # 待機できる会議作成ジョブ数
+    MEETING_RETRY_DELAY = float(os.getenv('MEETING_RETRY_DELAY', 10))  # 混雑時の再投入までの秒数
+    MEETING_MAX_RETRIES = int(os.getenv('MEETING_MAX_RETRIES', 3))  # 混雑時の再投入回数上限
+    SPECULATIVE_PROVISIONING = os.getenv('SPECULATIVE_PROVISIONING', 'True').lower() == 'true'  # Zoom とカレンダーを並列に作成
+    MEETING_JOB_DEADLINE = float(os.getenv('MEETING_JOB_DEADLINE', 60))  # 会議作成1件の全体期限（秒）。超えた外部呼び出しは行わない
+    
+    # Webhook 受信（署名検証後すぐに200を返し、イベントはディスパッチャーで処理）
+    WEBHOOK_ASYNC_DISPATCH = os.getenv('WEBHOOK_ASYNC_DISPATCH', 'True').lower() == 'true'
+    WEBHOOK_WORKERS = int(os.getenv('WEBHOOK_WORKERS', 4))  # イベント処理スレッド数（ユーザー毎のシャード数）
+    WEBHOOK_QUEUE_SIZE = int(os.getenv('WEBHOOK_QUEUE_SIZE', 50))  # シャード毎の処理待ちイベント数の上限
+    WEBHOOK_DEDUP_WINDOW = float(os.getenv('WEBHOOK_DEDUP_WINDOW', 3600))  # 再送イベントを重複とみなす期間（秒）
+    WEBHOOK_DEDUP_MAX_ENTRIES = int(os.getenv('WEBHOOK_DEDUP_MAX_ENTRIES', 10000))  # 記録しておく webhookEventId の上限
+    
+    # 外部API呼び出し（Zoom / Google / LINE 共通のサーキットブレーカー）
+    CIRCUIT_FAILURE_THRESHOLD = int(os.getenv('CIRCUIT_FAILURE_THRESHOLD', 5))  # 連続失敗でブレーカーを開く回数
+    CIRCUIT_RESET_TIMEOUT = float(os.getenv('CIRCUIT_RESET_TIMEOUT', 30))  # 開いてから試行を再開するまでの秒数
+    
+    # ヘルスチェック（バックグラウンドで定期実行し、/health と /test/all は最新結果を返す）
+    HEALTH_DB_INTERVAL = float(os.getenv('HEALTH_DB_INTERVAL', 15))  # データベース確認の間隔（秒）
+    HEALTH_API_INTERVAL = float(os.getenv('HEALTH_API_INTERVAL', 300))  # Zoom / Google API 確認の間隔（秒）
+    HEALTH_PROBE_TIMEOUT = float(os.getenv('HEALTH_PROBE_TIMEOUT', 10))  # 1件の確認を待つ上限（秒）
     
     # アプリケーション設定
     DEBUG = os.getenv('DEBUG', 'False').lower() == 'true'
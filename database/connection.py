@@ -0,0 +1,180 @@
+import sqlite3
+import threading
+import time
+import logging
+from contextlib import contextmanager
+from typing import Dict, Any, Callable, Iterator, List, Optional, Sequence
+from config import Config
+
+logger = logging.getLogger(__name__)
+
+class ConnectionManager:
+    """SQLite 接続マネージャー（スレッド毎の接続を再利用）"""
+
+    def __init__(self, database: str, busy_timeout_ms: int = 5000,
+                 cached_statements: int = 128, max_busy_retries: int = 3):
+        self.database = database
+        self.busy_timeout_ms = busy_timeout_ms
+        self.cached_statements = cached_statements
+        self.max_busy_retries = max_busy_retries
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        # スレッドID -> 接続（統計と終了済みスレッドの接続回収用）
+        self._connections: Dict[int, sqlite3.Connection] = {}
+        self._journal_mode: Optional[str] = None
+        self._stats = {
+            'connections_opened': 0,
+            'connections_closed': 0,
+            'checkouts': 0,
+            'reuses': 0,
+            'busy_retries': 0
+        }
+
+    def get_connection(self) -> sqlite3.Connection:
+        """現在のスレッド用の接続取得（呼び出し側で close しないこと）"""
+        conn = getattr(self._local, 'conn', None)
+        with self._lock:
+            self._stats['checkouts'] += 1
+            if conn is not None:
+                self._stats['reuses'] += 1
+                return conn
+
+        conn = self._open()
+        self._local.conn = conn
+        return conn
+
+    def _open(self) -> sqlite3.Connection:
+        """新しい接続を開いて PRAGMA を設定"""
+        try:
+            conn = sqlite3.connect(
+                self.database,
+                timeout=self.busy_timeout_ms / 1000,
+                cached_statements=self.cached_statements,
+                check_same_thread=False  # 終了済みスレッドの接続を別スレッドから閉じるため
+            )
+            journal_mode = conn.execute('PRAGMA journal_mode=WAL').fetchone()[0]
+            conn.execute(f'PRAGMA busy_timeout={int(self.busy_timeout_ms)}')
+            conn.execute('PRAGMA synchronous=NORMAL')
+
+            with self._lock:
+                self._reap_dead_threads()
+                # スレッドIDは再利用されるため、前のスレッドの接続が残っていれば閉じる
+                stale = self._connections.pop(threading.get_ident(), None)
+                if stale is not None:
+                    stale.close()
+                    self._stats['connections_closed'] += 1
+                self._connections[threading.get_ident()] = conn
+                self._stats['connections_opened'] += 1
+                self._journal_mode = journal_mode
+
+            logger.info(f"データベース接続作成: {self.database} (journal_mode={journal_mode})")
+            return conn
+
+        except Exception as e:
+            logger.error(f"データベース接続エラー: {str(e)}")
+            raise
+
+    def _reap_dead_threads(self):
+        """終了したスレッドの接続を閉じる（ロック取得済みで呼ぶこと）"""
+        alive = {t.ident for t in threading.enumerate()}
+        for ident in [i for i in self._connections if i not in alive]:
+            try:
+                self._connections.pop(ident).close()
+                self._stats['connections_closed'] += 1
+            except Exception as e:
+                logger.error(f"データベース接続クローズエラー: {str(e)}")
+
+    def _run_with_retry(self, func):
+        """database is locked 発生時にバックオフ付きで再試行"""
+        for attempt in range(self.max_busy_retries + 1):
+            try:
+                return func()
+            except sqlite3.OperationalError as e:
+                if 'locked' not in str(e) and 'busy' not in str(e):
+                    raise
+                if attempt >= self.max_busy_retries:
+                    raise
+                with self._lock:
+                    self._stats['busy_retries'] += 1
+                logger.warning(f"データベースビジー、再試行します ({attempt + 1}/{self.max_busy_retries})")
+                time.sleep(0.05 * (2 ** attempt))
+
+    @contextmanager
+    def transaction(self):
+        """トランザクション（正常終了でコミット、例外でロールバック）"""
+        conn = self.get_connection()
+        try:
+            yield conn
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+
+    def run_transaction(self, func: Callable[[sqlite3.Connection], Any]) -> Any:
+        """関数をトランザクション内で実行（ビジー時は再試行）"""
+        def _run():
+            with self.transaction() as conn:
+                return func(conn)
+        return self._run_with_retry(_run)
+
+    def execute_write(self, sql: str, params: Sequence[Any] = ()) -> int:
+        """書き込みクエリ実行（lastrowid を返す）"""
+        return self.run_transaction(lambda conn: conn.execute(sql, params).lastrowid)
+
+    def query_all(self, sql: str, params: Sequence[Any] = ()) -> List[tuple]:
+        """読み込みクエリ実行（全件）"""
+        return self._run_with_retry(lambda: self.get_connection().execute(sql, params).fetchall())
+
+    def query_one(self, sql: str, params: Sequence[Any] = ()) -> Optional[tuple]:
+        """読み込みクエリ実行（1件）"""
+        return self._run_with_retry(lambda: self.get_connection().execute(sql, params).fetchone())
+
+    def iter_query(self, sql: str, params: Sequence[Any] = (), batch_size: int = 100) -> Iterator[tuple]:
+        """読み込みクエリ実行（batch_size 件ずつ取り出して1行ずつ返す）"""
+        cursor = self._run_with_retry(lambda: self.get_connection().execute(sql, params))
+        try:
+            while True:
+                rows = cursor.fetchmany(batch_size)
+                if not rows:
+                    break
+                yield from rows
+        finally:
+            cursor.close()
+
+    def ping(self) -> bool:
+        """接続確認"""
+        return self.query_one('SELECT 1') == (1,)
+
+    def close_all(self):
+        """全スレッドの接続を閉じる"""
+        with self._lock:
+            for conn in self._connections.values():
+                try:
+                    conn.close()
+                    self._stats['connections_closed'] += 1
+                except Exception as e:
+                    logger.error(f"データベース接続クローズエラー: {str(e)}")
+            self._connections.clear()
+        self._local = threading.local()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """接続プール統計取得"""
+        with self._lock:
+            stats = dict(self._stats)
+            stats['active_connections'] = len(self._connections)
+        stats['database'] = self.database
+        stats['journal_mode'] = self._journal_mode
+        stats['busy_timeout_ms'] = self.busy_timeout_ms
+        stats['cached_statements'] = self.cached_statements
+        return stats
+
+# グローバルインスタンス
+connection_manager = ConnectionManager(
+    Config.DATABASE_URL,
+    busy_timeout_ms=Config.DB_BUSY_TIMEOUT_MS,
+    cached_statements=Config.DB_CACHED_STATEMENTS
+)
+
+def get_db_stats() -> Dict[str, Any]:
+    """データベース接続統計取得（外部呼び出し用）"""
+    return connection_manager.get_stats()
@@ -1,46 +1,15 @@
-import sqlite3
-import os
 import logging
+from database.connection import connection_manager
+from database.migrations import migrate
 
 logger = logging.getLogger(__name__)
 
 def init_database():
-    """データベース初期化"""
+    """データベース初期化（未適用のマイグレーションを適用）"""
     try:
-        conn = sqlite3.connect('meetings.db')
-        cursor = conn.cursor()
+        version = migrate(connection_manager)
         
-        # meetings テーブル作成
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS meetings (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                line_user_id TEXT NOT NULL,
-                meeting_id TEXT NOT NULL,
-                meeting_password TEXT,
-                meeting_url TEXT,
-                meeting_name TEXT NOT NULL,
-                start_time DATETIME NOT NULL,
-                duration INTEGER NOT NULL,
-                created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
-                google_event_id TEXT
-            )
-        ''')
-        
-        # インデックス作成
-        cursor.execute('''
-            CREATE INDEX IF NOT EXISTS idx_line_user_id 
-            ON meetings(line_user_id)
-        ''')
-        
-        cursor.execute('''
-            CREATE INDEX IF NOT EXISTS idx_start_time 
-            ON meetings(start_time)
-        ''')
-        
-        conn.commit()
-        conn.close()
-        
-        logger.info("データベース初期化完了")
+        logger.info(f"データベース初期化完了 (スキーマバージョン: {version})")
         print("✅ データベース初期化完了")
         
     except Exception as e:
@@ -49,8 +18,8 @@ def init_database():
         raise
 
 def get_connection():
-    """データベース接続取得"""
-    return sqlite3.connect('meetings.db')
+    """データベース接続取得（スレッド毎に共有される接続のため close しないこと）"""
+    return connection_manager.get_connection()
 
 if __name__ == "__main__":
     init_database()
@@ -0,0 +1,75 @@
+import sqlite3
+import logging
+from typing import Callable, List, Tuple
+from database.connection import ConnectionManager
+
+logger = logging.getLogger(__name__)
+
+def _create_meetings_table(conn: sqlite3.Connection):
+    """meetings テーブル作成（バージョン管理導入前に作成済みの DB でもそのまま通る）"""
+    conn.execute('''
+        CREATE TABLE IF NOT EXISTS meetings (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            line_user_id TEXT NOT NULL,
+            meeting_id TEXT NOT NULL,
+            meeting_password TEXT,
+            meeting_url TEXT,
+            meeting_name TEXT NOT NULL,
+            start_time DATETIME NOT NULL,
+            duration INTEGER NOT NULL,
+            created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+            google_event_id TEXT
+        )
+    ''')
+    conn.execute('CREATE INDEX IF NOT EXISTS idx_line_user_id ON meetings(line_user_id)')
+    conn.execute('CREATE INDEX IF NOT EXISTS idx_start_time ON meetings(start_time)')
+
+def _add_user_start_time_index(conn: sqlite3.Connection):
+    """ユーザー毎の会議一覧（開始日時順）用の複合インデックス
+
+    line_user_id 単独のインデックスは先頭列が同じなので削除する
+    """
+    conn.execute('CREATE INDEX IF NOT EXISTS idx_line_user_id_start_time ON meetings(line_user_id, start_time)')
+    conn.execute('DROP INDEX IF EXISTS idx_line_user_id')
+
+def _add_meeting_id_index(conn: sqlite3.Connection):
+    """会議IDでの検索用インデックス"""
+    conn.execute('CREATE INDEX IF NOT EXISTS idx_meeting_id ON meetings(meeting_id)')
+
+def _add_user_created_at_index(conn: sqlite3.Connection):
+    """会議一覧のバージョン（最後に追加した会議の ID・作成日時）をインデックスだけで求めるための複合インデックス"""
+    conn.execute('CREATE INDEX IF NOT EXISTS idx_line_user_id_created_at ON meetings(line_user_id, created_at)')
+
+# (バージョン, 説明, 適用関数)。追加のみ行い、既存のものは変更しないこと
+MIGRATIONS: List[Tuple[int, str, Callable[[sqlite3.Connection], None]]] = [
+    (1, 'meetings テーブル作成', _create_meetings_table),
+    (2, '(line_user_id, start_time) インデックス追加', _add_user_start_time_index),
+    (3, 'meeting_id インデックス追加', _add_meeting_id_index),
+    (4, '(line_user_id, created_at) インデックス追加', _add_user_created_at_index),
+]
+
+LATEST_VERSION = MIGRATIONS[-1][0]
+
+def get_version(manager: ConnectionManager) -> int:
+    """現在のスキーマバージョン取得"""
+    return manager.query_one('PRAGMA user_version')[0]
+
+def migrate(manager: ConnectionManager) -> int:
+    """未適用のマイグレーションを順に適用（適用後のバージョンを返す）
+
+    1件毎に書き込みロックを取ってからバージョンを確認するため、
+    複数プロセスが同時に起動しても同じマイグレーションが二重に適用されることはない
+    """
+    for version, description, apply in MIGRATIONS:
+        def _apply(conn: sqlite3.Connection) -> bool:
+            conn.execute('BEGIN IMMEDIATE')
+            if conn.execute('PRAGMA user_version').fetchone()[0] >= version:
+                return False
+            apply(conn)
+            conn.execute(f'PRAGMA user_version = {int(version)}')
+            return True
+
+        if manager.run_transaction(_apply):
+            logger.info(f"マイグレーション適用: v{version} {description}")
+
+    return get_version(manager)
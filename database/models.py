@@ -1,10 +1,96 @@
-import sqlite3
+import base64
+import json
+from collections.abc import Mapping
 from datetime import datetime
-from typing import Optional, List, Dict, Any
+from typing import Optional, Dict, Any, Iterator, Tuple
 import logging
+from config import Config
+from database.connection import connection_manager
+from utils.cache import LRUCache
 
 logger = logging.getLogger(__name__)
 
+# meetings テーブルの列（キャッシュするタプルの並び順）
+MEETING_COLUMNS = (
+    'id', 'line_user_id', 'meeting_id', 'meeting_password', 'meeting_url',
+    'meeting_name', 'start_time', 'duration', 'created_at', 'google_event_id'
+)
+
+# 会議一覧で返す列（line_user_id はリクエストで指定済みのため含めない）
+LIST_COLUMNS = (
+    'id', 'meeting_id', 'meeting_password', 'meeting_url', 'meeting_name',
+    'start_time', 'duration', 'created_at', 'google_event_id'
+)
+
+# models のクエリ（tests/test_migrations.py で実行計画を検証する）
+INSERT_MEETING_SQL = '''
+    INSERT INTO meetings (
+        line_user_id, meeting_id, meeting_password, meeting_url,
+        meeting_name, start_time, duration, google_event_id
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+'''
+SELECT_PAGE_BY_USER_ID_SQL = f'''
+    SELECT {', '.join(LIST_COLUMNS)} FROM meetings
+    WHERE line_user_id = ?
+    ORDER BY start_time DESC, id DESC LIMIT ?
+'''
+SELECT_PAGE_BY_USER_ID_AFTER_SQL = f'''
+    SELECT {', '.join(LIST_COLUMNS)} FROM meetings
+    WHERE line_user_id = ? AND (start_time, id) < (?, ?)
+    ORDER BY start_time DESC, id DESC LIMIT ?
+'''
+# 会議は追加のみ（更新・削除しない）なので、最後に追加された1件が変われば一覧も変わっている
+SELECT_LIST_VERSION_SQL = '''
+    SELECT id, created_at FROM meetings
+    WHERE line_user_id = ?
+    ORDER BY created_at DESC, id DESC LIMIT 1
+'''
+SELECT_BY_MEETING_ID_SQL = f'''
+    SELECT {', '.join(MEETING_COLUMNS)} FROM meetings WHERE meeting_id = ?
+'''
+
+# 読み込み結果のキャッシュ（('user', line_user_id) は一覧のバージョン、('meeting', meeting_id) は行のタプル）
+meeting_cache = LRUCache('meetings', max_entries=Config.MEETING_CACHE_SIZE, ttl=Config.MEETING_CACHE_TTL)
+
+def _meeting_cache_key(kind: str, value: Any) -> Tuple[str, Optional[str]]:
+    """キャッシュキー（Zoom の会議IDは int で渡されることがあるため文字列に揃える）"""
+    return (kind, str(value) if value is not None else None)
+
+# 列名 -> タプル内の位置
+_MEETING_COLUMN_INDEX = {column: i for i, column in enumerate(MEETING_COLUMNS)}
+
+class MeetingRow(Mapping):
+    """キャッシュしている行（タプル）を列名で読む読み取り専用のビュー（行毎に辞書を作らない）"""
+
+    __slots__ = ('_row',)
+
+    def __init__(self, row: tuple):
+        self._row = row
+
+    def __getitem__(self, column: str) -> Any:
+        return self._row[_MEETING_COLUMN_INDEX[column]]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(MEETING_COLUMNS)
+
+    def __len__(self) -> int:
+        return len(MEETING_COLUMNS)
+
+    def __repr__(self) -> str:
+        return f"MeetingRow({dict(self)!r})"
+
+def encode_page_cursor(start_time: str, row_id: int) -> str:
+    """次ページの位置（開始日時, ID）を URL に載せられる文字列に変換"""
+    return base64.urlsafe_b64encode(json.dumps([start_time, row_id]).encode('utf-8')).decode('ascii')
+
+def decode_page_cursor(cursor: str) -> Tuple[str, int]:
+    """encode_page_cursor の逆変換（不正な値は ValueError）"""
+    try:
+        start_time, row_id = json.loads(base64.urlsafe_b64decode(cursor.encode('ascii')))
+        return str(start_time), int(row_id)
+    except Exception:
+        raise ValueError(f"不正なカーソルです: {cursor}")
+
 class Meeting:
     """会議モデル"""
     
@@ -22,23 +108,13 @@ class Meeting:
     def save(self) -> int:
         """会議情報をデータベースに保存"""
         try:
-            conn = sqlite3.connect('meetings.db')
-            cursor = conn.cursor()
-            
-            cursor.execute('''
-                INSERT INTO meetings (
-                    line_user_id, meeting_id, meeting_password, meeting_url,
-                    meeting_name, start_time, duration, google_event_id
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-            ''', (
+            meeting_db_id = connection_manager.execute_write(INSERT_MEETING_SQL, (
                 self.line_user_id, self.meeting_id, self.meeting_password,
                 self.meeting_url, self.meeting_name, self.start_time,
                 self.duration, self.google_event_id
             ))
             
-            meeting_db_id = cursor.lastrowid
-            conn.commit()
-            conn.close()
+            self.invalidate_cache(self.line_user_id, self.meeting_id)
             
             logger.info(f"会議保存完了: ID {meeting_db_id}")
             return meeting_db_id
@@ -48,69 +124,44 @@ class Meeting:
             raise
     
     @classmethod
-    def get_by_user_id(cls, line_user_id: str) -> List[Dict[str, Any]]:
-        """ユーザーの会議一覧取得"""
-        try:
-            conn = sqlite3.connect('meetings.db')
-            cursor = conn.cursor()
-            
-            cursor.execute('''
-                SELECT * FROM meetings 
-                WHERE line_user_id = ? 
-                ORDER BY start_time DESC
-            ''', (line_user_id,))
-            
-            meetings = []
-            for row in cursor.fetchall():
-                meeting = {
-                    'id': row[0],
-                    'line_user_id': row[1],
-                    'meeting_id': row[2],
-                    'meeting_password': row[3],
-                    'meeting_url': row[4],
-                    'meeting_name': row[5],
-                    'start_time': row[6],
-                    'duration': row[7],
-                    'created_at': row[8],
-                    'google_event_id': row[9]
-                }
-                meetings.append(meeting)
-            
-            conn.close()
-            return meetings
-            
-        except Exception as e:
-            logger.error(f"会議取得エラー: {str(e)}")
-            raise
+    def invalidate_cache(cls, line_user_id: Optional[str] = None, meeting_id: Optional[str] = None):
+        """読み込みキャッシュの無効化（会議の追加・更新・削除時に呼ぶこと）"""
+        meeting_cache.invalidate(_meeting_cache_key('user', line_user_id), _meeting_cache_key('meeting', meeting_id))
     
     @classmethod
-    def get_by_meeting_id(cls, meeting_id: str) -> Optional[Dict[str, Any]]:
+    def iter_by_user_id(cls, line_user_id: str, limit: int,
+                        after: Optional[Tuple[str, int]] = None) -> Iterator[Dict[str, Any]]:
+        """ユーザーの会議を開始日時の降順で limit 件まで順に取得（after は前ページ最後の (開始日時, ID)）"""
+        if after is None:
+            sql, params = SELECT_PAGE_BY_USER_ID_SQL, (line_user_id, limit)
+        else:
+            sql, params = SELECT_PAGE_BY_USER_ID_AFTER_SQL, (line_user_id, after[0], after[1], limit)
+        
+        for row in connection_manager.iter_query(sql, params):
+            yield dict(zip(LIST_COLUMNS, row))
+    
+    @classmethod
+    def get_list_version(cls, line_user_id: str) -> Tuple[Optional[int], Optional[str]]:
+        """ユーザーの会議一覧のバージョン（最後に追加した会議の ID, 作成日時）取得
+
+        インデックスの末尾1件を読むだけなので会議の件数によらない。結果はキャッシュし、save で無効化する
+        """
+        def _load():
+            row = connection_manager.query_one(SELECT_LIST_VERSION_SQL, (line_user_id,))
+            return (row[0], row[1]) if row else (None, None)
+        
+        return meeting_cache.get_or_load(_meeting_cache_key('user', line_user_id), _load)
+    
+    @classmethod
+    def get_by_meeting_id(cls, meeting_id: str) -> Optional[MeetingRow]:
         """会議IDで会議情報取得"""
         try:
-            conn = sqlite3.connect('meetings.db')
-            cursor = conn.cursor()
-            
-            cursor.execute('''
-                SELECT * FROM meetings WHERE meeting_id = ?
-            ''', (meeting_id,))
-            
-            row = cursor.fetchone()
-            conn.close()
+            def _load():
+                row = connection_manager.query_one(SELECT_BY_MEETING_ID_SQL, (str(meeting_id),))
+                return tuple(row) if row else None
             
-            if row:
-                return {
-                    'id': row[0],
-                    'line_user_id': row[1],
-                    'meeting_id': row[2],
-                    'meeting_password': row[3],
-                    'meeting_url': row[4],
-                    'meeting_name': row[5],
-                    'start_time': row[6],
-                    'duration': row[7],
-                    'created_at': row[8],
-                    'google_event_id': row[9]
-                }
-            return None
+            row = meeting_cache.get_or_load(_meeting_cache_key('meeting', meeting_id), _load)
+            return MeetingRow(row) if row else None
             
         except Exception as e:
             logger.error(f"会議取得エラー: {str(e)}")
@@ -1,21 +1,116 @@
 import json
 import os
+import queue
+import threading
+import time
+from contextlib import contextmanager
 from datetime import datetime, timedelta
+import httplib2
+import google_auth_httplib2
 from google.oauth2 import service_account
-from googleapiclient.discovery import build
+from googleapiclient.discovery import build_from_document
 from googleapiclient.errors import HttpError
 from config import Config
 import logging
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional, Tuple
+from utils.credential_store import credential_store
+from utils.outbound import google_breaker, cap_timeout, check_deadline
 
 logger = logging.getLogger(__name__)
 
+# 残り有効期間がこれを下回ったらトークンを更新（秒）
+TOKEN_MIN_TTL = 300
+
+# Calendar API のバッチリクエスト1回あたりの上限件数
+BATCH_SIZE = 50
+
+# 説明文の組み立てに使うフィールド（PATCH では全て揃えて渡す。欠けたものは空欄で上書きされるため）
+DESCRIPTION_FIELDS = ('meeting_url', 'meeting_id', 'meeting_password', 'memo')
+
+# パッケージ同梱の Discovery ドキュメント（初回に一度だけパースして使い回す）
+_discovery_document: Optional[Dict[str, Any]] = None
+_discovery_lock = threading.Lock()
+
+def get_discovery_document() -> Dict[str, Any]:
+    """Calendar v3 の Discovery ドキュメント取得（ネットワークには取りに行かない）"""
+    global _discovery_document
+    if _discovery_document is None:
+        with _discovery_lock:
+            if _discovery_document is None:
+                from googleapiclient import discovery_cache
+                
+                document = discovery_cache.get_static_doc('calendar', 'v3')
+                if document is None:
+                    raise Exception("Calendar v3 の静的 Discovery ドキュメントが見つかりません")
+                _discovery_document = json.loads(document)
+    return _discovery_document
+
+class TransportPool:
+    """認可済み httplib2 トランスポートのプール（httplib2.Http はスレッドセーフでないため呼び出し毎に貸し出す）"""
+    
+    def __init__(self, credentials, max_size: int = 4, timeout: float = 30):
+        self.credentials = credentials
+        self.max_size = max_size
+        self.timeout = timeout
+        self._idle: queue.LifoQueue = queue.LifoQueue()
+        self._lock = threading.Lock()
+        self._created = 0
+        self._stats = {
+            'checkouts': 0,
+            'waits': 0
+        }
+    
+    def _create(self) -> google_auth_httplib2.AuthorizedHttp:
+        """新しいトランスポート作成（接続は Keep-Alive で再利用される）"""
+        return google_auth_httplib2.AuthorizedHttp(self.credentials, http=httplib2.Http(timeout=self.timeout))
+    
+    @contextmanager
+    def checkout(self):
+        """トランスポートを貸し出す（全て使用中なら返却を最大 timeout 秒待つ）"""
+        try:
+            http = self._idle.get_nowait()
+        except queue.Empty:
+            http = None
+            with self._lock:
+                if self._created < self.max_size:
+                    self._created += 1
+                    http = self._create()
+            if http is None:
+                with self._lock:
+                    self._stats['waits'] += 1
+                try:
+                    http = self._idle.get(timeout=cap_timeout(self.timeout))
+                except queue.Empty:
+                    raise Exception("Google Calendar トランスポートの空き待ちがタイムアウトしました")
+        
+        with self._lock:
+            self._stats['checkouts'] += 1
+        try:
+            yield http
+        finally:
+            self._idle.put(http)
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """プール統計取得"""
+        with self._lock:
+            stats = dict(self._stats)
+            stats['created'] = self._created
+        stats['idle'] = self._idle.qsize()
+        stats['in_use'] = stats['created'] - stats['idle']
+        stats['max_size'] = self.max_size
+        return stats
+
 class GoogleCalendarAPI:
     """Google Calendar API クライアント"""
     
     def __init__(self):
         self.credentials_json = Config.GOOGLE_CREDENTIALS_JSON
+        self.credentials = None
         self.service = None
+        self.transport_pool: Optional[TransportPool] = None
+        # events() / calendarList() は呼ぶたびにメソッドを組み立て直すため初回に作って保持する
+        self._resources: Dict[str, Any] = {}
+        self._lock = threading.Lock()
         # カレンダーIDの決定（環境変数→Config→primary）。前後空白は取り除く
         # 正式名が無い場合、誤綴り GOOGLE_CALENDER_ID も見る
         env_calendar_id = os.getenv('GOOGLE_CALENDAR_ID') or os.getenv('GOOGLE_CALENDER_ID')
@@ -28,75 +123,111 @@ class GoogleCalendarAPI:
         """Google Calendar サービス取得"""
         try:
             if self.service is None:
-                credentials_info = json.loads(self.credentials_json)
-                credentials = service_account.Credentials.from_service_account_info(
-                    credentials_info,
-                    scopes=['https://www.googleapis.com/auth/calendar']
-                )
-                self.service = build('calendar', 'v3', credentials=credentials)
+                with self._lock:
+                    if self.service is None:
+                        credentials_info = json.loads(self.credentials_json)
+                        self.credentials = service_account.Credentials.from_service_account_info(
+                            credentials_info,
+                            scopes=['https://www.googleapis.com/auth/calendar']
+                        )
+                        self.service = build_from_document(get_discovery_document(), credentials=self.credentials)
+                        self.transport_pool = TransportPool(
+                            self.credentials,
+                            max_size=Config.GOOGLE_HTTP_POOL_SIZE,
+                            timeout=Config.GOOGLE_TIMEOUT
+                        )
             
+            self._ensure_token()
             return self.service
         except Exception as e:
             logger.error(f"Google Calendar サービス取得エラー: {str(e)}")
             raise
     
+    def _resource(self, name: str):
+        """リソース（events / calendarList）取得"""
+        service = self.get_service()
+        resource = self._resources.get(name)
+        if resource is None:
+            resource = getattr(service, name)()
+            self._resources[name] = resource
+        return resource
+    
+    def _execute(self, request):
+        """リクエスト実行（プールから借りたトランスポートを使用）"""
+        self.get_service()
+        check_deadline('google_calendar')
+        with self.transport_pool.checkout() as http, google_breaker.guard():
+            return request.execute(http=http)
+    
+    def get_transport_stats(self) -> Dict[str, Any]:
+        """トランスポートプール統計取得"""
+        if self.transport_pool is None:
+            return {'created': 0, 'max_size': Config.GOOGLE_HTTP_POOL_SIZE}
+        return self.transport_pool.get_stats()
+    
+    def warm_up(self):
+        """起動時にサービスとリソースを組み立てておく（初回リクエストの遅延を避ける）"""
+        def _warm_up():
+            try:
+                start_time = time.time()
+                self._resource('events')
+                self._resource('calendarList')
+                logger.info(f"Google Calendar クライアント準備完了 ({time.time() - start_time:.2f}秒)")
+            except Exception as e:
+                logger.error(f"Google Calendar クライアント準備エラー: {str(e)}")
+        
+        threading.Thread(target=_warm_up, name='google-calendar-warm-up', daemon=True).start()
+    
+    def _ensure_token(self):
+        """アクセストークンを認証情報ストアと同期（期限が近い場合のみ）"""
+        credentials = self.credentials
+        if credentials.token and credentials.expiry and credentials.expiry - datetime.utcnow() > timedelta(seconds=TOKEN_MIN_TTL):
+            return
+        
+        token, expires_in = credential_store.get_or_refresh('google', self._refresh_token, min_ttl=TOKEN_MIN_TTL)
+        credentials.token = token
+        credentials.expiry = datetime.utcnow() + timedelta(seconds=expires_in)
+    
+    def _refresh_token(self) -> Tuple[str, float]:
+        """サービスアカウントのアクセストークン発行（CredentialStore から呼ばれる）"""
+        from google.auth.transport.requests import Request
+        
+        request = Request()
+        
+        def _request_with_timeout(*args, **kwargs):
+            # google-auth の既定タイムアウト（120秒）ではなく設定値を使う
+            kwargs['timeout'] = cap_timeout(Config.GOOGLE_TIMEOUT)
+            return request(*args, **kwargs)
+        
+        check_deadline('google_calendar')
+        with google_breaker.guard(Config.GOOGLE_TIMEOUT):
+            self.credentials.refresh(_request_with_timeout)
+        return self.credentials.token, (self.credentials.expiry - datetime.utcnow()).total_seconds()
+    
     def create_event(self, event_data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         """カレンダーイベント作成"""
         try:
-            service = self.get_service()
+            events = self._resource('events')
             logger.info(f"Google Calendar サービス取得成功")
             
             # イベントデータ構築
-            event = {
-                'summary': event_data['meeting_name'],
-                'description': self._build_event_description(event_data),
-                'start': {
-                    'dateTime': event_data['start_time'].isoformat(),
-                    'timeZone': 'Asia/Tokyo',
-                },
-                'end': {
-                    'dateTime': (event_data['start_time'] + timedelta(minutes=event_data['duration'])).isoformat(),
-                    'timeZone': 'Asia/Tokyo',
-                },
-                'location': event_data.get('meeting_url', ''),
-                'attendees': event_data.get('attendees', []),
-                'reminders': {
-                    'useDefault': False,
-                    'overrides': [
-                        {'method': 'email', 'minutes': 24 * 60},  # 1日前
-                        {'method': 'popup', 'minutes': 10},       # 10分前
-                    ],
-                },
-            }
+            event = self._build_event_body(event_data)
+            effective_calendar_id = self._resolve_calendar_id()
             
-            # 直近の環境値を再評価（再デプロイ前のインスタンス化タイミング差異に対応）
-            runtime_env_id = os.getenv('GOOGLE_CALENDAR_ID') or os.getenv('GOOGLE_CALENDER_ID')
-            runtime_cfg_id = getattr(Config, 'GOOGLE_CALENDAR_ID', None)
-            effective_calendar_id = (runtime_env_id or runtime_cfg_id or self.calendar_id)
-            if isinstance(effective_calendar_id, str):
-                effective_calendar_id = effective_calendar_id.strip()
-
             logger.info(f"Google Calendar イベント作成開始: {event_data['meeting_name']}")
             logger.info(f"カレンダーID: {effective_calendar_id}")
             logger.info(f"イベントデータ: {event}")
             
             # イベント作成
-            created_event = service.events().insert(
+            created_event = self._execute(events.insert(
                 calendarId=effective_calendar_id,
                 body=event,
                 sendUpdates='none'  # 参加者に通知しない
-            ).execute()
+            ))
             
             logger.info(f"Google Calendar イベント作成成功: {created_event.get('id')}")
             
-            return {
-                'event_id': created_event.get('id'),
-                'event_url': created_event.get('htmlLink'),
-                'meeting_url': created_event.get('conferenceData', {}).get('entryPoints', [{}])[0].get('uri', ''),
-                'summary': created_event.get('summary'),
-                'start_time': created_event.get('start', {}).get('dateTime'),
-                'end_time': created_event.get('end', {}).get('dateTime')
-            }
+            return self._format_created_event(created_event)
             
         except HttpError as e:
             logger.error(f"Google Calendar API エラー: {str(e)}")
@@ -105,15 +236,59 @@ class GoogleCalendarAPI:
             logger.error(f"Google Calendar イベント作成エラー: {str(e)}")
             raise
     
+    def _build_event_body(self, event_data: Dict[str, Any]) -> Dict[str, Any]:
+        """イベント本文構築"""
+        return {
+            'summary': event_data['meeting_name'],
+            'description': self._build_event_description(event_data),
+            'start': {
+                'dateTime': event_data['start_time'].isoformat(),
+                'timeZone': 'Asia/Tokyo',
+            },
+            'end': {
+                'dateTime': (event_data['start_time'] + timedelta(minutes=event_data['duration'])).isoformat(),
+                'timeZone': 'Asia/Tokyo',
+            },
+            'location': event_data.get('meeting_url', ''),
+            'attendees': event_data.get('attendees', []),
+            'reminders': {
+                'useDefault': False,
+                'overrides': [
+                    {'method': 'email', 'minutes': 24 * 60},  # 1日前
+                    {'method': 'popup', 'minutes': 10},       # 10分前
+                ],
+            },
+        }
+    
+    def _resolve_calendar_id(self) -> str:
+        """作成先カレンダーID取得"""
+        # 直近の環境値を再評価（再デプロイ前のインスタンス化タイミング差異に対応）
+        runtime_env_id = os.getenv('GOOGLE_CALENDAR_ID') or os.getenv('GOOGLE_CALENDER_ID')
+        runtime_cfg_id = getattr(Config, 'GOOGLE_CALENDAR_ID', None)
+        effective_calendar_id = (runtime_env_id or runtime_cfg_id or self.calendar_id)
+        if isinstance(effective_calendar_id, str):
+            effective_calendar_id = effective_calendar_id.strip()
+        return effective_calendar_id
+    
+    def _format_created_event(self, created_event: Dict[str, Any]) -> Dict[str, Any]:
+        """作成済みイベントを呼び出し元向けの形式に変換"""
+        return {
+            'event_id': created_event.get('id'),
+            'etag': created_event.get('etag'),
+            'event_url': created_event.get('htmlLink'),
+            'meeting_url': created_event.get('conferenceData', {}).get('entryPoints', [{}])[0].get('uri', ''),
+            'summary': created_event.get('summary'),
+            'start_time': created_event.get('start', {}).get('dateTime'),
+            'end_time': created_event.get('end', {}).get('dateTime')
+        }
+    
     def get_event(self, event_id: str) -> Optional[Dict[str, Any]]:
         """イベント取得"""
         try:
-            service = self.get_service()
-            
-            event = service.events().get(
+            event = self._execute(self._resource('events').get(
                 calendarId=self.calendar_id,
                 eventId=event_id
-            ).execute()
+            ))
             
             return event
             
@@ -124,50 +299,85 @@ class GoogleCalendarAPI:
             logger.error(f"Google Calendar イベント取得エラー: {str(e)}")
             return None
     
-    def update_event(self, event_id: str, event_data: Dict[str, Any]) -> bool:
-        """イベント更新"""
+    def update_event(self, event_id: str, event_data: Dict[str, Any], etag: Optional[str] = None) -> bool:
+        """イベント更新（変更フィールドのみ PATCH、etag 指定時は競合を検出）"""
+        return self.patch_event(event_id, event_data, etag) is not None
+    
+    def patch_event(self, event_id: str, event_data: Dict[str, Any], etag: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """イベント部分更新（1往復で完了。成功時は新しい etag を含む結果を返す）
+
+        更新データが不完全な場合は ValueError（_build_patch_body 参照）
+        """
+        body = self._build_patch_body(event_data)
         try:
-            service = self.get_service()
-            
-            # 既存のイベントを取得
-            existing_event = service.events().get(
-                calendarId=self.calendar_id,
-                eventId=event_id
-            ).execute()
-            
-            # 更新データをマージ
-            existing_event['summary'] = event_data['meeting_name']
-            existing_event['description'] = self._build_event_description(event_data)
-            existing_event['start']['dateTime'] = event_data['start_time'].isoformat()
-            existing_event['end']['dateTime'] = (event_data['start_time'] + timedelta(minutes=event_data['duration'])).isoformat()
-            existing_event['location'] = event_data.get('meeting_url', '')
-            
-            # イベント更新
-            service.events().update(
-                calendarId=self.calendar_id,
-                eventId=event_id,
-                body=existing_event
-            ).execute()
+            request = self._build_patch_request(event_id, body, etag)
+            updated_event = self._execute(request)
             
             logger.info(f"Google Calendar イベント更新成功: {event_id}")
-            return True
+            return {
+                'event_id': updated_event.get('id'),
+                'etag': updated_event.get('etag')
+            }
             
         except HttpError as e:
-            logger.error(f"Google Calendar イベント更新エラー: {str(e)}")
-            return False
+            if e.resp.status == 412:
+                logger.error(f"Google Calendar イベント更新競合（他で更新済み）: {event_id}")
+            else:
+                logger.error(f"Google Calendar イベント更新エラー: {str(e)}")
+            return None
         except Exception as e:
             logger.error(f"Google Calendar イベント更新エラー: {str(e)}")
-            return False
+            return None
+    
+    def _build_patch_request(self, event_id: str, body: Dict[str, Any], etag: Optional[str] = None):
+        """PATCH リクエスト構築（etag があれば If-Match で条件付きにする）"""
+        request = self._resource('events').patch(
+            calendarId=self.calendar_id,
+            eventId=event_id,
+            body=body
+        )
+        if etag:
+            request.headers['If-Match'] = etag
+        return request
+    
+    def _build_patch_body(self, event_data: Dict[str, Any]) -> Dict[str, Any]:
+        """更新データに含まれるフィールドだけの PATCH 本文構築
+
+        開始日時は会議時間と、説明文のフィールドは DESCRIPTION_FIELDS 全てと一緒に指定すること
+        （一部だけでは終了日時・説明文を正しく組み立てられないため ValueError）
+        """
+        if ('start_time' in event_data) != ('duration' in event_data):
+            raise ValueError("開始日時と会議時間は一緒に指定してください")
+        description_fields = [key for key in DESCRIPTION_FIELDS if key in event_data]
+        if description_fields and len(description_fields) != len(DESCRIPTION_FIELDS):
+            missing = ', '.join(key for key in DESCRIPTION_FIELDS if key not in event_data)
+            raise ValueError(f"説明文を更新する場合は全てのフィールドを指定してください（不足: {missing}）")
+        
+        body: Dict[str, Any] = {}
+        if 'meeting_name' in event_data:
+            body['summary'] = event_data['meeting_name']
+        if 'start_time' in event_data:
+            body['start'] = {
+                'dateTime': event_data['start_time'].isoformat(),
+                'timeZone': 'Asia/Tokyo',
+            }
+            body['end'] = {
+                'dateTime': (event_data['start_time'] + timedelta(minutes=event_data['duration'])).isoformat(),
+                'timeZone': 'Asia/Tokyo',
+            }
+        if description_fields:
+            body['description'] = self._build_event_description(event_data)
+        if 'meeting_url' in event_data:
+            body['location'] = event_data['meeting_url']
+        return body
     
     def delete_event(self, event_id: str) -> bool:
         """イベント削除"""
         try:
-            service = self.get_service()
-            
-            service.events().delete(
+            self._execute(self._resource('events').delete(
                 calendarId=self.calendar_id,
                 eventId=event_id
-            ).execute()
+            ))
             
             logger.info(f"Google Calendar イベント削除成功: {event_id}")
             return True
@@ -179,6 +389,112 @@ class GoogleCalendarAPI:
             logger.error(f"Google Calendar イベント削除エラー: {str(e)}")
             return False
     
+    def _execute_batch(self, requests: List[Any]) -> List[Tuple[Optional[Dict[str, Any]], Optional[Exception]]]:
+        """バッチ実行（50件ずつ1回のHTTPリクエストにまとめ、入力順に (レスポンス, 例外) を返す）
+
+        あるまとまりの送信自体が失敗しても、それまでのまとまりの結果はそのまま返し、
+        失敗したまとまりの（結果を受け取っていない）リクエストだけをその例外で失敗扱いにする
+        """
+        service = self.get_service()
+        results: List[Tuple[Optional[Dict[str, Any]], Optional[Exception]]] = [(None, None)] * len(requests)
+        completed = set()
+        
+        def _callback(request_id, response, exception):
+            results[int(request_id)] = (response, exception)
+            completed.add(int(request_id))
+        
+        for offset in range(0, len(requests), BATCH_SIZE):
+            indexes = range(offset, min(offset + BATCH_SIZE, len(requests)))
+            try:
+                batch = service.new_batch_http_request(callback=_callback)
+                for index in indexes:
+                    batch.add(requests[index], request_id=str(index))
+                check_deadline('google_calendar')
+                with self.transport_pool.checkout() as http, google_breaker.guard():
+                    batch.execute(http=http)
+            except Exception as e:
+                logger.error(f"Google Calendar バッチ実行エラー ({offset + 1}〜{indexes[-1] + 1}件目): {str(e)}")
+                for index in indexes:
+                    if index not in completed:
+                        results[index] = (None, e)
+        
+        return results
+    
+    def create_events_bulk(self, event_data_list: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """カレンダーイベント一括作成（結果は入力順）"""
+        try:
+            events = self._resource('events')
+            calendar_id = self._resolve_calendar_id()
+            
+            requests = [
+                events.insert(calendarId=calendar_id, body=self._build_event_body(event_data), sendUpdates='none')
+                for event_data in event_data_list
+            ]
+            
+            results = []
+            for response, exception in self._execute_batch(requests):
+                if exception is not None:
+                    results.append({'success': False, 'error': str(exception)})
+                else:
+                    results.append(dict(self._format_created_event(response), success=True))
+            
+            logger.info(f"Google Calendar イベント一括作成: {sum(r['success'] for r in results)}/{len(results)}件成功")
+            return results
+            
+        except Exception as e:
+            logger.error(f"Google Calendar イベント一括作成エラー: {str(e)}")
+            return [{'success': False, 'error': str(e)} for _ in event_data_list]
+    
+    def update_events_bulk(self, updates: List[Tuple]) -> List[Dict[str, Any]]:
+        """カレンダーイベント一括更新（(イベントID, 更新データ[, etag]) のリスト、結果は入力順）
+
+        更新データが不完全なものがあれば1件も送らずに ValueError
+        """
+        bodies = [self._build_patch_body(update[1]) for update in updates]
+        try:
+            responses = self._execute_batch([
+                self._build_patch_request(update[0], body, update[2] if len(update) > 2 else None)
+                for update, body in zip(updates, bodies)
+            ])
+            
+            results = []
+            for update, (response, exception) in zip(updates, responses):
+                if exception is not None:
+                    results.append({'event_id': update[0], 'success': False, 'error': str(exception)})
+                else:
+                    results.append({'event_id': update[0], 'success': True, 'etag': response.get('etag')})
+            
+            logger.info(f"Google Calendar イベント一括更新: {sum(r['success'] for r in results)}/{len(results)}件成功")
+            return results
+            
+        except Exception as e:
+            logger.error(f"Google Calendar イベント一括更新エラー: {str(e)}")
+            return [{'event_id': update[0], 'success': False, 'error': str(e)} for update in updates]
+    
+    def delete_events_bulk(self, event_ids: List[str]) -> List[Dict[str, Any]]:
+        """カレンダーイベント一括削除（結果は入力順）"""
+        try:
+            events = self._resource('events')
+            
+            responses = self._execute_batch([
+                events.delete(calendarId=self.calendar_id, eventId=event_id)
+                for event_id in event_ids
+            ])
+            
+            results = []
+            for event_id, (_, exception) in zip(event_ids, responses):
+                if exception is not None:
+                    results.append({'event_id': event_id, 'success': False, 'error': str(exception)})
+                else:
+                    results.append({'event_id': event_id, 'success': True})
+            
+            logger.info(f"Google Calendar イベント一括削除: {sum(r['success'] for r in results)}/{len(results)}件成功")
+            return results
+            
+        except Exception as e:
+            logger.error(f"Google Calendar イベント一括削除エラー: {str(e)}")
+            return [{'event_id': event_id, 'success': False, 'error': str(e)} for event_id in event_ids]
+    
     def _build_event_description(self, event_data: Dict[str, Any]) -> str:
         """イベント説明文構築"""
         try:
@@ -202,10 +518,8 @@ Zoom会議
     def test_connection(self) -> bool:
         """接続テスト"""
         try:
-            service = self.get_service()
-            
             # カレンダー一覧取得でテスト
-            calendar_list = service.calendarList().list().execute()
+            calendar_list = self._execute(self._resource('calendarList').list())
             
             logger.info("Google Calendar API 接続テスト成功")
             return True
@@ -217,9 +531,7 @@ Zoom会議
     def get_calendar_list(self) -> list:
         """カレンダー一覧取得"""
         try:
-            service = self.get_service()
-            
-            calendar_list = service.calendarList().list().execute()
+            calendar_list = self._execute(self._resource('calendarList').list())
             
             calendars = []
             for calendar in calendar_list.get('items', []):
@@ -255,10 +567,10 @@ def get_calendar_event(event_id: str) -> Optional[Dict[str, Any]]:
         logger.error(f"Google Calendar イベント取得エラー: {str(e)}")
         return None
 
-def update_calendar_event(event_id: str, event_data: Dict[str, Any]) -> bool:
+def update_calendar_event(event_id: str, event_data: Dict[str, Any], etag: Optional[str] = None) -> bool:
     """カレンダーイベント更新（外部呼び出し用）"""
     try:
-        return google_calendar_api.update_event(event_id, event_data)
+        return google_calendar_api.update_event(event_id, event_data, etag)
     except Exception as e:
         logger.error(f"Google Calendar イベント更新エラー: {str(e)}")
         return False
@@ -271,6 +583,18 @@ def delete_calendar_event(event_id: str) -> bool:
         logger.error(f"Google Calendar イベント削除エラー: {str(e)}")
         return False
 
+def create_calendar_events_bulk(event_data_list: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """カレンダーイベント一括作成（外部呼び出し用）"""
+    return google_calendar_api.create_events_bulk(event_data_list)
+
+def update_calendar_events_bulk(updates: List[Tuple]) -> List[Dict[str, Any]]:
+    """カレンダーイベント一括更新（外部呼び出し用）"""
+    return google_calendar_api.update_events_bulk(updates)
+
+def delete_calendar_events_bulk(event_ids: List[str]) -> List[Dict[str, Any]]:
+    """カレンダーイベント一括削除（外部呼び出し用）"""
+    return google_calendar_api.delete_events_bulk(event_ids)
+
 def test_google_calendar_connection() -> bool:
     """Google Calendar接続テスト（外部呼び出し用）"""
     try:
@@ -1,21 +1,58 @@
 from flask import request, jsonify
-import requests
 import hmac
 import hashlib
 import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from contextlib import contextmanager
 from config import Config
 import logging
-from datetime import datetime
-from typing import Dict, Any
+from datetime import datetime, timedelta
+from urllib.parse import parse_qs, urlencode
+from zoneinfo import ZoneInfo
+from typing import Dict, Any, Optional, Tuple
+from utils.worker_pool import BoundedExecutor, ShardedExecutor
+from utils.dedup import DedupCache
+from utils.outbound import deadline_scope, remaining_time
+from services.line_client import line_client
+from utils.conversation_store import conversation_store
 
 logger = logging.getLogger(__name__)
 
-# LINE Bot API 設定
-LINE_API_URL = 'https://api.line.me/v2/bot/message/reply'
-LINE_PUSH_API_URL = 'https://api.line.me/v2/bot/message/push'
+# 会議作成ワーカープール（スレッド数とキュー長を固定）
+meeting_executor = BoundedExecutor(
+    'meeting-creator',
+    max_workers=Config.MEETING_WORKERS,
+    max_queue_size=Config.MEETING_QUEUE_SIZE
+)
 
-# ユーザーの会話状態を管理
-user_states = {}
+# Zoom / カレンダーを並列に呼ぶための補助スレッド（会議作成ワーカー1つにつき最大2本）
+provisioning_executor = ThreadPoolExecutor(
+    max_workers=Config.MEETING_WORKERS * 2,
+    thread_name_prefix='meeting-provisioning'
+)
+
+# Webhook イベントディスパッチャー（同一ユーザーは順番に、別ユーザーは並列に処理）
+event_dispatcher = ShardedExecutor(
+    'webhook-dispatcher',
+    num_shards=Config.WEBHOOK_WORKERS,
+    max_queue_size=Config.WEBHOOK_QUEUE_SIZE
+)
+
+# 再送された Webhook イベントの重複排除（webhookEventId）
+webhook_dedup = DedupCache(
+    'webhook-events',
+    max_entries=Config.WEBHOOK_DEDUP_MAX_ENTRIES,
+    window=Config.WEBHOOK_DEDUP_WINDOW
+)
+
+# クイックリプライの候補
+QUICK_REPLY_TIMES = ['09:00', '10:00', '11:00', '13:00', '14:00', '15:00', '16:00', '17:00']
+QUICK_REPLY_DURATIONS = [15, 30, 45, 60, 90, 120]
+
+# 会議の日時はこのタイムゾーンで作成する（「今日」の判定もサーバーの時刻ではなくこれに合わせる）
+MEETING_TIMEZONE = ZoneInfo('Asia/Tokyo')
 
 class ConversationState:
     """会話状態の定義"""
@@ -25,6 +62,7 @@ class ConversationState:
     WAITING_FOR_DURATION = "waiting_for_duration"
     WAITING_FOR_MEMO = "waiting_for_memo"
     CONFIRMING = "confirming"
+    CREATING = "creating"
 
 def verify_signature(body: str, signature: str) -> bool:
     """LINE Bot 署名検証"""
@@ -61,9 +99,33 @@ def handle_webhook(request):
         
         # イベント処理
         events = json.loads(body).get('events', [])
+        received_at = time.time()
+        dropped = 0
         for event in events:
-            if event.get('type') == 'message' and event.get('message', {}).get('type') == 'text':
-                handle_message_event(event)
+            # 応答遅延などで再送されたイベントは処理済みなので無視
+            event_id = event.get('webhookEventId')
+            if event_id and not webhook_dedup.check_and_add(event_id):
+                is_redelivery = event.get('deliveryContext', {}).get('isRedelivery', False)
+                logger.warning(f"重複イベントを無視しました: {event_id} (再送: {is_redelivery})")
+                continue
+            
+            if not Config.WEBHOOK_ASYNC_DISPATCH:
+                dispatch_event(event)
+                continue
+            
+            user_id = event.get('source', {}).get('userId', '')
+            # キュー満杯時は待たずに 503 を返し、LINE の再送に任せる
+            if not event_dispatcher.submit(user_id, dispatch_event, event, received_at):
+                # 同期処理すると先に積まれた同じユーザーのイベントを追い越すため処理せず、
+                # 再送を受け付けられるよう受付記録を取り消す
+                if event_id:
+                    webhook_dedup.discard(event_id)
+                dropped += 1
+                logger.error(f"イベントキュー満杯のためイベントを受け付けませんでした: {user_id} ({event_id})")
+        
+        if dropped:
+            # 受け付けられなかったイベントを LINE に再送させる（受付済みのものは重複として無視される）
+            return jsonify({"error": "Service Unavailable"}), 503
         
         return jsonify({"status": "OK"})
         
@@ -71,9 +133,19 @@ def handle_webhook(request):
         logger.error(f"Webhook処理エラー: {str(e)}")
         return jsonify({"error": "Internal Server Error"}), 500
 
+def dispatch_event(event, received_at: float = None):
+    """イベント種別ごとの処理振り分け"""
+    if received_at is not None:
+        queue_latency = time.time() - received_at
+        logger.info(f"イベントキュー待ち時間: {queue_latency:.2f}秒")
+    
+    if event.get('type') == 'message' and event.get('message', {}).get('type') == 'text':
+        handle_message_event(event)
+    elif event.get('type') == 'postback':
+        handle_postback_event(event)
+
 def handle_message_event(event):
     """メッセージイベント処理"""
-    import time
     start_time = time.time()
     
     try:
@@ -83,31 +155,44 @@ def handle_message_event(event):
         
         logger.info(f"メッセージ受信: {message_text} from {user_id}")
         
-        # ユーザー状態を取得
-        user_state = user_states.get(user_id, {})
+        from utils.helpers import MEETING_COMMAND_PREFIX, parse_meeting_command
+        
+        # ユーザー状態を取得（状態更新時はこの読み取り時のバージョンで競合を検出する）
+        user_state, version = conversation_store.get(user_id)
         current_state = user_state.get('state', '')
+        conversation = (user_state, version)
+        
+        is_command = bool(MEETING_COMMAND_PREFIX.match(message_text))
+        command_data = parse_meeting_command(message_text) if is_command else None
         
         if message_text == "会議作成":
             # 会議作成開始
             start_meeting_creation(user_id, reply_token)
+        elif is_command and (command_data or not current_state):
+            # 一括入力（会議作成 会議名 日付 時間 会議時間 [メモ]）
+            # 対話中に形式が合わない場合は会議名・メモなどの入力として下の状態処理に回す
+            handle_meeting_command(user_id, command_data, reply_token)
         elif current_state == ConversationState.WAITING_FOR_MEETING_NAME:
             # 会議名入力
-            handle_meeting_name(user_id, message_text, reply_token)
+            handle_meeting_name(user_id, message_text, reply_token, conversation)
         elif current_state == ConversationState.WAITING_FOR_DATE:
             # 日付入力
-            handle_date_input(user_id, message_text, reply_token)
+            handle_date_input(user_id, message_text, reply_token, conversation)
         elif current_state == ConversationState.WAITING_FOR_TIME:
             # 時間入力
-            handle_time_input(user_id, message_text, reply_token)
+            handle_time_input(user_id, message_text, reply_token, conversation)
         elif current_state == ConversationState.WAITING_FOR_DURATION:
             # 会議時間入力
-            handle_duration_input(user_id, message_text, reply_token)
+            handle_duration_input(user_id, message_text, reply_token, conversation)
         elif current_state == ConversationState.WAITING_FOR_MEMO:
             # メモ入力
-            handle_memo_input(user_id, message_text, reply_token)
+            handle_memo_input(user_id, message_text, reply_token, conversation)
         elif current_state == ConversationState.CONFIRMING:
             # 確認処理
-            handle_confirmation(user_id, message_text, reply_token)
+            handle_confirmation(user_id, message_text, reply_token, conversation)
+        elif current_state == ConversationState.CREATING:
+            # 会議作成中
+            send_message(reply_token, "会議を作成中です... しばらくお待ちください。")
         else:
             # 不明なメッセージ
             send_message(reply_token, "「会議作成」と入力してください")
@@ -120,14 +205,113 @@ def handle_message_event(event):
         logger.error(f"メッセージ処理エラー: {str(e)}")
         send_message(event.get('replyToken', ''), "エラーが発生しました。もう一度お試しください。")
 
+def handle_postback_event(event):
+    """ポストバックイベント処理（クイックリプライのボタン）"""
+    start_time = time.time()
+    
+    try:
+        user_id = event.get('source', {}).get('userId', '')
+        reply_token = event.get('replyToken', '')
+        postback = event.get('postback', {})
+        data = parse_qs(postback.get('data', ''))
+        field = data.get('field', [''])[0]
+        # 日時選択アクションは params に選択結果が入る
+        params = postback.get('params', {})
+        value = params.get('date') or params.get('time') or data.get('value', [''])[0]
+        
+        logger.info(f"ポストバック受信: {field}={value} from {user_id}")
+        
+        handlers = {
+            'date': (ConversationState.WAITING_FOR_DATE, handle_date_input),
+            'time': (ConversationState.WAITING_FOR_TIME, handle_time_input),
+            'duration': (ConversationState.WAITING_FOR_DURATION, handle_duration_input),
+            'memo': (ConversationState.WAITING_FOR_MEMO, handle_memo_input),
+            'confirm': (ConversationState.CONFIRMING, handle_confirmation)
+        }
+        user_state, version = conversation_store.get(user_id)
+        expected_state, handler = handlers.get(field, (None, None))
+        
+        if handler is None:
+            logger.warning(f"不明なポストバック: {postback.get('data', '')}")
+        elif user_state.get('state') != expected_state:
+            # 過去のメッセージのボタンが押された場合
+            if user_state.get('state'):
+                send_message(reply_token, "このボタンは現在使用できません。最新のメッセージのボタンを使用してください")
+            else:
+                send_message(reply_token, "このボタンは現在使用できません。「会議作成」と入力してください")
+        else:
+            handler(user_id, value, reply_token, (user_state, version))
+        
+        # 処理時間をログ出力
+        processing_time = time.time() - start_time
+        logger.info(f"ポストバック処理時間: {processing_time:.2f}秒")
+        
+    except Exception as e:
+        logger.error(f"ポストバック処理エラー: {str(e)}")
+        send_message(event.get('replyToken', ''), "エラーが発生しました。もう一度お試しください。")
+
+def _postback_item(label: str, field: str, value: str) -> Dict[str, Any]:
+    """ポストバックボタン（押した内容はユーザーの発言として表示）"""
+    return {
+        'type': 'action',
+        'action': {
+            'type': 'postback',
+            'label': label,
+            'data': urlencode({'field': field, 'value': value}),
+            'displayText': value
+        }
+    }
+
+def _datetimepicker_item(label: str, field: str, mode: str) -> Dict[str, Any]:
+    """日付・時刻選択ボタン"""
+    return {
+        'type': 'action',
+        'action': {
+            'type': 'datetimepicker',
+            'label': label,
+            'data': urlencode({'field': field}),
+            'mode': mode
+        }
+    }
+
+def date_quick_reply() -> Dict[str, Any]:
+    """日付入力用クイックリプライ"""
+    today = datetime.now(MEETING_TIMEZONE)
+    items = []
+    for offset, label in ((0, '今日'), (1, '明日'), (2, '明後日')):
+        day = today + timedelta(days=offset)
+        items.append(_postback_item(f"{label} {day.month}/{day.day}", 'date', day.strftime('%Y/%m/%d')))
+    items.append(_datetimepicker_item('日付を選択', 'date', 'date'))
+    return {'items': items}
+
+def time_quick_reply() -> Dict[str, Any]:
+    """開始時間入力用クイックリプライ"""
+    items = [_postback_item(value, 'time', value) for value in QUICK_REPLY_TIMES]
+    items.append(_datetimepicker_item('時刻を選択', 'time', 'time'))
+    return {'items': items}
+
+def duration_quick_reply() -> Dict[str, Any]:
+    """会議時間入力用クイックリプライ"""
+    from utils.helpers import format_duration
+    return {'items': [_postback_item(format_duration(minutes), 'duration', f"{minutes}分")
+                      for minutes in QUICK_REPLY_DURATIONS]}
+
+def memo_quick_reply() -> Dict[str, Any]:
+    """メモ入力用クイックリプライ"""
+    return {'items': [_postback_item('なし', 'memo', 'なし')]}
+
+def confirm_quick_reply() -> Dict[str, Any]:
+    """確認用クイックリプライ"""
+    return {'items': [_postback_item('はい', 'confirm', 'はい'), _postback_item('いいえ', 'confirm', 'いいえ')]}
+
 def start_meeting_creation(user_id: str, reply_token: str):
     """会議作成開始"""
     try:
         # ユーザー状態をリセット
-        user_states[user_id] = {
+        conversation_store.set(user_id, {
             'state': ConversationState.WAITING_FOR_MEETING_NAME,
             'meeting_data': {}
-        }
+        })
         
         send_message(reply_token, "会議名を教えてください")
         
@@ -135,7 +319,47 @@ def start_meeting_creation(user_id: str, reply_token: str):
         logger.error(f"会議作成開始エラー: {str(e)}")
         send_message(reply_token, "エラーが発生しました。もう一度お試しください。")
 
-def handle_meeting_name(user_id: str, meeting_name: str, reply_token: str):
+def handle_meeting_command(user_id: str, meeting_data: Optional[dict], reply_token: str):
+    """一括入力処理（対話を省略して確認へ進む。meeting_data は解析結果で、形式が違えば None）"""
+    try:
+        if not meeting_data:
+            send_message(reply_token, "入力形式が正しくありません。\n例：会議作成 定例 2024/01/15 14:00 60分 （最後にメモも追加できます）")
+            return
+        
+        # ユーザー状態を確認待ちに設定
+        conversation_store.set(user_id, {
+            'state': ConversationState.CONFIRMING,
+            'meeting_data': meeting_data
+        })
+        
+        send_confirmation_message(user_id, reply_token)
+        
+    except Exception as e:
+        logger.error(f"一括入力処理エラー: {str(e)}")
+        send_message(reply_token, "エラーが発生しました。もう一度お試しください。")
+
+def _advance_state(user_id: str, reply_token: str, conversation: Tuple[dict, int], expected_state: str,
+                   field: str, value, next_state: str) -> bool:
+    """入力値を会議データに追加して次の状態へ進める（他の処理と競合した場合は False）
+
+    conversation はメッセージを振り分けた時に読んだ (状態, バージョン)。
+    読み直さずにそのバージョンで更新するため、間に別の処理が状態を進めていれば失敗する
+    """
+    user_state, version = conversation
+    if not user_state:
+        send_message(reply_token, "入力の有効期限が切れました。「会議作成」からやり直してください。")
+        return False
+    if user_state.get('state') != expected_state:
+        send_message(reply_token, "他の操作と重なったため処理できませんでした。もう一度入力してください。")
+        return False
+    meeting_data = dict(user_state['meeting_data'])
+    meeting_data[field] = value
+    if conversation_store.compare_and_set(user_id, version, {'state': next_state, 'meeting_data': meeting_data}):
+        return True
+    send_message(reply_token, "他の操作と重なったため処理できませんでした。もう一度入力してください。")
+    return False
+
+def handle_meeting_name(user_id: str, meeting_name: str, reply_token: str, conversation: Tuple[dict, int]):
     """会議名処理"""
     try:
         if not meeting_name.strip():
@@ -143,85 +367,89 @@ def handle_meeting_name(user_id: str, meeting_name: str, reply_token: str):
             return
         
         # ユーザー状態を更新
-        user_states[user_id]['meeting_data']['meeting_name'] = meeting_name.strip()
-        user_states[user_id]['state'] = ConversationState.WAITING_FOR_DATE
+        if not _advance_state(user_id, reply_token, conversation, ConversationState.WAITING_FOR_MEETING_NAME,
+                              'meeting_name', meeting_name.strip(), ConversationState.WAITING_FOR_DATE):
+            return
         
-        from datetime import datetime
-        today_example = datetime.now().strftime('%Y/%m/%d')
-        send_message(reply_token, f"日付を教えてください（例：{today_example}）")
+        today_example = datetime.now(MEETING_TIMEZONE).strftime('%Y/%m/%d')
+        send_message(reply_token, f"日付を教えてください（例：{today_example}）", date_quick_reply())
         
     except Exception as e:
         logger.error(f"会議名処理エラー: {str(e)}")
         send_message(reply_token, "エラーが発生しました。もう一度お試しください。")
 
-def handle_date_input(user_id: str, date_str: str, reply_token: str):
+def handle_date_input(user_id: str, date_str: str, reply_token: str, conversation: Tuple[dict, int]):
     """日付入力処理"""
     try:
         from utils.helpers import validate_date
         
         date_obj = validate_date(date_str)
         if not date_obj:
-            send_message(reply_token, "正しい日付を入力してください（例：2024/01/15）")
+            send_message(reply_token, "正しい日付を入力してください（例：2024/01/15）", date_quick_reply())
             return
         
         # ユーザー状態を更新
-        user_states[user_id]['meeting_data']['date'] = date_obj
-        user_states[user_id]['state'] = ConversationState.WAITING_FOR_TIME
+        if not _advance_state(user_id, reply_token, conversation, ConversationState.WAITING_FOR_DATE,
+                              'date', date_obj, ConversationState.WAITING_FOR_TIME):
+            return
         
-        send_message(reply_token, "開始時間を教えてください（例：14:00）")
+        send_message(reply_token, "開始時間を教えてください（例：14:00）", time_quick_reply())
         
     except Exception as e:
         logger.error(f"日付入力処理エラー: {str(e)}")
         send_message(reply_token, "エラーが発生しました。もう一度お試しください。")
 
-def handle_time_input(user_id: str, time_str: str, reply_token: str):
+def handle_time_input(user_id: str, time_str: str, reply_token: str, conversation: Tuple[dict, int]):
     """時間入力処理"""
     try:
         from utils.helpers import validate_time
         
         time_obj = validate_time(time_str)
         if not time_obj:
-            send_message(reply_token, "正しい時間を入力してください（例：14:00）")
+            send_message(reply_token, "正しい時間を入力してください（例：14:00）", time_quick_reply())
             return
         
         # ユーザー状態を更新
-        user_states[user_id]['meeting_data']['time'] = time_obj
-        user_states[user_id]['state'] = ConversationState.WAITING_FOR_DURATION
+        if not _advance_state(user_id, reply_token, conversation, ConversationState.WAITING_FOR_TIME,
+                              'time', time_obj, ConversationState.WAITING_FOR_DURATION):
+            return
         
-        send_message(reply_token, "会議時間を教えてください（例：60分）")
+        send_message(reply_token, "会議時間を教えてください（例：60分）", duration_quick_reply())
         
     except Exception as e:
         logger.error(f"時間入力処理エラー: {str(e)}")
         send_message(reply_token, "エラーが発生しました。もう一度お試しください。")
 
-def handle_duration_input(user_id: str, duration_str: str, reply_token: str):
+def handle_duration_input(user_id: str, duration_str: str, reply_token: str, conversation: Tuple[dict, int]):
     """会議時間入力処理"""
     try:
         from utils.helpers import validate_duration
         
         duration = validate_duration(duration_str)
         if not duration:
-            send_message(reply_token, "正しい時間を入力してください（例：60分）")
+            send_message(reply_token, "正しい時間を入力してください（例：60分）", duration_quick_reply())
             return
         
         # ユーザー状態を更新
-        user_states[user_id]['meeting_data']['duration'] = duration
-        user_states[user_id]['state'] = ConversationState.WAITING_FOR_MEMO
+        if not _advance_state(user_id, reply_token, conversation, ConversationState.WAITING_FOR_DURATION,
+                              'duration', duration, ConversationState.WAITING_FOR_MEMO):
+            return
         
         # メモ入力を依頼（任意）
-        send_message(reply_token, "メモがあれば入力してください（なしの場合は「なし」と入力）")
+        send_message(reply_token, "メモがあれば入力してください（なしの場合は「なし」と入力）", memo_quick_reply())
     except Exception as e:
         logger.error(f"会議時間入力処理エラー: {str(e)}")
         send_message(reply_token, "エラーが発生しました。もう一度お試しください。")
 
-def handle_memo_input(user_id: str, memo_text: str, reply_token: str):
+def handle_memo_input(user_id: str, memo_text: str, reply_token: str, conversation: Tuple[dict, int]):
     """メモ入力処理（任意）"""
     try:
         memo = memo_text.strip()
         if memo == "なし":
             memo = ""
-        user_states[user_id]['meeting_data']['memo'] = memo
-        user_states[user_id]['state'] = ConversationState.CONFIRMING
+        if not _advance_state(user_id, reply_token, conversation, ConversationState.WAITING_FOR_MEMO,
+                              'memo', memo, ConversationState.CONFIRMING):
+            return
         # 確認メッセージ送信
         send_confirmation_message(user_id, reply_token)
     except Exception as e:
@@ -231,7 +459,7 @@ def handle_memo_input(user_id: str, memo_text: str, reply_token: str):
 def send_confirmation_message(user_id: str, reply_token: str):
     """確認メッセージ送信"""
     try:
-        meeting_data = user_states[user_id]['meeting_data']
+        meeting_data = conversation_store.get(user_id)[0]['meeting_data']
         
         from utils.helpers import combine_datetime, format_datetime, format_duration
         
@@ -249,95 +477,207 @@ def send_confirmation_message(user_id: str, reply_token: str):
 「はい」または「いいえ」でお答えください。
         """.strip()
         
-        send_message(reply_token, message)
+        send_message(reply_token, message, confirm_quick_reply())
         
     except Exception as e:
         logger.error(f"確認メッセージ送信エラー: {str(e)}")
         send_message(reply_token, "エラーが発生しました。もう一度お試しください。")
 
-def handle_confirmation(user_id: str, response: str, reply_token: str):
+def handle_confirmation(user_id: str, response: str, reply_token: str, conversation: Tuple[dict, int]):
     """確認処理"""
     try:
+        user_state, version = conversation
         if response == "はい":
-            # 会議作成処理
-            create_meeting(user_id, reply_token)
+            # 作成中に切り替えられた場合だけ作成する（二重の「はい」で会議を重複作成しない）
+            meeting_data = user_state['meeting_data']
+            if not conversation_store.compare_and_set(
+                    user_id, version, {'state': ConversationState.CREATING, 'meeting_data': meeting_data}):
+                send_message(reply_token, "他の操作と重なったため処理できませんでした。もう一度入力してください。")
+                return
+            create_meeting(user_id, reply_token, meeting_data)
         elif response == "いいえ":
-            # 会議作成キャンセル
-            user_states[user_id] = {}
+            # 会議作成キャンセル（別の操作で状態が変わっていれば何もしない）
+            conversation_store.delete(user_id, expected_version=version)
             send_message(reply_token, "会議作成をキャンセルしました。")
         else:
-            send_message(reply_token, "「はい」または「いいえ」でお答えください。")
+            send_message(reply_token, "「はい」または「いいえ」でお答えください。", confirm_quick_reply())
             
     except Exception as e:
         logger.error(f"確認処理エラー: {str(e)}")
         send_message(reply_token, "エラーが発生しました。もう一度お試しください。")
 
-def create_meeting(user_id: str, reply_token: str):
+def create_meeting(user_id: str, reply_token: str, meeting_data: dict):
     """会議作成処理（非同期）"""
     try:
-        # 即座に処理中メッセージを送信
-        send_message(reply_token, "会議を作成中です... しばらくお待ちください。")
-        
-        # ユーザー状態を一時保存
-        meeting_data = user_states[user_id]['meeting_data'].copy()
+        # ワーカープールで会議作成を実行
+        if meeting_executor.submit(_create_meeting_async, user_id, meeting_data):
+            send_message(reply_token, "会議を作成中です... しばらくお待ちください。")
+            return
         
-        # 非同期で会議作成を実行
-        import threading
-        thread = threading.Thread(target=_create_meeting_async, args=(user_id, meeting_data))
-        thread.daemon = True
-        thread.start()
+        # 混雑時は少し待ってから再投入
+        if _schedule_meeting_retry(user_id, meeting_data, 1):
+            send_message(reply_token, "ただいま混雑しています。順番に会議を作成しますので、しばらくお待ちください。")
+        else:
+            _clear_user_state(user_id, meeting_data)
+            send_message(reply_token, "ただいま混雑しているため会議を作成できませんでした。時間をおいてもう一度お試しください。")
         
     except Exception as e:
         logger.error(f"会議作成開始エラー: {str(e)}")
+        _clear_user_state(user_id, meeting_data)
         send_message(reply_token, "会議作成中にエラーが発生しました。もう一度お試しください。")
 
+def _schedule_meeting_retry(user_id: str, meeting_data: dict, attempt: int) -> bool:
+    """会議作成の遅延再投入を予約"""
+    if attempt > Config.MEETING_MAX_RETRIES:
+        return False
+    return meeting_executor.schedule(Config.MEETING_RETRY_DELAY, _retry_meeting_creation, user_id, meeting_data, attempt)
+
+def _retry_meeting_creation(user_id: str, meeting_data: dict, attempt: int):
+    """混雑時の会議作成再投入（スケジューラースレッドから呼ばれる）"""
+    if meeting_executor.submit(_create_meeting_async, user_id, meeting_data):
+        logger.info(f"会議作成を再投入しました: {user_id} (試行: {attempt})")
+        return
+    
+    if not _schedule_meeting_retry(user_id, meeting_data, attempt + 1):
+        logger.error(f"会議作成の再投入上限に達しました: {user_id}")
+        _clear_user_state(user_id, meeting_data)
+        send_push_message(user_id, "ただいま混雑しているため会議を作成できませんでした。時間をおいてもう一度お試しください。")
+
+def _clear_user_state(user_id: str, meeting_data: dict):
+    """会議作成終了後の作成中状態のリセット（ユーザーが新しい会話を始めていれば残す）"""
+    user_state, version = conversation_store.get(user_id)
+    if user_state.get('state') == ConversationState.CREATING and user_state.get('meeting_data') == meeting_data:
+        conversation_store.delete(user_id, expected_version=version)
+
+# ステージ別時間の記録用（ジョブより長く残ったカレンダー処理が書き込むことがあるため）
+_timings_lock = threading.Lock()
+
+@contextmanager
+def _stage(timings: Dict[str, float], name: str):
+    """処理ステージの所要時間を記録"""
+    stage_start = time.time()
+    try:
+        yield
+    finally:
+        with _timings_lock:
+            timings[name] = time.time() - stage_start
+
+def _provision_sequential(zoom_meeting_data: dict, calendar_event_data: dict, timings: Dict[str, float], deadline: float):
+    """Zoom 会議作成 → カレンダー登録を順番に実行（呼び出し元スレッドの期限がそのまま適用される）"""
+    from services.zoom_api import create_zoom_meeting
+    from services.google_calendar import create_calendar_event
+    
+    with _stage(timings, 'zoom'):
+        zoom_result = create_zoom_meeting(zoom_meeting_data)
+    
+    calendar_event_data = dict(
+        calendar_event_data,
+        meeting_url=zoom_result['meeting_url'],
+        meeting_id=zoom_result['meeting_id'],
+        meeting_password=zoom_result['meeting_password']
+    )
+    with _stage(timings, 'calendar'):
+        calendar_result = create_calendar_event(calendar_event_data)
+    
+    return zoom_result, calendar_result, None
+
+def _delete_orphan_calendar_event(calendar_future):
+    """会議として保存されなかったカレンダーイベントを削除（作成完了後に呼ばれる）"""
+    from services.google_calendar import delete_calendar_event
+    
+    if calendar_future.exception() is None:
+        calendar_result = calendar_future.result()
+        if calendar_result and calendar_result.get('event_id'):
+            # 後片付けはジョブの期限を過ぎていても行う
+            with deadline_scope(None):
+                delete_calendar_event(calendar_result['event_id'])
+
+def _provision_speculative(zoom_meeting_data: dict, calendar_event_data: dict, timings: Dict[str, float], deadline: float):
+    """Zoom 会議作成とカレンダー登録を並列に実行し、後から会議URL等を PATCH で追記"""
+    from services.zoom_api import create_zoom_meeting
+    from services.google_calendar import create_calendar_event, google_calendar_api
+    
+    def _create_calendar_event():
+        with deadline_scope(deadline), _stage(timings, 'calendar'):
+            return create_calendar_event(calendar_event_data)
+    
+    calendar_future = provisioning_executor.submit(_create_calendar_event)
+    try:
+        with _stage(timings, 'zoom'):
+            zoom_result = create_zoom_meeting(zoom_meeting_data)
+    except Exception:
+        # Zoom 側が失敗した場合は先に作ったカレンダーイベントを削除
+        calendar_future.add_done_callback(_delete_orphan_calendar_event)
+        raise
+    
+    with _stage(timings, 'calendar_wait'):
+        try:
+            calendar_result = calendar_future.result(timeout=remaining_time())
+        except FutureTimeoutError:
+            # 期限内に終わらなければカレンダー登録なしで続行（後から作成されたイベントは削除）
+            logger.error("カレンダー登録が期限内に完了しなかったため、カレンダーなしで会議を作成します")
+            calendar_future.add_done_callback(_delete_orphan_calendar_event)
+            calendar_result = None
+    if not calendar_result:
+        return zoom_result, None, None
+    
+    def _patch_calendar_event():
+        with deadline_scope(deadline), _stage(timings, 'calendar_patch'):
+            # 説明文と場所だけを書き換える小さな PATCH
+            return google_calendar_api.patch_event(calendar_result['event_id'], {
+                'meeting_url': zoom_result['meeting_url'],
+                'meeting_id': zoom_result['meeting_id'],
+                'meeting_password': zoom_result['meeting_password'],
+                'memo': calendar_event_data.get('memo', '')
+            }, calendar_result.get('etag'))
+    
+    return zoom_result, calendar_result, provisioning_executor.submit(_patch_calendar_event)
+
 def _create_meeting_async(user_id: str, meeting_data: dict):
-    """非同期会議作成処理"""
+    """非同期会議作成処理（外部呼び出しは全て MEETING_JOB_DEADLINE 秒以内に収める）"""
+    timings: Dict[str, float] = {}
+    started_at = time.time()
+    deadline = started_at + Config.MEETING_JOB_DEADLINE
     try:
-        
         # 日時を結合
         from utils.helpers import combine_datetime
         start_datetime = combine_datetime(meeting_data['date'], meeting_data['time'])
         
-        # Zoom API で会議作成
-        from services.zoom_api import create_zoom_meeting
-        
         zoom_meeting_data = {
             'meeting_name': meeting_data['meeting_name'],
             'start_time': start_datetime,
             'duration': meeting_data['duration']
         }
         
-        zoom_result = create_zoom_meeting(zoom_meeting_data)
-        
-        # Google Calendar にイベント作成
-        from services.google_calendar import create_calendar_event
-        
+        # カレンダーの会議URL・ID・パスワードは Zoom 会議作成後に埋める
         calendar_event_data = {
             'meeting_name': meeting_data['meeting_name'],
             'start_time': start_datetime,
             'duration': meeting_data['duration'],
-            'meeting_url': zoom_result['meeting_url'],
-            'meeting_id': zoom_result['meeting_id'],
-            'meeting_password': zoom_result['meeting_password'],
             'memo': meeting_data.get('memo','')
         }
         
-        calendar_result = create_calendar_event(calendar_event_data)
+        # Zoom API で会議作成 / Google Calendar にイベント作成
+        with deadline_scope(deadline):
+            if Config.SPECULATIVE_PROVISIONING:
+                zoom_result, calendar_result, patch_future = _provision_speculative(zoom_meeting_data, calendar_event_data, timings, deadline)
+            else:
+                zoom_result, calendar_result, patch_future = _provision_sequential(zoom_meeting_data, calendar_event_data, timings, deadline)
         
-        # データベースに保存
+        # データベースに保存（カレンダーへの追記と並行）
         from database.models import Meeting
-        meeting = Meeting(
-            line_user_id=user_id,
-            meeting_name=meeting_data['meeting_name'],
-            start_time=start_datetime,
-            duration=meeting_data['duration']
-        )
-        meeting.meeting_id = zoom_result['meeting_id']
-        meeting.meeting_password = zoom_result['meeting_password']
-        meeting.meeting_url = zoom_result['meeting_url']
-        meeting.google_event_id = calendar_result['event_id'] if calendar_result else None
-        meeting.save()
+        with _stage(timings, 'db_save'):
+            meeting = Meeting(
+                line_user_id=user_id,
+                meeting_name=meeting_data['meeting_name'],
+                start_time=start_datetime,
+                duration=meeting_data['duration']
+            )
+            meeting.meeting_id = zoom_result['meeting_id']
+            meeting.meeting_password = zoom_result['meeting_password']
+            meeting.meeting_url = zoom_result['meeting_url']
+            meeting.google_event_id = calendar_result['event_id'] if calendar_result else None
+            meeting.save()
         
         # 成功メッセージ送信（プッシュメッセージ）
         from utils.helpers import format_meeting_info
@@ -353,36 +693,46 @@ def _create_meeting_async(user_id: str, meeting_data: dict):
         success_message = f"✅ 会議を作成しました！\n\n{format_meeting_info(meeting_info)}"
         if calendar_result and calendar_result.get('event_url'):
             success_message += f"\n\n📅 Googleカレンダーに追加しました: {calendar_result.get('event_url')}"
-        send_push_message(user_id, success_message)
+        # 送信はまとめ送りの送信スレッドで行うため、ここで測るのはキューへの投入まで
+        with _stage(timings, 'push_enqueue'):
+            send_push_message(user_id, success_message)
+        
+        # カレンダーへの会議URL追記の完了を待つ
+        if patch_future is not None:
+            with _stage(timings, 'calendar_patch_wait'):
+                try:
+                    patched = patch_future.result(timeout=max(deadline - time.time(), 0))
+                except FutureTimeoutError:
+                    patched = None
+                if patched is None:
+                    logger.error(f"カレンダーへの会議情報追記に失敗しました: {calendar_result.get('event_id')}")
         
         # ユーザー状態をリセット
-        user_states[user_id] = {}
+        _clear_user_state(user_id, meeting_data)
         
     except Exception as e:
         logger.error(f"非同期会議作成エラー: {str(e)}")
+        _clear_user_state(user_id, meeting_data)
         send_push_message(user_id, "会議作成中にエラーが発生しました。もう一度お試しください。")
+    finally:
+        with _timings_lock:
+            timings['total'] = time.time() - started_at
+            snapshot = dict(timings)
+        breakdown = ', '.join(f"{name}: {seconds:.2f}秒" for name, seconds in snapshot.items())
+        logger.info(f"会議作成ステージ別時間: {breakdown}")
 
-def send_message(reply_token: str, message: str):
-    """メッセージ送信"""
-    import time
+def send_message(reply_token: str, message: str, quick_reply: Dict[str, Any] = None):
+    """メッセージ送信（quick_reply 指定時はクイックリプライのボタンを付ける）"""
     start_time = time.time()
     
     try:
-        headers = {
-            'Content-Type': 'application/json',
-            'Authorization': f'Bearer {Config.LINE_CHANNEL_ACCESS_TOKEN}'
-        }
-        
-        data = {
-            'replyToken': reply_token,
-            'messages': [{
-                'type': 'text',
-                'text': message
-            }]
+        text_message = {
+            'type': 'text',
+            'text': message
         }
-        
-        response = requests.post(LINE_API_URL, headers=headers, json=data)
-        response.raise_for_status()
+        if quick_reply:
+            text_message['quickReply'] = quick_reply
+        line_client.reply(reply_token, [text_message])
         
         send_time = time.time() - start_time
         logger.info(f"メッセージ送信成功: {message} (送信時間: {send_time:.2f}秒)")
@@ -391,25 +741,24 @@ def send_message(reply_token: str, message: str):
         logger.error(f"メッセージ送信エラー: {str(e)}")
 
 def send_push_message(user_id: str, message: str):
-    """プッシュメッセージ送信"""
+    """プッシュメッセージ送信（同一ユーザー宛ては最大5件ずつまとめて送信）"""
     try:
-        headers = {
-            'Content-Type': 'application/json',
-            'Authorization': f'Bearer {Config.LINE_CHANNEL_ACCESS_TOKEN}'
-        }
+        line_client.enqueue_push(user_id, {
+            'type': 'text',
+            'text': message
+        })
         
-        data = {
-            'to': user_id,
-            'messages': [{
-                'type': 'text',
-                'text': message
-            }]
-        }
-        
-        response = requests.post(LINE_PUSH_API_URL, headers=headers, json=data)
-        response.raise_for_status()
-        
-        logger.info(f"プッシュメッセージ送信成功: {message}")
+        logger.info(f"プッシュメッセージ送信予約: {message}")
         
     except Exception as e:
-        logger.error(f"プッシュメッセージ送信エラー: {str(e)}")
\ No newline at end of file
+        logger.error(f"プッシュメッセージ送信エラー: {str(e)}")
+
+def _notify_conversation_expired(user_id: str, state: dict, reason: str):
+    """放置された会話を破棄したことをユーザーに通知"""
+    if not state.get('state'):
+        return
+    logger.info(f"放置された会話を破棄しました: {user_id} ({reason})")
+    send_push_message(user_id, "一定時間入力がなかったため会議作成を中断しました。もう一度「会議作成」と入力してください。")
+
+if Config.CONVERSATION_EXPIRY_NOTIFY:
+    conversation_store.on_expire = _notify_conversation_expired
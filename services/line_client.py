@@ -0,0 +1,179 @@
+import requests
+import threading
+import time
+import logging
+from requests.adapters import HTTPAdapter
+from typing import Dict, Any, List
+from config import Config
+from utils.worker_pool import BoundedExecutor
+from utils.outbound import line_breaker, request_timeout
+
+logger = logging.getLogger(__name__)
+
+# LINE Bot API 設定
+LINE_API_URL = 'https://api.line.me/v2/bot/message/reply'
+LINE_PUSH_API_URL = 'https://api.line.me/v2/bot/message/push'
+
+# LINE API の1リクエストあたりの最大メッセージ数
+MAX_MESSAGES_PER_REQUEST = 5
+
+# 送信プール満杯時にまとめ送信を再予約する間隔（秒）と回数上限（超えたら破棄）
+FLUSH_RETRY_DELAY = 0.5
+MAX_FLUSH_RETRIES = 10
+
+class LineMessagingClient:
+    """LINE Messaging API クライアント（Keep-Alive 接続を再利用）"""
+
+    def __init__(self, access_token: str, pool_size: int = 10, coalesce_window: float = 0.2):
+        self.coalesce_window = coalesce_window
+        self.timeout = (Config.LINE_CONNECT_TIMEOUT, Config.LINE_READ_TIMEOUT)
+        self.session = requests.Session()
+        self._adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size)
+        self.session.mount('https://', self._adapter)
+        self.session.headers.update({
+            'Content-Type': 'application/json',
+            'Authorization': f'Bearer {access_token}'
+        })
+        # プッシュ送信待ちメッセージ（ユーザーID -> メッセージ一覧）
+        self._pending: Dict[str, List[Dict[str, Any]]] = {}
+        self._lock = threading.Lock()
+        self._outbound = BoundedExecutor('line-outbound', max_workers=pool_size, max_queue_size=pool_size * 10)
+        self._stats = {
+            'coalesced_messages': 0,
+            'flush_retries': 0,
+            'dropped_messages': 0
+        }
+        self._endpoint_stats: Dict[str, Dict[str, Any]] = {}
+
+    def _post(self, endpoint: str, url: str, payload: Dict[str, Any]):
+        """API 呼び出し（エンドポイント毎のレイテンシを記録）"""
+        start_time = time.time()
+        succeeded = False
+        try:
+            timeout = request_timeout('line', *self.timeout)
+            with line_breaker.guard(Config.LINE_READ_TIMEOUT):
+                response = self.session.post(url, json=payload, timeout=timeout)
+                response.raise_for_status()
+            succeeded = True
+            return response
+        finally:
+            self._record(endpoint, time.time() - start_time, succeeded)
+
+    def _record(self, endpoint: str, latency: float, succeeded: bool):
+        """エンドポイント統計の更新"""
+        with self._lock:
+            stats = self._endpoint_stats.setdefault(endpoint, {
+                'requests': 0,
+                'errors': 0,
+                'total_latency': 0.0,
+                'max_latency': 0.0
+            })
+            stats['requests'] += 1
+            stats['total_latency'] += latency
+            stats['max_latency'] = max(stats['max_latency'], latency)
+            if not succeeded:
+                stats['errors'] += 1
+
+    def reply(self, reply_token: str, messages: List[Dict[str, Any]]):
+        """リプライメッセージ送信（最大5件を1リクエストで送信）"""
+        return self._post('reply', LINE_API_URL, {
+            'replyToken': reply_token,
+            'messages': messages[:MAX_MESSAGES_PER_REQUEST]
+        })
+
+    def push(self, user_id: str, messages: List[Dict[str, Any]]):
+        """プッシュメッセージ即時送信（5件毎に分割）"""
+        for i in range(0, len(messages), MAX_MESSAGES_PER_REQUEST):
+            self._post('push', LINE_PUSH_API_URL, {
+                'to': user_id,
+                'messages': messages[i:i + MAX_MESSAGES_PER_REQUEST]
+            })
+
+    def enqueue_push(self, user_id: str, message: Dict[str, Any]):
+        """プッシュメッセージを送信待ちに追加（短時間に溜まった分をまとめて送信）"""
+        with self._lock:
+            pending = self._pending.get(user_id)
+            if pending is not None:
+                pending.append(message)
+                self._stats['coalesced_messages'] += 1
+                return
+            self._pending[user_id] = [message]
+
+        if not self._outbound.schedule(self.coalesce_window, self._flush, user_id):
+            self._flush(user_id)
+
+    def _flush(self, user_id: str, attempt: int = 0):
+        """送信待ちメッセージを送信プールに渡す
+
+        スケジューラースレッドから呼ばれるため送信（I/O）はここでは行わない。
+        送信プールが満杯なら少し後に再予約し、上限を超えたら破棄して件数を記録する
+        """
+        with self._lock:
+            messages = self._pending.pop(user_id, [])
+        if not messages:
+            return
+        if self._outbound.submit(self._send_pending, user_id, messages):
+            return
+        
+        with self._lock:
+            pending = self._pending.get(user_id)
+            if pending is not None:
+                # 後から届いたメッセージの送信予約があるのでその前に戻す
+                pending[:0] = messages
+                return
+            self._pending[user_id] = messages
+            self._stats['flush_retries'] += 1
+        
+        if attempt < MAX_FLUSH_RETRIES and self._outbound.schedule(FLUSH_RETRY_DELAY, self._flush, user_id, attempt + 1):
+            return
+        
+        with self._lock:
+            dropped = self._pending.pop(user_id, [])
+            self._stats['dropped_messages'] += len(dropped)
+        logger.error(f"送信プール満杯のためプッシュメッセージを破棄しました: {user_id} ({len(dropped)}件)")
+
+    def _send_pending(self, user_id: str, messages: List[Dict[str, Any]]):
+        """送信待ちメッセージ送信"""
+        try:
+            self.push(user_id, messages)
+            logger.info(f"プッシュメッセージ送信成功: {user_id} ({len(messages)}件)")
+        except Exception as e:
+            logger.error(f"プッシュメッセージ送信エラー: {str(e)}")
+
+    def _connection_stats(self) -> Dict[str, int]:
+        """urllib3 コネクションプールの接続数とリクエスト数"""
+        connections = 0
+        requests_sent = 0
+        pools = self._adapter.poolmanager.pools
+        for key in list(pools.keys()):
+            pool = pools.get(key)
+            if pool is None:
+                continue
+            connections += pool.num_connections
+            requests_sent += pool.num_requests
+        return {
+            'connections_opened': connections,
+            'requests_sent': requests_sent,
+            'connections_reused': max(requests_sent - connections, 0)
+        }
+
+    def get_stats(self) -> Dict[str, Any]:
+        """送信統計取得"""
+        with self._lock:
+            endpoints = {}
+            for endpoint, stats in self._endpoint_stats.items():
+                endpoints[endpoint] = dict(stats)
+                endpoints[endpoint]['avg_latency'] = stats['total_latency'] / stats['requests'] if stats['requests'] else 0.0
+            stats = dict(self._stats)
+            stats['pending_users'] = len(self._pending)
+        stats['endpoints'] = endpoints
+        stats['connections'] = self._connection_stats()
+        stats['outbound'] = self._outbound.get_stats()
+        return stats
+
+# グローバルインスタンス
+line_client = LineMessagingClient(
+    Config.LINE_CHANNEL_ACCESS_TOKEN or '',
+    pool_size=Config.LINE_POOL_SIZE,
+    coalesce_window=Config.LINE_COALESCE_WINDOW
+)
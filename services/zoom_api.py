@@ -1,10 +1,14 @@
 import requests
-import time
+import threading
 from datetime import datetime
 from config import Config
 import logging
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Tuple
 import base64
+from utils.rate_limit import TokenBucket, parse_retry_after
+from utils.token_cache import TokenCache
+from utils.credential_store import credential_store
+from utils.outbound import zoom_breaker, cap_timeout, request_timeout
 
 logger = logging.getLogger(__name__)
 
@@ -16,64 +20,136 @@ class ZoomAPI:
         self.client_secret = Config.ZOOM_API_SECRET  # Client Secret
         self.account_id = Config.ZOOM_ACCOUNT_ID  # Account ID
         self.base_url = "https://api.zoom.us/v2"
-        self.access_token = None
-        self.token_expires_at = 0
+        # 同時更新を1回にまとめ、期限前にバックグラウンドで更新するトークンキャッシュ
+        self.token_cache = TokenCache(
+            'zoom',
+            self._load_access_token,
+            expiry_margin=60,  # 1分前に更新
+            refresh_ahead=Config.ZOOM_TOKEN_REFRESH_AHEAD
+        )
+        # Keep-Alive 接続を再利用するセッション
+        self.session = requests.Session()
+        self.session.headers.update({'Content-Type': 'application/json'})
+        self.rate_limiter = TokenBucket(
+            'zoom',
+            rate=Config.ZOOM_RATE_LIMIT_PER_SECOND,
+            capacity=Config.ZOOM_RATE_LIMIT_BURST
+        )
     
     def get_access_token(self) -> str:
-        """OAuth アクセストークン取得"""
+        """OAuth アクセストークン取得（キャッシュ済みトークンを再利用）"""
         try:
-            # トークンが有効な場合は再利用
-            if self.access_token and time.time() < self.token_expires_at:
-                return self.access_token
-            
-            # 新しいトークンを取得
-            url = "https://zoom.us/oauth/token"
-            
-            # Basic認証用のヘッダー
-            credentials = f"{self.client_id}:{self.client_secret}"
-            encoded_credentials = base64.b64encode(credentials.encode()).decode()
-            
-            headers = {
-                "Authorization": f"Basic {encoded_credentials}",
-                "Content-Type": "application/x-www-form-urlencoded"
-            }
-            
-            data = {
-                "grant_type": "account_credentials",
-                "account_id": self.account_id
-            }
-            
-            response = requests.post(url, headers=headers, data=data)
-            response.raise_for_status()
-            
-            token_data = response.json()
-            self.access_token = token_data["access_token"]
-            self.token_expires_at = time.time() + token_data["expires_in"] - 60  # 1分前に更新
-            
-            return self.access_token
-            
+            return self.token_cache.get()
         except Exception as e:
             logger.error(f"OAuth トークン取得エラー: {str(e)}")
             raise
     
+    def prefetch_token(self):
+        """起動時にトークンを先に取得（以降は期限前にバックグラウンドで更新される）"""
+        def _prefetch():
+            try:
+                self.get_access_token()
+            except Exception as e:
+                logger.error(f"Zoom トークン事前取得エラー: {str(e)}")
+        
+        threading.Thread(target=_prefetch, name='zoom-token-prefetch', daemon=True).start()
+    
+    def _load_access_token(self) -> Tuple[str, float]:
+        """トークン取得（他プロセスが保存済みのトークンがあれば再利用）"""
+        return credential_store.get_or_refresh(
+            'zoom',
+            self._fetch_access_token,
+            min_ttl=Config.ZOOM_TOKEN_REFRESH_AHEAD + 60
+        )
+    
+    def _fetch_access_token(self) -> Tuple[str, float]:
+        """OAuth アクセストークン発行（TokenCache から呼ばれる）"""
+        url = "https://zoom.us/oauth/token"
+        
+        # Basic認証用のヘッダー
+        credentials = f"{self.client_id}:{self.client_secret}"
+        encoded_credentials = base64.b64encode(credentials.encode()).decode()
+        
+        headers = {
+            "Authorization": f"Basic {encoded_credentials}",
+            "Content-Type": "application/x-www-form-urlencoded"
+        }
+        
+        data = {
+            "grant_type": "account_credentials",
+            "account_id": self.account_id
+        }
+        
+        timeout = request_timeout('zoom', Config.ZOOM_CONNECT_TIMEOUT, Config.ZOOM_TIMEOUT)
+        with zoom_breaker.guard(Config.ZOOM_TIMEOUT):
+            response = self.session.post(url, headers=headers, data=data, timeout=timeout)
+            response.raise_for_status()
+        
+        token_data = response.json()
+        return token_data["access_token"], float(token_data["expires_in"])
+    
     def get_headers(self) -> Dict[str, str]:
         """API リクエストヘッダー取得"""
         try:
             token = self.get_access_token()
             return {
-                'Authorization': f'Bearer {token}',
-                'Content-Type': 'application/json'
+                'Authorization': f'Bearer {token}'
             }
         except Exception as e:
             logger.error(f"ヘッダー取得エラー: {str(e)}")
             raise
     
+    def _request(self, method: str, path: str, **kwargs) -> requests.Response:
+        """API 呼び出し（レート制限に達した場合は失敗させずに待機して再試行）
+
+        タイムアウトとレート制限の待ち時間はジョブ全体の期限で切り詰め、
+        Zoom 側の障害が続いている間はブレーカーで即座に失敗させる
+        """
+        url = f"{self.base_url}{path}"
+        
+        for attempt in range(Config.ZOOM_MAX_RETRIES + 1):
+            if not self.rate_limiter.acquire(timeout=cap_timeout(Config.ZOOM_MAX_RATE_LIMIT_WAIT)):
+                raise Exception("Zoom API レート制限の待機時間を超えました")
+            
+            headers = self.get_headers()
+            timeout = request_timeout('zoom', Config.ZOOM_CONNECT_TIMEOUT, Config.ZOOM_TIMEOUT)
+            with zoom_breaker.guard(Config.ZOOM_TIMEOUT):
+                response = self.session.request(method, url, headers=headers, timeout=timeout, **kwargs)
+                if response.status_code >= 500:
+                    response.raise_for_status()
+            self.rate_limiter.update_from_headers(response.headers)
+            
+            if response.status_code == 401 and attempt == 0:
+                # トークンが失効していた場合は一度だけ取り直す
+                self.token_cache.invalidate()
+                credential_store.invalidate('zoom')
+                continue
+            if response.status_code != 429:
+                response.raise_for_status()
+                return response
+            
+            # 429: Retry-After が無ければ指数バックオフ
+            retry_after = parse_retry_after(response.headers.get('Retry-After'))
+            if retry_after is None:
+                retry_after = float(2 ** attempt)
+            if attempt >= Config.ZOOM_MAX_RETRIES or retry_after > Config.ZOOM_MAX_RATE_LIMIT_WAIT:
+                logger.error(f"Zoom API レート制限超過: {response.headers.get('X-RateLimit-Type')} (Retry-After: {retry_after:.0f}秒)")
+                response.raise_for_status()
+            self.rate_limiter.pause(retry_after)
+        
+        raise Exception("Zoom API レート制限の再試行回数を超えました")
+    
+    def get_rate_limit_stats(self) -> Dict[str, Any]:
+        """レート制限バジェット取得"""
+        return self.rate_limiter.get_stats()
+    
+    def get_token_stats(self) -> Dict[str, Any]:
+        """トークンキャッシュ統計取得"""
+        return self.token_cache.get_stats()
+    
     def create_meeting(self, meeting_data: Dict[str, Any]) -> Dict[str, Any]:
         """会議作成"""
         try:
-            headers = self.get_headers()
-            url = f"{self.base_url}/users/me/meetings"
-            
             # 会議設定
             meeting_settings = {
                 "topic": meeting_data['meeting_name'],
@@ -96,8 +172,7 @@ class ZoomAPI:
             
             logger.info(f"Zoom会議作成開始: {meeting_data['meeting_name']}")
             
-            response = requests.post(url, headers=headers, json=meeting_settings)
-            response.raise_for_status()
+            response = self._request('POST', '/users/me/meetings', json=meeting_settings)
             
             result = response.json()
             
@@ -123,11 +198,7 @@ class ZoomAPI:
     def get_meeting(self, meeting_id: str) -> Optional[Dict[str, Any]]:
         """会議情報取得"""
         try:
-            headers = self.get_headers()
-            url = f"{self.base_url}/meetings/{meeting_id}"
-            
-            response = requests.get(url, headers=headers)
-            response.raise_for_status()
+            response = self._request('GET', f"/meetings/{meeting_id}")
             
             return response.json()
             
@@ -141,17 +212,13 @@ class ZoomAPI:
     def update_meeting(self, meeting_id: str, meeting_data: Dict[str, Any]) -> bool:
         """会議情報更新"""
         try:
-            headers = self.get_headers()
-            url = f"{self.base_url}/meetings/{meeting_id}"
-            
             update_data = {
                 "topic": meeting_data.get('meeting_name'),
                 "start_time": meeting_data['start_time'].strftime('%Y-%m-%dT%H:%M:%S'),
                 "duration": meeting_data['duration']
             }
             
-            response = requests.patch(url, headers=headers, json=update_data)
-            response.raise_for_status()
+            self._request('PATCH', f"/meetings/{meeting_id}", json=update_data)
             
             logger.info(f"Zoom会議更新成功: {meeting_id}")
             return True
@@ -166,11 +233,7 @@ class ZoomAPI:
     def delete_meeting(self, meeting_id: str) -> bool:
         """会議削除"""
         try:
-            headers = self.get_headers()
-            url = f"{self.base_url}/meetings/{meeting_id}"
-            
-            response = requests.delete(url, headers=headers)
-            response.raise_for_status()
+            self._request('DELETE', f"/meetings/{meeting_id}")
             
             logger.info(f"Zoom会議削除成功: {meeting_id}")
             return True
@@ -197,11 +260,7 @@ class ZoomAPI:
     def test_connection(self) -> bool:
         """接続テスト"""
         try:
-            headers = self.get_headers()
-            url = f"{self.base_url}/users/me"
-            
-            response = requests.get(url, headers=headers)
-            response.raise_for_status()
+            self._request('GET', '/users/me')
             
             logger.info("Zoom API 接続テスト成功")
             return True
@@ -0,0 +1,81 @@
+"""会話状態ストアのバージョン管理のテスト"""
+import sqlite3
+import time
+
+import pytest
+
+from utils.conversation_store import MemoryConversationStore, SQLiteConversationStore
+
+
+@pytest.fixture(params=['memory', 'sqlite'])
+def store(request, tmp_path):
+    if request.param == 'sqlite':
+        return SQLiteConversationStore(str(tmp_path / 'conversations.db'), default_ttl=60)
+    return MemoryConversationStore(default_ttl=60)
+
+
+def test_compare_and_set_requires_current_version(store):
+    assert store.compare_and_set('U1', 0, {'state': 'a'})
+    _, version = store.get('U1')
+    assert not store.compare_and_set('U1', 0, {'state': 'b'})
+    assert store.compare_and_set('U1', version, {'state': 'b'})
+    assert store.get('U1')[0] == {'state': 'b'}
+
+
+def test_stale_version_rejected_after_delete(store):
+    store.set('U1', {'state': 'old'})
+    _, stale = store.get('U1')
+    assert store.delete('U1', expected_version=stale)
+    store.set('U1', {'state': 'new'})
+
+    _, version = store.get('U1')
+    assert version > stale
+    assert not store.compare_and_set('U1', stale, {'state': 'overwritten'})
+    assert not store.delete('U1', expected_version=stale)
+    assert store.get('U1')[0] == {'state': 'new'}
+
+
+@pytest.mark.parametrize('purge', [False, True])
+def test_stale_version_rejected_after_expiry(store, purge):
+    store.set('U1', {'state': 'old'}, ttl=0.05)
+    _, stale = store.get('U1')
+    time.sleep(0.1)
+    if purge:
+        assert store.purge_expired() == 1
+    assert store.get('U1') == ({}, 0)
+    assert store.compare_and_set('U1', 0, {'state': 'new'})
+
+    _, version = store.get('U1')
+    assert version > stale
+    assert not store.compare_and_set('U1', stale, {'state': 'overwritten'})
+    assert store.get('U1')[0] == {'state': 'new'}
+
+
+def test_versions_not_shared_between_users(store):
+    store.set('U1', {'state': 'a'})
+    store.set('U2', {'state': 'a'})
+    _, v1 = store.get('U1')
+    _, v2 = store.get('U2')
+    assert v1 != v2
+    assert not store.compare_and_set('U1', v2, {'state': 'b'})
+
+
+def test_sqlite_sequence_continues_from_existing_rows(tmp_path):
+    # 連番テーブル導入前に作られたテーブル
+    path = str(tmp_path / 'conversations.db')
+    conn = sqlite3.connect(path)
+    conn.execute('''
+        CREATE TABLE conversation_states (
+            user_id TEXT PRIMARY KEY,
+            payload TEXT,
+            version INTEGER NOT NULL DEFAULT 0,
+            expires_at REAL NOT NULL DEFAULT 0
+        ) WITHOUT ROWID
+    ''')
+    conn.execute("INSERT INTO conversation_states VALUES ('U1', '{}', 5, ?)", (time.time() + 60,))
+    conn.commit()
+    conn.close()
+
+    store = SQLiteConversationStore(path, default_ttl=60)
+    assert store.delete('U1', expected_version=5)
+    assert store.set('U1', {'state': 'b'}) > 5
@@ -0,0 +1,44 @@
+"""Webhook イベント重複判定キャッシュのテスト"""
+import time
+
+from utils.dedup import DedupCache
+
+
+def test_duplicate_within_window():
+    cache = DedupCache('test', window=60)
+    assert cache.check_and_add('e1')
+    assert not cache.check_and_add('e1')
+    assert cache.check_and_add('e2')
+
+    stats = cache.get_stats()
+    assert stats['checked'] == 3
+    assert stats['duplicates'] == 1
+    assert stats['entries'] == 2
+
+
+def test_key_accepted_again_after_window():
+    cache = DedupCache('test', window=0.05)
+    assert cache.check_and_add('e1')
+    time.sleep(0.1)
+    assert cache.check_and_add('e1')
+    assert cache.get_stats()['expired'] == 1
+
+
+def test_oldest_key_evicted_over_capacity():
+    cache = DedupCache('test', max_entries=2, window=60)
+    for key in ('e1', 'e2', 'e3'):
+        assert cache.check_and_add(key)
+
+    stats = cache.get_stats()
+    assert stats['evicted'] == 1
+    assert stats['entries'] == 2
+    assert not cache.check_and_add('e3')
+    assert cache.check_and_add('e1')
+
+
+def test_discarded_key_accepted_again():
+    cache = DedupCache('test', window=60)
+    assert cache.check_and_add('e1')
+    cache.discard('e1')
+    cache.discard('unknown')
+    assert cache.check_and_add('e1')
@@ -0,0 +1,125 @@
+"""入力解析ヘルパーのテスト"""
+from datetime import datetime
+
+import pytest
+
+from utils.helpers import (
+    MEETING_COMMAND_PREFIX, parse_meeting_command, validate_date, validate_duration, validate_time
+)
+
+
+@pytest.mark.parametrize('text, expected', [
+    ('2025/01/15', datetime(2025, 1, 15)),
+    ('2025-1-5', datetime(2025, 1, 5)),
+    ('01/15/2025', datetime(2025, 1, 15)),
+    ('1-15-2025', datetime(2025, 1, 15)),
+    ('2025年1月15日', datetime(2025, 1, 15)),
+    ('２０２５／０１／１５', datetime(2025, 1, 15)),
+    ('２０２５－１－５', datetime(2025, 1, 5)),
+    ('２０２５年１月１５日', datetime(2025, 1, 15)),
+    (' 2025/01/15 ', datetime(2025, 1, 15)),
+    ('2024/02/29', datetime(2024, 2, 29)),
+    ('2025/02/30', None),
+    ('2025/02/29', None),
+    ('2025/13/01', None),
+    ('2025/04/31', None),
+    ('2025/01-15', None),
+    ('2023/12/31', None),
+    ('2025年1月15', None),
+    ('15/01/2025', None),
+    ('', None),
+])
+def test_validate_date(text, expected):
+    assert validate_date(text) == expected
+
+
+@pytest.mark.parametrize('text, expected', [
+    ('14:00', (14, 0)),
+    ('9:05', (9, 5)),
+    ('１４：３０', (14, 30)),
+    ('14時30分', (14, 30)),
+    ('２時１５分', (2, 15)),
+    ('2:00 PM', (14, 0)),
+    ('12:00am', (0, 0)),
+    ('12:00 PM', (12, 0)),
+    ('２：００ＰＭ', (14, 0)),
+    ('24:00', None),
+    ('14:60', None),
+    ('13:00 PM', None),
+    ('14時', None),
+    ('1400', None),
+])
+def test_validate_time(text, expected):
+    assert validate_time(text) == (datetime(1900, 1, 1, *expected) if expected else None)
+
+
+@pytest.mark.parametrize('text, expected', [
+    ('60', 60),
+    ('60分', 60),
+    ('６０分', 60),
+    ('1時間', 60),
+    ('1時間30分', 90),
+    ('１時間３０分', 90),
+    ('2時間0分', 120),
+    ('約30分', 30),
+    ('8時間', 480),
+    ('0', None),
+    ('481', None),
+    ('9時間', None),
+    ('0分', None),
+    ('時間', None),
+    ('一時間', None),
+    ('', None),
+])
+def test_validate_duration(text, expected):
+    assert validate_duration(text) == expected
+
+
+@pytest.mark.parametrize('text, expected', [
+    ('会議作成 定例 2025/01/15 14:00 60分',
+     ('定例', datetime(2025, 1, 15), (14, 0), 60, '')),
+    ('会議作成 週次 定例 2025-1-5 9:30 1時間30分 議題は別途共有',
+     ('週次 定例', datetime(2025, 1, 5), (9, 30), 90, '議題は別途共有')),
+    ('会議作成 定例 2025年1月15日 2:00 PM 45',
+     ('定例', datetime(2025, 1, 15), (14, 0), 45, '')),
+    # 全角の空白・数字・区切り記号
+    ('会議作成　定例　２０２５／０１／１５　１４：００　６０分　メモ',
+     ('定例', datetime(2025, 1, 15), (14, 0), 60, 'メモ')),
+    ('会議作成 定例 01－15－2025 14時05分 1時間',
+     ('定例', datetime(2025, 1, 15), (14, 5), 60, '')),
+])
+def test_parse_meeting_command(text, expected):
+    meeting_name, date, (hour, minute), duration, memo = expected
+    assert parse_meeting_command(text) == {
+        'meeting_name': meeting_name,
+        'date': date,
+        'time': datetime(1900, 1, 1, hour, minute),
+        'duration': duration,
+        'memo': memo
+    }
+
+
+@pytest.mark.parametrize('text', [
+    '会議作成',
+    '会議作成 ',
+    '会議作成 定例',
+    '会議作成 定例 2025/01/15',
+    '会議作成 定例 2025/01/15 14:00',
+    '会議作成 2025/01/15 14:00 60分',
+    '会議作成 定例 2025/02/30 14:00 60分',
+    '会議作成 定例 2025/01/15 25:00 60分',
+    '会議作成 定例 2025/01/15 14:00 500分',
+    '会議作成定例 2025/01/15 14:00 60分',
+])
+def test_parse_meeting_command_rejects_incomplete_or_invalid(text):
+    assert parse_meeting_command(text) is None
+
+
+@pytest.mark.parametrize('text, expected', [
+    ('会議作成 定例', True),
+    ('会議作成　定例', True),
+    ('会議作成', False),
+    ('会議作成手順の確認', False),
+])
+def test_meeting_command_prefix(text, expected):
+    assert bool(MEETING_COMMAND_PREFIX.match(text)) is expected
@@ -0,0 +1,113 @@
+"""LINE Bot の Webhook 受信とメッセージ振り分けのテスト"""
+import json
+
+import pytest
+
+import app as app_module
+from config import Config
+from services import line_bot
+from utils.conversation_store import MemoryConversationStore
+from utils.dedup import DedupCache
+
+
+@pytest.fixture
+def store(monkeypatch):
+    store = MemoryConversationStore(default_ttl=60)
+    monkeypatch.setattr(line_bot, 'conversation_store', store)
+    return store
+
+
+@pytest.fixture
+def replies(monkeypatch):
+    sent = []
+    monkeypatch.setattr(line_bot, 'send_message', lambda reply_token, message, quick_reply=None: sent.append(message))
+    monkeypatch.setattr(line_bot, 'send_confirmation_message', lambda user_id, reply_token: sent.append('確認'))
+    return sent
+
+
+def _message(text):
+    return {'source': {'userId': 'U1'}, 'message': {'text': text}, 'replyToken': 'r'}
+
+
+def test_invalid_command_during_conversation_is_state_input(store, replies):
+    store.set('U1', {'state': line_bot.ConversationState.WAITING_FOR_MEMO, 'meeting_data': {'meeting_name': '定例'}})
+
+    line_bot.handle_message_event(_message('会議作成 手順の確認'))
+
+    state, _ = store.get('U1')
+    assert state['state'] == line_bot.ConversationState.CONFIRMING
+    assert state['meeting_data']['memo'] == '会議作成 手順の確認'
+    assert replies == ['確認']
+
+
+def test_invalid_command_without_conversation_shows_format(store, replies):
+    line_bot.handle_message_event(_message('会議作成 手順の確認'))
+
+    assert store.get('U1') == ({}, 0)
+    assert replies[0].startswith('入力形式が正しくありません。')
+
+
+def test_valid_command_during_conversation_starts_over(store, replies):
+    store.set('U1', {'state': line_bot.ConversationState.WAITING_FOR_MEMO, 'meeting_data': {'meeting_name': '旧'}})
+
+    line_bot.handle_message_event(_message('会議作成 定例 2025/01/15 14:00 60分'))
+
+    state, _ = store.get('U1')
+    assert state['state'] == line_bot.ConversationState.CONFIRMING
+    assert state['meeting_data']['meeting_name'] == '定例'
+    assert replies == ['確認']
+
+
+@pytest.fixture
+def webhook(monkeypatch):
+    monkeypatch.setattr(line_bot, 'verify_signature', lambda body, signature: True)
+    monkeypatch.setattr(line_bot, 'webhook_dedup', DedupCache('test', window=60))
+    client = app_module.app.test_client()
+
+    def post(*events):
+        return client.post('/webhook', data=json.dumps({'events': list(events)}),
+                           headers={'X-Line-Signature': 'test'})
+    return post
+
+
+def _event(event_id, is_redelivery=False):
+    return {
+        'type': 'message',
+        'webhookEventId': event_id,
+        'deliveryContext': {'isRedelivery': is_redelivery},
+        'source': {'userId': 'U1'},
+        'message': {'type': 'text', 'text': 'こんにちは'},
+        'replyToken': 'r'
+    }
+
+
+def test_redelivered_event_processed_once(webhook, monkeypatch):
+    monkeypatch.setattr(Config, 'WEBHOOK_ASYNC_DISPATCH', False)
+    dispatched = []
+    monkeypatch.setattr(line_bot, 'dispatch_event', lambda event: dispatched.append(event['webhookEventId']))
+
+    assert webhook(_event('e1')).status_code == 200
+    assert webhook(_event('e1', is_redelivery=True), _event('e2', is_redelivery=True)).status_code == 200
+    assert dispatched == ['e1', 'e2']
+
+
+def test_event_rejected_by_full_queue_accepted_on_redelivery(webhook, monkeypatch):
+    monkeypatch.setattr(Config, 'WEBHOOK_ASYNC_DISPATCH', True)
+    accepted = []
+
+    class FullOnce:
+        def __init__(self):
+            self.full = True
+
+        def submit(self, key, func, event, received_at):
+            if event['webhookEventId'] == 'e2' and self.full:
+                self.full = False
+                return False
+            accepted.append(event['webhookEventId'])
+            return True
+    monkeypatch.setattr(line_bot, 'event_dispatcher', FullOnce())
+
+    # 受け付けられなかったイベントがあれば 503 で LINE に再送させる
+    assert webhook(_event('e1'), _event('e2')).status_code == 503
+    assert webhook(_event('e1', is_redelivery=True), _event('e2', is_redelivery=True)).status_code == 200
+    assert accepted == ['e1', 'e2']
@@ -0,0 +1,94 @@
+"""/meetings/<user_id> の条件付き GET のテスト"""
+from datetime import datetime
+
+import pytest
+
+import app as app_module
+from database import models
+from database.connection import ConnectionManager
+from database.migrations import migrate
+
+@pytest.fixture
+def client(tmp_path, monkeypatch):
+    manager = ConnectionManager(str(tmp_path / 'meetings.db'))
+    migrate(manager)
+    monkeypatch.setattr(models, 'connection_manager', manager)
+    models.meeting_cache.clear()
+    yield app_module.app.test_client()
+    manager.close_all()
+
+def _save(line_user_id, meeting_id):
+    meeting = models.Meeting(line_user_id, '定例', datetime(2025, 1, 15, 14, 0), 60)
+    meeting.meeting_id = meeting_id
+    meeting.save()
+
+def test_returns_304_when_list_unchanged(client, monkeypatch):
+    _save('U1', '1')
+    first = client.get('/meetings/U1')
+    assert first.status_code == 200
+    assert first.headers['ETag']
+    assert first.headers['Last-Modified']
+
+    # 304 の場合は一覧を取得しない
+    def fail(*args, **kwargs):
+        raise AssertionError('一覧を取得しています')
+    monkeypatch.setattr(models.Meeting, 'iter_by_user_id', fail)
+
+    second = client.get('/meetings/U1', headers={'If-None-Match': first.headers['ETag']})
+    assert second.status_code == 304
+    assert second.data == b''
+    assert second.headers['ETag'] == first.headers['ETag']
+
+def test_weak_etag_from_proxy_matches(client):
+    _save('U1', '1')
+    first = client.get('/meetings/U1')
+
+    second = client.get('/meetings/U1', headers={'If-None-Match': 'W/' + first.headers['ETag']})
+    assert second.status_code == 304
+
+def test_etag_changes_when_meeting_added(client):
+    _save('U1', '1')
+    first = client.get('/meetings/U1')
+    _save('U1', '2')
+
+    second = client.get('/meetings/U1', headers={'If-None-Match': first.headers['ETag']})
+    assert second.status_code == 200
+    assert second.headers['ETag'] != first.headers['ETag']
+    assert len(second.get_json()['meetings']) == 2
+
+def test_etag_depends_on_page(client):
+    _save('U1', '1')
+    first = client.get('/meetings/U1')
+
+    other_page = client.get('/meetings/U1?limit=1', headers={'If-None-Match': first.headers['ETag']})
+    assert other_page.status_code == 200
+
+def test_error_while_streaming_is_not_a_complete_page(client, monkeypatch):
+    def rows(*args, **kwargs):
+        yield {'id': 1, 'start_time': '2025-01-15 14:00:00'}
+        raise RuntimeError('disk I/O error')
+    monkeypatch.setattr(models.Meeting, 'iter_by_user_id', rows)
+
+    response = client.get('/meetings/U1')
+    # 途中で切れた一覧を next_cursor: null の正常な最終ページとして返さない
+    with pytest.raises(RuntimeError):
+        response.get_data()
+
+def test_list_version_served_from_cache(client, monkeypatch):
+    _save('U1', '1')
+    client.get('/meetings/U1')
+
+    # 一覧取得時に読んだバージョンはキャッシュから返す（データベースを読まない）
+    def fail(*args, **kwargs):
+        raise AssertionError('データベースを読んでいます')
+    monkeypatch.setattr(models.connection_manager, 'query_one', fail)
+    assert models.Meeting.get_list_version('U1')[0] is not None
+
+def test_meeting_row_is_read_only_mapping(client):
+    _save('U1', '1')
+    row = models.Meeting.get_by_meeting_id(1)
+    assert row['meeting_id'] == '1'
+    assert dict(row)['line_user_id'] == 'U1'
+    assert list(row) == list(models.MEETING_COLUMNS)
+    with pytest.raises(TypeError):
+        row['meeting_name'] = '変更'
@@ -0,0 +1,85 @@
+"""スキーママイグレーションとクエリ実行計画のテスト"""
+import pytest
+
+from database.connection import ConnectionManager
+from database.migrations import LATEST_VERSION, get_version, migrate
+from database import models
+
+# 旧 init_database が作成していたスキーマ（バージョン管理導入前）
+LEGACY_SCHEMA = [
+    '''
+    CREATE TABLE meetings (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        line_user_id TEXT NOT NULL,
+        meeting_id TEXT NOT NULL,
+        meeting_password TEXT,
+        meeting_url TEXT,
+        meeting_name TEXT NOT NULL,
+        start_time DATETIME NOT NULL,
+        duration INTEGER NOT NULL,
+        created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+        google_event_id TEXT
+    )
+    ''',
+    'CREATE INDEX idx_line_user_id ON meetings(line_user_id)',
+    'CREATE INDEX idx_start_time ON meetings(start_time)',
+]
+
+# (クエリ, パラメータ)
+MODEL_QUERIES = [
+    (models.SELECT_PAGE_BY_USER_ID_SQL, ('U1', 50)),
+    (models.SELECT_PAGE_BY_USER_ID_AFTER_SQL, ('U1', '2025-01-15 14:00:00', 10, 50)),
+    (models.SELECT_BY_MEETING_ID_SQL, ('123',)),
+    (models.SELECT_LIST_VERSION_SQL, ('U1',)),
+]
+
+@pytest.fixture
+def manager(tmp_path):
+    manager = ConnectionManager(str(tmp_path / 'meetings.db'))
+    yield manager
+    manager.close_all()
+
+def _index_names(manager):
+    return {row[0] for row in manager.query_all("SELECT name FROM sqlite_master WHERE type = 'index'")}
+
+def _query_plan(manager, sql, params):
+    return [row[3] for row in manager.query_all('EXPLAIN QUERY PLAN ' + sql, params)]
+
+def test_migrate_creates_latest_schema(manager):
+    assert migrate(manager) == LATEST_VERSION
+    assert get_version(manager) == LATEST_VERSION
+    assert {'idx_line_user_id_start_time', 'idx_meeting_id', 'idx_line_user_id_created_at'} <= _index_names(manager)
+
+def test_migrate_is_idempotent(manager):
+    migrate(manager)
+    indexes = _index_names(manager)
+    assert migrate(manager) == LATEST_VERSION
+    assert _index_names(manager) == indexes
+
+def test_migrate_upgrades_legacy_database(manager):
+    with manager.transaction() as conn:
+        for sql in LEGACY_SCHEMA:
+            conn.execute(sql)
+        conn.execute(models.INSERT_MEETING_SQL, ('U1', '123', 'pw', 'https://zoom.us/j/123',
+                                                 '定例', '2025-01-15 14:00:00', 60, None))
+
+    assert get_version(manager) == 0
+    assert migrate(manager) == LATEST_VERSION
+    assert manager.query_one('SELECT meeting_name FROM meetings WHERE meeting_id = ?', ('123',)) == ('定例',)
+    # 複合インデックスと先頭列が重複するインデックスは削除される
+    assert 'idx_line_user_id' not in _index_names(manager)
+
+@pytest.mark.parametrize('sql, params', MODEL_QUERIES)
+def test_model_queries_use_index(manager, sql, params):
+    migrate(manager)
+    plan = _query_plan(manager, sql, params)
+    assert plan
+    for detail in plan:
+        # テーブル・インデックスの全件走査と、ORDER BY のための一時ソートがないこと
+        assert not detail.startswith('SCAN'), plan
+        assert 'TEMP B-TREE' not in detail, plan
+
+def test_list_version_query_reads_index_only(manager):
+    migrate(manager)
+    plan = _query_plan(manager, models.SELECT_LIST_VERSION_SQL, ('U1',))
+    assert any('COVERING INDEX' in detail for detail in plan), plan
@@ -0,0 +1,75 @@
+import threading
+import time
+import logging
+from collections import OrderedDict
+from typing import Dict, Any, Callable, Hashable, Tuple
+
+logger = logging.getLogger(__name__)
+
+class LRUCache:
+    """件数上限（LRU）と有効期限付きの読み込みキャッシュ"""
+
+    def __init__(self, name: str, max_entries: int = 1000, ttl: float = 30):
+        self.name = name
+        self.max_entries = max_entries
+        self.ttl = ttl
+        # キー -> (値, 有効期限)（最後に使われた順）
+        self._entries: 'OrderedDict[Hashable, Tuple[Any, float]]' = OrderedDict()
+        self._lock = threading.Lock()
+        # 無効化の度に進める（読み込み中に無効化された古い値を保存しないため）
+        self._generation = 0
+        self._stats = {
+            'hits': 0,
+            'misses': 0,
+            'invalidations': 0,
+            'evicted': 0
+        }
+
+    def get_or_load(self, key: Hashable, loader: Callable[[], Any]) -> Any:
+        """キャッシュから取得し、なければ loader の結果を保存して返す"""
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[1] > now:
+                self._entries.move_to_end(key)
+                self._stats['hits'] += 1
+                return entry[0]
+            self._stats['misses'] += 1
+            generation = self._generation
+
+        value = loader()
+
+        with self._lock:
+            if generation == self._generation:
+                self._entries[key] = (value, time.time() + self.ttl)
+                self._entries.move_to_end(key)
+                while len(self._entries) > self.max_entries:
+                    self._entries.popitem(last=False)
+                    self._stats['evicted'] += 1
+        return value
+
+    def invalidate(self, *keys: Hashable):
+        """指定キーを削除"""
+        with self._lock:
+            self._generation += 1
+            for key in keys:
+                self._entries.pop(key, None)
+            self._stats['invalidations'] += 1
+
+    def clear(self):
+        """全件削除"""
+        with self._lock:
+            self._generation += 1
+            self._entries.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """キャッシュ統計取得"""
+        with self._lock:
+            stats = dict(self._stats)
+            stats['entries'] = len(self._entries)
+        lookups = stats['hits'] + stats['misses']
+        stats['hit_rate'] = round(stats['hits'] / lookups, 3) if lookups else 0.0
+        stats['name'] = self.name
+        stats['max_entries'] = self.max_entries
+        stats['ttl'] = self.ttl
+        return stats
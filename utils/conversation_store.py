@@ -0,0 +1,428 @@
+import json
+import sys
+import threading
+import time
+import logging
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from datetime import datetime
+from typing import Dict, Any, Callable, List, Optional, Tuple
+from config import Config
+from database.connection import ConnectionManager
+
+logger = logging.getLogger(__name__)
+
+# datetime を JSON に埋め込むためのキー
+_DATETIME_KEY = '$dt'
+
+# OrderedDict の1件あたりの管理領域（ハッシュテーブルと連結リストのノード）の概算バイト数
+_ENTRY_OVERHEAD = 100
+
+def _encode_default(value: Any):
+    """JSON 化できない値の変換"""
+    if isinstance(value, datetime):
+        return {_DATETIME_KEY: value.isoformat()}
+    raise TypeError(f"会話状態に保存できない型です: {type(value).__name__}")
+
+def _decode_hook(value: Dict[str, Any]):
+    """JSON から datetime を復元"""
+    if len(value) == 1 and _DATETIME_KEY in value:
+        return datetime.fromisoformat(value[_DATETIME_KEY])
+    return value
+
+def encode_state(state: Dict[str, Any]) -> str:
+    """会話状態を空白なしの JSON に変換"""
+    return json.dumps(state, ensure_ascii=False, separators=(',', ':'), default=_encode_default)
+
+def decode_state(payload: str) -> Dict[str, Any]:
+    """JSON から会話状態を復元"""
+    return json.loads(payload, object_hook=_decode_hook)
+
+class ConversationStore(ABC):
+    """会話状態ストアの共通インターフェース
+
+    get はバージョン付きで状態を返し、compare_and_set は読み込み時の
+    バージョンから変わっていない場合だけ書き込む（状態がなければバージョン 0）。
+    バージョンはストア全体の連番で、削除・期限切れの後に作り直しても以前の値には戻らない
+    """
+
+    def __init__(self, default_ttl: float):
+        self.default_ttl = default_ttl
+        # 期限切れ・破棄時のコールバック (ユーザーID, 状態, 理由)
+        self.on_expire: Optional[Callable[[str, Dict[str, Any], str], None]] = None
+        self.sweep_interval = 60.0
+        self._sweeper: Optional[threading.Thread] = None
+        self._sweeper_lock = threading.Lock()
+        self._stats = {
+            'reads': 0,
+            'writes': 0,
+            'conflicts': 0,
+            'expired': 0,
+            'sweeps': 0
+        }
+
+    @abstractmethod
+    def get(self, user_id: str) -> Tuple[Dict[str, Any], int]:
+        """状態取得（状態, バージョン）。なければ ({}, 0)"""
+
+    @abstractmethod
+    def set(self, user_id: str, state: Dict[str, Any], ttl: Optional[float] = None) -> int:
+        """状態を無条件に上書き（新しいバージョンを返す）"""
+
+    @abstractmethod
+    def compare_and_set(self, user_id: str, expected_version: int, state: Dict[str, Any],
+                        ttl: Optional[float] = None) -> bool:
+        """バージョンが一致する場合だけ状態を書き込む"""
+
+    @abstractmethod
+    def delete(self, user_id: str, expected_version: Optional[int] = None) -> bool:
+        """状態削除（expected_version 指定時は一致する場合だけ）"""
+
+    @abstractmethod
+    def purge_expired(self) -> int:
+        """期限切れの状態を削除（削除件数を返す）"""
+
+    def _ensure_sweeper(self):
+        """期限切れ削除スレッドを起動"""
+        if self._sweeper is not None:
+            return
+        with self._sweeper_lock:
+            if self._sweeper is not None:
+                return
+            self._sweeper = threading.Thread(target=self._sweep_loop, name=f"conversation-{self.backend}-sweeper", daemon=True)
+            self._sweeper.start()
+
+    def _sweep_loop(self):
+        """sweep_interval 秒毎に期限切れの状態を削除"""
+        while True:
+            time.sleep(self.sweep_interval)
+            try:
+                removed = self.purge_expired()
+                self._stats['sweeps'] += 1
+                if removed:
+                    logger.info(f"期限切れの会話状態を削除しました: {removed}件")
+            except Exception as e:
+                logger.error(f"会話状態削除エラー: {str(e)}")
+
+    def _notify_expired(self, user_id: str, state: Dict[str, Any], reason: str):
+        """コールバック呼び出し"""
+        if self.on_expire is None:
+            return
+        try:
+            self.on_expire(user_id, state, reason)
+        except Exception as e:
+            logger.error(f"会話状態期限切れ通知エラー: {str(e)}")
+
+    def _record_conflict(self, user_id: str):
+        """競合の記録"""
+        self._stats['conflicts'] += 1
+        logger.warning(f"会話状態の更新が競合しました: {user_id}")
+
+    def get_stats(self) -> Dict[str, Any]:
+        """ストア統計取得"""
+        stats = dict(self._stats)
+        stats['backend'] = self.backend
+        stats['default_ttl'] = self.default_ttl
+        return stats
+
+class _StateRecord:
+    """会話状態1件（辞書を持たないスロット付きレコード。状態本体は UTF-8 の JSON）"""
+
+    __slots__ = ('payload', 'version', 'expires_at')
+
+    def __init__(self, payload: bytes, version: int, expires_at: float):
+        self.payload = payload
+        self.version = version
+        self.expires_at = expires_at
+
+class MemoryConversationStore(ConversationStore):
+    """プロセス内の会話状態ストア（単一プロセス運用向け。件数上限を超えたら古いものから破棄）"""
+
+    backend = 'memory'
+
+    def __init__(self, default_ttl: float, max_entries: int = 10000):
+        super().__init__(default_ttl)
+        self.max_entries = max_entries
+        # ユーザーID -> レコード（最後に使われた順）
+        self._entries: 'OrderedDict[str, _StateRecord]' = OrderedDict()
+        self._lock = threading.Lock()
+        # 最後に払い出したバージョン（ストア全体で単調増加）
+        self._last_version = 0
+        self._stats['evicted'] = 0
+
+    def _current(self, user_id: str, now: float) -> Optional[_StateRecord]:
+        """有効なレコード取得（ロック取得済みで呼ぶこと）"""
+        record = self._entries.get(user_id)
+        if record is None or record.expires_at <= now:
+            return None
+        self._entries.move_to_end(user_id)
+        return record
+
+    def get(self, user_id: str) -> Tuple[Dict[str, Any], int]:
+        with self._lock:
+            self._stats['reads'] += 1
+            record = self._current(user_id, time.time())
+            if record is None:
+                return {}, 0
+            payload, version = record.payload, record.version
+        return decode_state(payload), version
+
+    def _write(self, user_id: str, payload: bytes, ttl: Optional[float]) -> List[Tuple[str, bytes]]:
+        """書き込み（ロック取得済みで呼ぶこと）。バージョンはストア全体の連番から払い出す
+
+        件数上限を超えて破棄したレコードを返す
+        """
+        expires_at = time.time() + (ttl or self.default_ttl)
+        self._last_version += 1
+        record = self._entries.get(user_id)
+        if record is None:
+            self._entries[user_id] = _StateRecord(payload, self._last_version, expires_at)
+        else:
+            record.payload = payload
+            record.version = self._last_version
+            record.expires_at = expires_at
+            self._entries.move_to_end(user_id)
+        self._stats['writes'] += 1
+
+        evicted = []
+        while len(self._entries) > self.max_entries:
+            evicted_id, evicted_record = self._entries.popitem(last=False)
+            evicted.append((evicted_id, evicted_record.payload))
+            self._stats['evicted'] += 1
+        return evicted
+
+    def set(self, user_id: str, state: Dict[str, Any], ttl: Optional[float] = None) -> int:
+        payload = encode_state(state).encode('utf-8')
+        with self._lock:
+            evicted = self._write(user_id, payload, ttl)
+            version = self._entries[user_id].version
+        self._notify_removed(evicted, 'evicted')
+        self._ensure_sweeper()
+        return version
+
+    def compare_and_set(self, user_id: str, expected_version: int, state: Dict[str, Any],
+                        ttl: Optional[float] = None) -> bool:
+        payload = encode_state(state).encode('utf-8')
+        with self._lock:
+            record = self._current(user_id, time.time())
+            if (record.version if record else 0) != expected_version:
+                self._record_conflict(user_id)
+                return False
+            evicted = self._write(user_id, payload, ttl)
+        self._notify_removed(evicted, 'evicted')
+        self._ensure_sweeper()
+        return True
+
+    def delete(self, user_id: str, expected_version: Optional[int] = None) -> bool:
+        with self._lock:
+            record = self._current(user_id, time.time())
+            if expected_version is not None and (record.version if record else 0) != expected_version:
+                self._record_conflict(user_id)
+                return False
+            self._entries.pop(user_id, None)
+            return True
+
+    def purge_expired(self) -> int:
+        """期限切れの状態を削除（削除件数を返す）"""
+        now = time.time()
+        with self._lock:
+            expired = [(user_id, record.payload) for user_id, record in self._entries.items()
+                       if record.expires_at <= now]
+            for user_id, _ in expired:
+                del self._entries[user_id]
+            self._stats['expired'] += len(expired)
+        self._notify_removed(expired, 'expired')
+        return len(expired)
+
+    def _notify_removed(self, removed: List[Tuple[str, bytes]], reason: str):
+        """破棄した状態をコールバックに通知"""
+        for user_id, payload in removed:
+            self._notify_expired(user_id, decode_state(payload), reason)
+
+    def get_stats(self) -> Dict[str, Any]:
+        stats = super().get_stats()
+        now = time.time()
+        with self._lock:
+            stats['entries'] = len(self._entries)
+            stats['live_entries'] = sum(1 for record in self._entries.values() if record.expires_at > now)
+            # キー・レコード・本体と OrderedDict の1件あたりの管理領域の概算
+            stats['approx_bytes'] = sum(
+                sys.getsizeof(user_id) + sys.getsizeof(record) + sys.getsizeof(record.payload) + _ENTRY_OVERHEAD
+                for user_id, record in self._entries.items()
+            )
+        stats['max_entries'] = self.max_entries
+        return stats
+
+_UPSERT_STATE = '''
+    INSERT INTO conversation_states (user_id, payload, version, expires_at)
+    VALUES (?, ?, ?, ?)
+    ON CONFLICT(user_id) DO UPDATE SET
+        payload = excluded.payload,
+        version = excluded.version,
+        expires_at = excluded.expires_at
+'''
+
+class SQLiteConversationStore(ConversationStore):
+    """SQLite の会話状態ストア（共有ボリューム上のファイルで複数プロセス間で共有）"""
+
+    backend = 'sqlite'
+
+    def __init__(self, path: str, default_ttl: float):
+        super().__init__(default_ttl)
+        self.path = path
+        self._db = ConnectionManager(
+            path,
+            busy_timeout_ms=Config.DB_BUSY_TIMEOUT_MS,
+            cached_statements=Config.DB_CACHED_STATEMENTS
+        )
+        self._initialized = False
+        self._init_lock = threading.Lock()
+
+    def _ensure_table(self):
+        """テーブル作成"""
+        if self._initialized:
+            return
+        with self._init_lock:
+            if self._initialized:
+                return
+            with self._db.transaction() as conn:
+                conn.execute('''
+                    CREATE TABLE IF NOT EXISTS conversation_states (
+                        user_id TEXT PRIMARY KEY,
+                        payload TEXT,
+                        version INTEGER NOT NULL DEFAULT 0,
+                        expires_at REAL NOT NULL DEFAULT 0
+                    ) WITHOUT ROWID
+                ''')
+                # バージョンの連番（削除した行のバージョンを再利用しないよう行とは別に持つ）
+                conn.execute('''
+                    CREATE TABLE IF NOT EXISTS conversation_version_seq (
+                        id INTEGER PRIMARY KEY CHECK (id = 1),
+                        value INTEGER NOT NULL
+                    )
+                ''')
+                conn.execute('''
+                    INSERT OR IGNORE INTO conversation_version_seq (id, value)
+                    SELECT 1, COALESCE(MAX(version), 0) FROM conversation_states
+                ''')
+            self._initialized = True
+        self.purge_expired()
+        self._ensure_sweeper()
+
+    @staticmethod
+    def _next_version(conn) -> int:
+        """次のバージョンを払い出す（書き込みトランザクション内で呼ぶこと）"""
+        conn.execute('UPDATE conversation_version_seq SET value = value + 1 WHERE id = 1')
+        return conn.execute('SELECT value FROM conversation_version_seq WHERE id = 1').fetchone()[0]
+
+    def get(self, user_id: str) -> Tuple[Dict[str, Any], int]:
+        self._ensure_table()
+        self._stats['reads'] += 1
+        row = self._db.query_one(
+            'SELECT payload, version FROM conversation_states WHERE user_id = ? AND expires_at > ?',
+            (user_id, time.time())
+        )
+        if not row or row[0] is None:
+            return {}, 0
+        return decode_state(row[0]), row[1]
+
+    def set(self, user_id: str, state: Dict[str, Any], ttl: Optional[float] = None) -> int:
+        self._ensure_table()
+        payload = encode_state(state)
+        expires_at = time.time() + (ttl or self.default_ttl)
+
+        def _set(conn):
+            version = self._next_version(conn)
+            conn.execute(_UPSERT_STATE, (user_id, payload, version, expires_at))
+            return version
+        version = self._db.run_transaction(_set)
+        self._stats['writes'] += 1
+        return version
+
+    def compare_and_set(self, user_id: str, expected_version: int, state: Dict[str, Any],
+                        ttl: Optional[float] = None) -> bool:
+        self._ensure_table()
+        payload = encode_state(state)
+        now = time.time()
+        expires_at = now + (ttl or self.default_ttl)
+
+        def _compare_and_set(conn):
+            # 比較前に書き込みロックを取る
+            conn.execute('BEGIN IMMEDIATE')
+            current = conn.execute('''
+                SELECT CASE WHEN expires_at > ? THEN version ELSE 0 END
+                FROM conversation_states WHERE user_id = ?
+            ''', (now, user_id)).fetchone()
+            if (current[0] if current else 0) != expected_version:
+                return False
+            conn.execute(_UPSERT_STATE, (user_id, payload, self._next_version(conn), expires_at))
+            return True
+        if not self._db.run_transaction(_compare_and_set):
+            self._record_conflict(user_id)
+            return False
+        self._stats['writes'] += 1
+        return True
+
+    def delete(self, user_id: str, expected_version: Optional[int] = None) -> bool:
+        self._ensure_table()
+        if expected_version is None:
+            self._db.execute_write('DELETE FROM conversation_states WHERE user_id = ?', (user_id,))
+            return True
+
+        def _delete(conn):
+            # 比較前に書き込みロックを取る
+            conn.execute('BEGIN IMMEDIATE')
+            current = conn.execute('''
+                SELECT CASE WHEN expires_at > ? THEN version ELSE 0 END
+                FROM conversation_states WHERE user_id = ?
+            ''', (time.time(), user_id)).fetchone()
+            if (current[0] if current else 0) != expected_version:
+                return False
+            conn.execute('DELETE FROM conversation_states WHERE user_id = ?', (user_id,))
+            return True
+        if not self._db.run_transaction(_delete):
+            self._record_conflict(user_id)
+            return False
+        return True
+
+    def purge_expired(self) -> int:
+        """期限切れの状態を削除（削除件数を返す）"""
+        removed = self._db.run_transaction(lambda conn: conn.execute(
+            'DELETE FROM conversation_states WHERE expires_at <= ?', (time.time(),)
+        ).rowcount)
+        self._stats['expired'] += removed
+        return removed
+
+    def get_stats(self) -> Dict[str, Any]:
+        stats = super().get_stats()
+        stats['path'] = self.path
+        try:
+            self._ensure_table()
+            stats['entries'] = self._db.query_one(
+                'SELECT COUNT(*) FROM conversation_states WHERE expires_at > ?', (time.time(),)
+            )[0]
+        except Exception as e:
+            logger.error(f"会話状態ストア統計取得エラー: {str(e)}")
+        return stats
+
+def create_conversation_store(backend: str, path: str, default_ttl: float,
+                              max_entries: int = 10000, sweep_interval: float = 60.0) -> ConversationStore:
+    """設定に応じた会話状態ストアを作成"""
+    if backend == 'sqlite':
+        logger.info(f"会話状態ストア: SQLite ({path})")
+        store = SQLiteConversationStore(path, default_ttl)
+    else:
+        if backend != 'memory':
+            logger.warning(f"未知の会話状態ストアです。メモリを使用します: {backend}")
+        store = MemoryConversationStore(default_ttl, max_entries=max_entries)
+    store.sweep_interval = sweep_interval
+    return store
+
+# グローバルインスタンス
+conversation_store = create_conversation_store(
+    Config.CONVERSATION_STORE,
+    Config.CONVERSATION_STORE_PATH,
+    Config.CONVERSATION_TTL,
+    max_entries=Config.CONVERSATION_MAX_ENTRIES,
+    sweep_interval=Config.CONVERSATION_SWEEP_INTERVAL
+)
@@ -0,0 +1,183 @@
+import base64
+import hashlib
+import json
+import os
+import socket
+import threading
+import time
+import logging
+from typing import Dict, Any, Callable, Optional, Tuple
+from config import Config
+from database.connection import ConnectionManager
+
+logger = logging.getLogger(__name__)
+
+try:
+    from cryptography.fernet import Fernet, InvalidToken
+except ImportError:  # cryptography 未導入時は永続化を無効にする
+    Fernet = None
+    InvalidToken = Exception
+
+class CredentialStore:
+    """暗号化してファイル（SQLite）に保存する認証情報キャッシュ（同一ホストのプロセス間で共有）"""
+
+    def __init__(self, path: str, secret: Optional[str], lease_seconds: float = 30,
+                 poll_interval: float = 0.1):
+        self.path = path
+        self.lease_seconds = lease_seconds
+        self.poll_interval = poll_interval
+        self._fernet = None
+        self._db: Optional[ConnectionManager] = None
+        self._initialized = False
+        self._stats = {
+            'hits': 0,
+            'refreshes': 0,
+            'waits': 0,
+            'errors': 0
+        }
+
+        if not secret:
+            logger.info("TOKEN_STORE_SECRET 未設定のため認証情報の永続化は無効です")
+        elif Fernet is None:
+            logger.warning("cryptography が見つからないため認証情報の永続化は無効です")
+        else:
+            # 任意の文字列から Fernet 鍵を導出
+            key = hashlib.pbkdf2_hmac('sha256', secret.encode('utf-8'), b'zoom-line-bot-token-store', 100000)
+            self._fernet = Fernet(base64.urlsafe_b64encode(key))
+            self._db = ConnectionManager(path)
+
+    @property
+    def enabled(self) -> bool:
+        return self._fernet is not None
+
+    def _owner(self) -> str:
+        """リース所有者ID（ホスト:プロセス:スレッド）"""
+        return f"{socket.gethostname()}:{os.getpid()}:{threading.get_ident()}"
+
+    def _ensure_table(self):
+        """テーブル作成"""
+        if self._initialized:
+            return
+        with self._db.transaction() as conn:
+            conn.execute('''
+                CREATE TABLE IF NOT EXISTS credentials (
+                    name TEXT PRIMARY KEY,
+                    payload BLOB,
+                    expires_at REAL NOT NULL DEFAULT 0,
+                    lease_owner TEXT,
+                    lease_until REAL NOT NULL DEFAULT 0,
+                    updated_at REAL NOT NULL DEFAULT 0
+                )
+            ''')
+        # 暗号化済みでも所有者以外には読ませない
+        os.chmod(self.path, 0o600)
+        self._initialized = True
+
+    def _load(self, name: str) -> Tuple[Optional[str], float]:
+        """保存済みトークン取得（トークン, 有効期限）"""
+        row = self._db.query_one(
+            'SELECT payload, expires_at FROM credentials WHERE name = ?', (name,)
+        )
+        if not row or not row[0]:
+            return None, 0.0
+        try:
+            payload = json.loads(self._fernet.decrypt(row[0]))
+            return payload['token'], row[1]
+        except (InvalidToken, ValueError, KeyError):
+            logger.warning(f"保存済みトークンを復号できません: {name}")
+            return None, 0.0
+
+    def _try_acquire_lease(self, name: str) -> bool:
+        """更新リースを取得（取得できたプロセスだけがトークンを更新する）"""
+        now = time.time()
+        with self._db.transaction() as conn:
+            conn.execute('INSERT OR IGNORE INTO credentials (name) VALUES (?)', (name,))
+            cursor = conn.execute('''
+                UPDATE credentials SET lease_owner = ?, lease_until = ?
+                WHERE name = ? AND lease_until < ?
+            ''', (self._owner(), now + self.lease_seconds, name, now))
+            return cursor.rowcount == 1
+
+    def _save(self, name: str, token: str, expires_at: float):
+        """トークンを暗号化して保存しリースを解放"""
+        payload = self._fernet.encrypt(json.dumps({'token': token}).encode('utf-8'))
+        self._db.execute_write('''
+            UPDATE credentials
+            SET payload = ?, expires_at = ?, lease_owner = NULL, lease_until = 0, updated_at = ?
+            WHERE name = ?
+        ''', (payload, expires_at, time.time(), name))
+
+    def _release_lease(self, name: str):
+        """更新失敗時にリースを解放"""
+        self._db.execute_write(
+            'UPDATE credentials SET lease_owner = NULL, lease_until = 0 WHERE name = ? AND lease_owner = ?',
+            (name, self._owner())
+        )
+
+    def get_or_refresh(self, name: str, refresh: Callable[[], Tuple[str, float]],
+                       min_ttl: float = 60) -> Tuple[str, float]:
+        """有効なトークンを取得（残り min_ttl 秒未満なら1プロセスだけが refresh を呼ぶ）
+
+        refresh は (トークン, 有効秒数) を返し、戻り値も (トークン, 残り有効秒数)
+        """
+        if not self.enabled:
+            return refresh()
+
+        try:
+            self._ensure_table()
+            deadline = time.time() + self.lease_seconds * 2
+            while True:
+                token, expires_at = self._load(name)
+                now = time.time()
+                if token and expires_at - now > min_ttl:
+                    self._stats['hits'] += 1
+                    return token, expires_at - now
+
+                if self._try_acquire_lease(name):
+                    break
+
+                # 他プロセスが更新中なので結果を待つ（リースが切れたら自分で取り直す）
+                self._stats['waits'] += 1
+                if now > deadline:
+                    logger.warning(f"トークン更新待ちがタイムアウトしました: {name}")
+                    break
+                time.sleep(self.poll_interval)
+        except Exception as e:
+            self._stats['errors'] += 1
+            logger.error(f"認証情報ストアエラー: {str(e)}")
+            return refresh()
+
+        try:
+            token, expires_in = refresh()
+        except Exception:
+            self._release_lease(name)
+            raise
+
+        try:
+            self._save(name, token, time.time() + expires_in)
+            self._stats['refreshes'] += 1
+            logger.info(f"トークンを認証情報ストアに保存しました: {name}")
+        except Exception as e:
+            self._stats['errors'] += 1
+            logger.error(f"認証情報ストア保存エラー: {str(e)}")
+        return token, expires_in
+
+    def invalidate(self, name: str):
+        """保存済みトークンを失効扱いにする（401 受信時など）"""
+        if not self.enabled:
+            return
+        try:
+            self._ensure_table()
+            self._db.execute_write('UPDATE credentials SET expires_at = 0 WHERE name = ?', (name,))
+        except Exception as e:
+            logger.error(f"認証情報ストア失効エラー: {str(e)}")
+
+    def get_stats(self) -> Dict[str, Any]:
+        """ストア統計取得"""
+        stats = dict(self._stats)
+        stats['enabled'] = self.enabled
+        stats['path'] = self.path
+        return stats
+
+# グローバルインスタンス
+credential_store = CredentialStore(Config.TOKEN_STORE_PATH, Config.TOKEN_STORE_SECRET)
@@ -0,0 +1,64 @@
+import threading
+import time
+import logging
+from collections import OrderedDict
+from typing import Dict, Any
+
+logger = logging.getLogger(__name__)
+
+class DedupCache:
+    """一定時間内に同じキーを受け付けたかを判定するキャッシュ（件数上限付き）"""
+
+    def __init__(self, name: str, max_entries: int = 10000, window: float = 3600):
+        self.name = name
+        self.max_entries = max_entries
+        self.window = window
+        # キー -> 受付時刻（受付順）
+        self._seen: 'OrderedDict[str, float]' = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats = {
+            'checked': 0,
+            'duplicates': 0,
+            'expired': 0,
+            'evicted': 0
+        }
+
+    def _expire(self, now: float):
+        """期限切れのキーを古い順に削除（ロック取得済みで呼ぶこと）"""
+        while self._seen:
+            key, seen_at = next(iter(self._seen.items()))
+            if now - seen_at < self.window:
+                break
+            del self._seen[key]
+            self._stats['expired'] += 1
+
+    def check_and_add(self, key: str) -> bool:
+        """初めてのキーなら記録して True、期間内に受付済みなら False"""
+        now = time.time()
+        with self._lock:
+            self._stats['checked'] += 1
+            self._expire(now)
+            if key in self._seen:
+                self._stats['duplicates'] += 1
+                return False
+
+            self._seen[key] = now
+            if len(self._seen) > self.max_entries:
+                self._seen.popitem(last=False)
+                self._stats['evicted'] += 1
+            return True
+
+    def discard(self, key: str):
+        """受付済みのキーを取り消す（処理できなかったイベントの再送を受け付けるため）"""
+        with self._lock:
+            self._seen.pop(key, None)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """統計取得"""
+        with self._lock:
+            stats = dict(self._stats)
+            stats['entries'] = len(self._seen)
+        stats['name'] = self.name
+        stats['max_entries'] = self.max_entries
+        stats['window'] = self.window
+        return stats
@@ -0,0 +1,140 @@
+import threading
+import time
+import logging
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from datetime import datetime
+from typing import Dict, Any, Callable, Iterable, List, Optional
+
+logger = logging.getLogger(__name__)
+
+class HealthProber:
+    """依存サービスのヘルスチェックをバックグラウンドで定期実行し、最新結果を保持する"""
+
+    def __init__(self, max_workers: int = 8):
+        self._probes: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='health-probe')
+        self._started = False
+
+    def register(self, name: str, probe: Callable[[], bool], interval: float, timeout: float):
+        """ヘルスチェック登録（probe は正常なら True を返す）"""
+        with self._lock:
+            self._probes[name] = {
+                'probe': probe,
+                'interval': interval,
+                'timeout': timeout,
+                'future': None,
+                'status': 'pending',
+                'healthy': None,
+                'checked_at': None,
+                'latency': None,
+                'error': None,
+                'runs': 0,
+                'failures': 0
+            }
+
+    def start(self):
+        """依存サービス毎の定期実行スレッドを起動（起動済みなら何もしない）"""
+        with self._lock:
+            if self._started:
+                return
+            self._started = True
+            names = list(self._probes)
+        for name in names:
+            threading.Thread(target=self._loop, args=(name,), name=f"health-{name}", daemon=True).start()
+        logger.info(f"ヘルスチェック開始: {', '.join(names)}")
+
+    def _loop(self, name: str):
+        """interval 秒毎にヘルスチェックを実行"""
+        while True:
+            self.probe_now([name])
+            time.sleep(self._probes[name]['interval'])
+
+    def _submit(self, name: str) -> Optional[Future]:
+        """ヘルスチェックを実行スレッドに投入（前回の実行がまだ終わっていなければ None）"""
+        with self._lock:
+            state = self._probes[name]
+            if state['future'] is not None and not state['future'].done():
+                return None
+            started = time.time()
+            future = self._executor.submit(state['probe'])
+            state['future'] = future
+        future.add_done_callback(lambda f: self._record(name, f, started))
+        return future
+
+    def _record(self, name: str, future: Future, started: float):
+        """実行結果を記録（期限切れ後に終わった場合も最新の結果で上書き）"""
+        try:
+            healthy = bool(future.result())
+            error = None if healthy else '接続失敗'
+        except Exception as e:
+            healthy = False
+            error = str(e)
+        with self._lock:
+            state = self._probes[name]
+            state['status'] = 'ok' if healthy else 'error'
+            state['healthy'] = healthy
+            state['checked_at'] = time.time()
+            state['latency'] = time.time() - started
+            state['error'] = error
+            state['runs'] += 1
+            if not healthy:
+                state['failures'] += 1
+        if not healthy:
+            logger.warning(f"ヘルスチェック失敗: {name}: {error}")
+
+    def _record_timeout(self, name: str, started: float):
+        """期限内に終わらなかったことを記録"""
+        with self._lock:
+            state = self._probes[name]
+            state['status'] = 'timeout'
+            state['healthy'] = False
+            state['checked_at'] = time.time()
+            state['latency'] = time.time() - started
+            state['error'] = f"{state['timeout']}秒以内に応答がありません"
+            state['runs'] += 1
+            state['failures'] += 1
+        logger.warning(f"ヘルスチェックタイムアウト: {name}")
+
+    def probe_now(self, names: Optional[Iterable[str]] = None) -> Dict[str, Dict[str, Any]]:
+        """指定したヘルスチェックを並列に実行し、それぞれの期限まで待って結果を返す"""
+        names = list(names) if names is not None else list(self._probes)
+        started = time.time()
+        pending: List[tuple] = []
+        for name in names:
+            future = self._submit(name)
+            if future is None:
+                # 前回の実行が終わっていない（応答待ちのまま）
+                future = self._probes[name]['future']
+            pending.append((name, future, started + self._probes[name]['timeout']))
+
+        for name, future, deadline in pending:
+            done, _ = wait([future], timeout=max(deadline - time.time(), 0))
+            if not done:
+                self._record_timeout(name, started)
+        return self.snapshot(names)
+
+    def snapshot(self, names: Optional[Iterable[str]] = None) -> Dict[str, Dict[str, Any]]:
+        """最新の結果を取得（age は結果の経過秒数、stale は実行間隔の2倍以上更新がないもの）"""
+        now = time.time()
+        result = {}
+        with self._lock:
+            for name in (names if names is not None else self._probes):
+                state = self._probes[name]
+                age = now - state['checked_at'] if state['checked_at'] else None
+                result[name] = {
+                    'status': state['status'],
+                    'healthy': state['healthy'],
+                    'checked_at': datetime.fromtimestamp(state['checked_at']).isoformat() if state['checked_at'] else None,
+                    'age': round(age, 1) if age is not None else None,
+                    'stale': age is None or age > state['interval'] * 2,
+                    'latency': round(state['latency'], 3) if state['latency'] is not None else None,
+                    'error': state['error'],
+                    'interval': state['interval'],
+                    'runs': state['runs'],
+                    'failures': state['failures']
+                }
+        return result
+
+# グローバルインスタンス
+health_prober = HealthProber()
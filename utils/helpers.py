@@ -1,33 +1,53 @@
 import re
+import unicodedata
 from datetime import datetime, timedelta
 from typing import Optional, Tuple
 import logging
 
 logger = logging.getLogger(__name__)
 
+# 日付・時間・会議時間の構文（NFKC 正規化後の文字列に適用）
+DATE_PATTERN = re.compile(
+    r'(?P<y1>\d{4})(?P<sep1>[/-])(?P<m1>\d{1,2})(?P=sep1)(?P<d1>\d{1,2})'
+    r'|(?P<m2>\d{1,2})(?P<sep2>[/-])(?P<d2>\d{1,2})(?P=sep2)(?P<y2>\d{4})'
+    r'|(?P<y3>\d{4})年(?P<m3>\d{1,2})月(?P<d3>\d{1,2})日',
+    re.ASCII
+)
+TIME_PATTERN = re.compile(
+    r'(?P<hour>\d{1,2})(?::(?P<minute>\d{1,2})|時(?P<minute_ja>\d{1,2})分)(?:\s*(?P<ampm>[AaPp][Mm]))?',
+    re.ASCII
+)
+DURATION_PATTERN = re.compile(r'(?:(?P<hours>\d+)時間)?(?:(?P<minutes>\d+)分?)?', re.ASCII)
+_NUMBER_PATTERN = re.compile(r'\d+', re.ASCII)
+
+def normalize_input(text: str) -> str:
+    """全角英数字・記号を半角に揃えて前後の空白を除去"""
+    if text.isascii():
+        return text.strip()
+    return unicodedata.normalize('NFKC', text).strip()
+
 def validate_date(date_str: str) -> Optional[datetime]:
     """日付文字列の検証と変換"""
     try:
-        # 複数の日付形式に対応
-        date_formats = [
-            '%Y/%m/%d',
-            '%Y-%m-%d',
-            '%m/%d/%Y',
-            '%m-%d-%Y',
-            '%Y年%m月%d日'
-        ]
+        # 複数の日付形式に対応（全角数字も可）
+        match = DATE_PATTERN.fullmatch(normalize_input(date_str))
+        if not match:
+            return None
         
-        for fmt in date_formats:
-            try:
-                date_obj = datetime.strptime(date_str, fmt)
-                # 過去日チェック（2024年以降は許可）
-                if date_obj.year < 2024:
-                    return None
-                return date_obj
-            except ValueError:
-                continue
+        year, month, day = (
+            match.group('y1', 'm1', 'd1') if match.group('y1') else
+            match.group('y2', 'm2', 'd2') if match.group('y2') else
+            match.group('y3', 'm3', 'd3')
+        )
+        try:
+            date_obj = datetime(int(year), int(month), int(day))
+        except ValueError:
+            return None
         
-        return None
+        # 過去日チェック（2024年以降は許可）
+        if date_obj.year < 2024:
+            return None
+        return date_obj
     except Exception as e:
         logger.error(f"日付検証エラー: {str(e)}")
         return None
@@ -35,22 +55,22 @@ def validate_date(date_str: str) -> Optional[datetime]:
 def validate_time(time_str: str) -> Optional[datetime]:
     """時間文字列の検証と変換"""
     try:
-        # 複数の時間形式に対応
-        time_formats = [
-            '%H:%M',
-            '%H時%M分',
-            '%I:%M %p',  # 12時間形式
-            '%I時%M分 %p'
-        ]
+        # 24時間形式・12時間形式（AM/PM）に対応（全角数字も可）
+        match = TIME_PATTERN.fullmatch(normalize_input(time_str))
+        if not match:
+            return None
         
-        for fmt in time_formats:
-            try:
-                time_obj = datetime.strptime(time_str, fmt)
-                return time_obj
-            except ValueError:
-                continue
+        hour = int(match.group('hour'))
+        minute = int(match.group('minute') or match.group('minute_ja'))
+        ampm = match.group('ampm')
+        if ampm:
+            if not 1 <= hour <= 12:
+                return None
+            hour = hour % 12 + (12 if ampm.upper() == 'PM' else 0)
+        if hour > 23 or minute > 59:
+            return None
         
-        return None
+        return datetime(1900, 1, 1, hour, minute)
     except Exception as e:
         logger.error(f"時間検証エラー: {str(e)}")
         return None
@@ -58,25 +78,70 @@ def validate_time(time_str: str) -> Optional[datetime]:
 def validate_duration(duration_str: str) -> Optional[int]:
     """会議時間の検証（分単位）"""
     try:
-        # 数字のみの場合
+        duration_str = normalize_input(duration_str)
         if duration_str.isdigit():
             duration = int(duration_str)
-            if 1 <= duration <= 480:  # 1分〜8時間
-                return duration
+            return duration if 1 <= duration <= 480 else None
         
-        # "分"が含まれる場合
-        if '分' in duration_str:
-            numbers = re.findall(r'\d+', duration_str)
-            if numbers:
-                duration = int(numbers[0])
-                if 1 <= duration <= 480:
-                    return duration
+        # 「60分」「1時間」「1時間30分」
+        match = DURATION_PATTERN.fullmatch(duration_str)
+        if match and (match.group('hours') or match.group('minutes')):
+            duration = int(match.group('hours') or 0) * 60 + int(match.group('minutes') or 0)
+        elif '分' in duration_str:
+            # 「約60分」など前後に文字がある場合は最初の数字
+            number = _NUMBER_PATTERN.search(duration_str)
+            if not number:
+                return None
+            duration = int(number.group())
+        else:
+            return None
         
+        if 1 <= duration <= 480:  # 1分〜8時間
+            return duration
         return None
     except Exception as e:
         logger.error(f"時間検証エラー: {str(e)}")
         return None
 
+# 一括入力コマンド「会議作成 会議名 日付 時間 会議時間 [メモ]」の構文
+# （会議名・メモは入力のまま残すため正規化せず、全角の区切り記号も直接受け付ける）
+_DATE_TOKEN = r'\d{4}[/／\-－]\d{1,2}[/／\-－]\d{1,2}|\d{1,2}[/／\-－]\d{1,2}[/／\-－]\d{4}|\d{4}年\d{1,2}月\d{1,2}日'
+_TIME_TOKEN = r'\d{1,2}(?:[:：]\d{1,2}|時\d{1,2}分)(?:\s*[AaPpＡａＰｐ][MmＭｍ])?'
+_DURATION_TOKEN = r'\d+時間(?:\d+分)?|\d+分?'
+
+# 一括入力コマンドの判定（「会議作成手順の確認」のような会議名・メモを誤ってコマンド扱いしないよう区切りまで見る）
+MEETING_COMMAND_PREFIX = re.compile(r'^会議作成\s')
+
+MEETING_COMMAND_PATTERN = re.compile(
+    rf'^会議作成\s+(?P<meeting_name>.+?)\s+(?P<date>{_DATE_TOKEN})\s+(?P<time>{_TIME_TOKEN})'
+    rf'\s+(?P<duration>{_DURATION_TOKEN})(?:\s+(?P<memo>.+))?$',
+    re.DOTALL
+)
+
+def parse_meeting_command(text: str) -> Optional[dict]:
+    """一括入力コマンドを会議データに変換（形式が違う・値が不正な場合は None）"""
+    try:
+        match = MEETING_COMMAND_PATTERN.match(text.strip())
+        if not match:
+            return None
+        
+        date_obj = validate_date(match.group('date'))
+        time_obj = validate_time(match.group('time'))
+        duration = validate_duration(match.group('duration'))
+        if not date_obj or not time_obj or not duration:
+            return None
+        
+        return {
+            'meeting_name': match.group('meeting_name').strip(),
+            'date': date_obj,
+            'time': time_obj,
+            'duration': duration,
+            'memo': (match.group('memo') or '').strip()
+        }
+    except Exception as e:
+        logger.error(f"会議作成コマンド解析エラー: {str(e)}")
+        return None
+
 def combine_datetime(date: datetime, time: datetime) -> datetime:
     """日付と時間を結合"""
     try:
@@ -0,0 +1,184 @@
+import threading
+import time
+import logging
+from contextlib import contextmanager
+from typing import Dict, Any, Optional, Tuple
+from config import Config
+
+logger = logging.getLogger(__name__)
+
+class CircuitOpenError(Exception):
+    """ブレーカーが開いているため呼び出さずに失敗"""
+
+class DeadlineExceededError(Exception):
+    """ジョブ全体の期限を超えた"""
+
+# 期限切れとみなす残り時間の誤差（秒）。タイムアウトを期限で切り詰めた呼び出しは期限付近で失敗する
+DEADLINE_SLACK = 0.1
+
+# スレッド毎の外部呼び出し期限（time.time() 基準の絶対時刻）
+_deadline_local = threading.local()
+
+@contextmanager
+def deadline_scope(deadline: Optional[float]):
+    """このスレッドで行う外部呼び出しに全体期限を設定（None は期限なし）"""
+    previous = getattr(_deadline_local, 'deadline', None)
+    _deadline_local.deadline = deadline
+    try:
+        yield
+    finally:
+        _deadline_local.deadline = previous
+
+def remaining_time() -> Optional[float]:
+    """期限までの残り秒数（期限未設定なら None）"""
+    deadline = getattr(_deadline_local, 'deadline', None)
+    if deadline is None:
+        return None
+    return max(deadline - time.time(), 0.0)
+
+def cap_timeout(timeout: Optional[float]) -> Optional[float]:
+    """待ち時間を期限までの残り時間で切り詰める"""
+    remaining = remaining_time()
+    if remaining is None:
+        return timeout
+    return remaining if timeout is None else min(timeout, remaining)
+
+def check_deadline(provider: str):
+    """期限を過ぎていれば呼び出す前に失敗させる"""
+    if remaining_time() == 0:
+        raise DeadlineExceededError(f"{provider}: 処理期限を超えたため呼び出しを中止しました")
+
+def request_timeout(provider: str, connect: float, read: float) -> Tuple[float, float]:
+    """requests 用の (接続, 読み込み) タイムアウト（期限までの残り時間で切り詰める）"""
+    check_deadline(provider)
+    return cap_timeout(connect), cap_timeout(read)
+
+def _status_code(error: Exception) -> Optional[int]:
+    """HTTP エラーのステータスコード取得（requests / googleapiclient）"""
+    status = getattr(getattr(error, 'response', None), 'status_code', None)
+    if status is None:
+        status = getattr(getattr(error, 'resp', None), 'status', None)
+    return int(status) if status is not None else None
+
+def is_provider_failure(error: Exception) -> bool:
+    """プロバイダー側の障害とみなすか（4xx はリクエスト側の問題なので含めない）"""
+    if isinstance(error, (CircuitOpenError, DeadlineExceededError)):
+        return False
+    status = _status_code(error)
+    return status is None or status >= 500
+
+class CircuitBreaker:
+    """プロバイダー毎のサーキットブレーカー
+
+    連続 failure_threshold 回失敗すると開き、reset_timeout 秒の間は呼び出さずに失敗させる。
+    その後は1件だけ試行し（half_open）、成功すれば閉じ、失敗すれば再び開く
+    """
+
+    CLOSED = 'closed'
+    OPEN = 'open'
+    HALF_OPEN = 'half_open'
+
+    def __init__(self, name: str, failure_threshold: int = 5, reset_timeout: float = 30):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._state = self.CLOSED
+        self._consecutive_failures = 0
+        self._opened_at = 0.0
+        self._trial_in_flight = False
+        self._last_error: Optional[str] = None
+        self._lock = threading.Lock()
+        self._stats = {
+            'calls': 0,
+            'failures': 0,
+            'rejected': 0,
+            'opened': 0
+        }
+
+    def _before_call(self):
+        """呼び出し可否の判定（開いている間は CircuitOpenError）"""
+        with self._lock:
+            if self._state == self.OPEN and time.time() - self._opened_at >= self.reset_timeout:
+                self._state = self.HALF_OPEN
+                self._trial_in_flight = False
+            if self._state == self.OPEN or (self._state == self.HALF_OPEN and self._trial_in_flight):
+                self._stats['rejected'] += 1
+                retry_in = max(self.reset_timeout - (time.time() - self._opened_at), 0)
+                raise CircuitOpenError(f"{self.name} は障害中のため呼び出しを停止しています（約{retry_in:.0f}秒後に再試行）")
+            if self._state == self.HALF_OPEN:
+                self._trial_in_flight = True
+            self._stats['calls'] += 1
+
+    def _on_success(self):
+        with self._lock:
+            if self._state != self.CLOSED:
+                logger.info(f"サーキットブレーカー復帰: {self.name}")
+            self._state = self.CLOSED
+            self._consecutive_failures = 0
+            self._trial_in_flight = False
+
+    def _on_failure(self, error: Exception):
+        with self._lock:
+            self._stats['failures'] += 1
+            self._consecutive_failures += 1
+            self._last_error = str(error)
+            self._trial_in_flight = False
+            if self._state == self.HALF_OPEN or self._consecutive_failures >= self.failure_threshold:
+                if self._state != self.OPEN:
+                    self._stats['opened'] += 1
+                    logger.warning(f"サーキットブレーカー開放: {self.name}（連続失敗 {self._consecutive_failures} 回）: {error}")
+                self._state = self.OPEN
+                self._opened_at = time.time()
+
+    def _on_skip(self):
+        """失敗にも成功にも数えない（half_open の試行枠だけ返す）"""
+        with self._lock:
+            self._trial_in_flight = False
+
+    @contextmanager
+    def guard(self, timeout: Optional[float] = None):
+        """ブレーカー経由の呼び出し（プロバイダー障害の例外だけを失敗として数える）
+
+        timeout には呼び出しに設定したタイムアウトを渡す。ジョブの期限の残りがそれより短く、
+        期限切れの状態で失敗した場合はプロバイダー障害ではなく DeadlineExceededError とする
+        """
+        self._before_call()
+        remaining = remaining_time()
+        deadline_bound = timeout is not None and remaining is not None and remaining < timeout
+        try:
+            yield
+        except Exception as e:
+            if deadline_bound and remaining_time() <= DEADLINE_SLACK:
+                self._on_skip()
+                raise DeadlineExceededError(f"{self.name}: 処理期限内に応答がありませんでした: {str(e)}") from e
+            if is_provider_failure(e):
+                self._on_failure(e)
+            else:
+                self._on_success()
+            raise
+        else:
+            self._on_success()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """ブレーカー状態取得"""
+        with self._lock:
+            stats = dict(self._stats)
+            state = self._state
+            if state == self.OPEN and time.time() - self._opened_at >= self.reset_timeout:
+                state = self.HALF_OPEN
+            stats['state'] = state
+            stats['consecutive_failures'] = self._consecutive_failures
+            stats['last_error'] = self._last_error
+            stats['opened_for'] = round(time.time() - self._opened_at, 1) if state != self.CLOSED else None
+        stats['failure_threshold'] = self.failure_threshold
+        stats['reset_timeout'] = self.reset_timeout
+        return stats
+
+# グローバルインスタンス（プロバイダー毎）
+zoom_breaker = CircuitBreaker('zoom', Config.CIRCUIT_FAILURE_THRESHOLD, Config.CIRCUIT_RESET_TIMEOUT)
+google_breaker = CircuitBreaker('google_calendar', Config.CIRCUIT_FAILURE_THRESHOLD, Config.CIRCUIT_RESET_TIMEOUT)
+line_breaker = CircuitBreaker('line', Config.CIRCUIT_FAILURE_THRESHOLD, Config.CIRCUIT_RESET_TIMEOUT)
+
+def get_breaker_stats() -> Dict[str, Dict[str, Any]]:
+    """全プロバイダーのブレーカー状態取得"""
+    return {breaker.name: breaker.get_stats() for breaker in (zoom_breaker, google_breaker, line_breaker)}
@@ -0,0 +1,127 @@
+import threading
+import time
+import logging
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Dict, Any, Optional, Mapping
+
+logger = logging.getLogger(__name__)
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Retry-After ヘッダーを待ち秒数に変換（秒数・HTTP日付・ISO8601に対応）"""
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+
+    for parser in (parsedate_to_datetime, lambda v: datetime.fromisoformat(v.replace('Z', '+00:00'))):
+        try:
+            retry_at = parser(value)
+            if retry_at.tzinfo is None:
+                retry_at = retry_at.replace(tzinfo=timezone.utc)
+            return max((retry_at - datetime.now(timezone.utc)).total_seconds(), 0.0)
+        except (TypeError, ValueError):
+            continue
+
+    logger.warning(f"Retry-After ヘッダーを解釈できません: {value}")
+    return None
+
+class TokenBucket:
+    """トークンバケット方式のレートリミッター（API のレート制限ヘッダーで補正）"""
+
+    def __init__(self, name: str, rate: float, capacity: int):
+        self.name = name
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = float(capacity)
+        self._updated_at = time.monotonic()
+        self._paused_until = 0.0
+        self._cond = threading.Condition()
+        self._stats = {
+            'acquired': 0,
+            'waited': 0,
+            'total_wait_time': 0.0,
+            'throttled': 0
+        }
+        # API から通知された残り回数
+        self._limit: Optional[int] = None
+        self._remaining: Optional[int] = None
+        self._limit_type: Optional[str] = None
+
+    def _refill(self, now: float):
+        """経過時間分のトークンを補充（ロック取得済みで呼ぶこと）"""
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated_at) * self.rate)
+        self._updated_at = now
+
+    def acquire(self, timeout: Optional[float] = None) -> bool:
+        """トークン取得（取得できるまで待機。timeout 秒を超えたら False）"""
+        started = time.monotonic()
+        deadline = started + timeout if timeout is not None else None
+        with self._cond:
+            while True:
+                now = time.monotonic()
+                self._refill(now)
+                if now >= self._paused_until and self._tokens >= 1:
+                    self._tokens -= 1
+                    self._stats['acquired'] += 1
+                    waited = now - started
+                    if waited > 0.001:
+                        self._stats['waited'] += 1
+                        self._stats['total_wait_time'] += waited
+                    return True
+
+                if now < self._paused_until:
+                    wait = self._paused_until - now
+                else:
+                    wait = (1 - self._tokens) / self.rate
+                if deadline is not None:
+                    if now >= deadline:
+                        return False
+                    wait = min(wait, deadline - now)
+                self._cond.wait(wait)
+
+    def pause(self, seconds: float):
+        """指定秒数だけ新しい呼び出しを止める（429 / Retry-After 受信時）"""
+        with self._cond:
+            self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+            self._tokens = 0
+            self._stats['throttled'] += 1
+            self._cond.notify_all()
+        logger.warning(f"レート制限により {seconds:.1f}秒 待機します: {self.name}")
+
+    def update_from_headers(self, headers: Mapping[str, str]):
+        """X-RateLimit-* ヘッダーからバジェットを更新"""
+        limit = headers.get('X-RateLimit-Limit')
+        remaining = headers.get('X-RateLimit-Remaining')
+        limit_type = headers.get('X-RateLimit-Type')
+        with self._cond:
+            if limit_type:
+                self._limit_type = limit_type
+            try:
+                if limit is not None:
+                    self._limit = int(limit)
+                if remaining is not None:
+                    self._remaining = int(remaining)
+                    # 秒間制限の残りがサーバー側で少なければ手元のトークンも合わせる
+                    if (limit_type or '').upper() == 'QPS':
+                        self._tokens = min(self._tokens, float(self._remaining))
+            except ValueError:
+                logger.warning(f"レート制限ヘッダーを解釈できません: {limit} / {remaining}")
+
+    def get_stats(self) -> Dict[str, Any]:
+        """現在のバジェット取得"""
+        with self._cond:
+            self._refill(time.monotonic())
+            stats = dict(self._stats)
+            stats['tokens'] = round(self._tokens, 2)
+            stats['paused_for'] = round(max(self._paused_until - time.monotonic(), 0.0), 2)
+            stats['api_limit'] = self._limit
+            stats['api_remaining'] = self._remaining
+            stats['api_limit_type'] = self._limit_type
+        stats['name'] = self.name
+        stats['rate'] = self.rate
+        stats['capacity'] = self.capacity
+        return stats
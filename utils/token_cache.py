@@ -0,0 +1,122 @@
+import threading
+import time
+import logging
+from typing import Dict, Any, Callable, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+class TokenCache:
+    """アクセストークンキャッシュ（同時更新は1回にまとめ、期限前にバックグラウンドで更新）"""
+
+    def __init__(self, name: str, fetcher: Callable[[], Tuple[str, float]],
+                 expiry_margin: float = 60, refresh_ahead: float = 300):
+        # fetcher は (トークン, 有効秒数) を返す
+        self.name = name
+        self.fetcher = fetcher
+        self.expiry_margin = expiry_margin
+        self.refresh_ahead = refresh_ahead
+        self._token: Optional[str] = None
+        self._expires_at = 0.0
+        self._refreshing = False
+        self._last_error: Optional[str] = None
+        self._cond = threading.Condition()
+        self._refresher: Optional[threading.Thread] = None
+        self._stats = {
+            'hits': 0,
+            'refreshes': 0,
+            'background_refreshes': 0,
+            'waiters': 0,
+            'failures': 0
+        }
+
+    def _is_valid(self, now: float) -> bool:
+        """トークンが有効か（ロック取得済みで呼ぶこと）"""
+        return self._token is not None and now < self._expires_at - self.expiry_margin
+
+    def get(self) -> str:
+        """トークン取得（期限切れなら1スレッドだけが更新し、他はその結果を待つ）"""
+        with self._cond:
+            while True:
+                if self._is_valid(time.time()):
+                    self._stats['hits'] += 1
+                    return self._token
+                if not self._refreshing:
+                    self._refreshing = True
+                    break
+                self._stats['waiters'] += 1
+                self._cond.wait()
+                # 更新に失敗した場合はエラーをそのまま返す
+                if not self._refreshing and not self._is_valid(time.time()) and self._last_error:
+                    raise Exception(f"{self.name} トークン更新失敗: {self._last_error}")
+
+        return self._refresh(background=False)
+
+    def _refresh(self, background: bool) -> str:
+        """トークン更新（_refreshing を立てたスレッドだけが呼ぶ）"""
+        try:
+            token, expires_in = self.fetcher()
+            with self._cond:
+                self._token = token
+                self._expires_at = time.time() + expires_in
+                self._last_error = None
+                self._stats['background_refreshes' if background else 'refreshes'] += 1
+            self._ensure_refresher()
+            logger.info(f"トークン更新完了: {self.name} (有効期限: {expires_in:.0f}秒)")
+            return token
+        except Exception as e:
+            with self._cond:
+                self._last_error = str(e)
+                self._stats['failures'] += 1
+            logger.error(f"トークン更新エラー: {self.name}: {str(e)}")
+            raise
+        finally:
+            with self._cond:
+                self._refreshing = False
+                self._cond.notify_all()
+
+    def _ensure_refresher(self):
+        """バックグラウンド更新スレッドを起動"""
+        with self._cond:
+            if self._refresher is not None:
+                return
+            self._refresher = threading.Thread(target=self._refresh_loop, name=f"{self.name}-token-refresher", daemon=True)
+            self._refresher.start()
+
+    def _refresh_loop(self):
+        """有効期限の refresh_ahead 秒前に更新する"""
+        retry_delay = 5.0
+        while True:
+            with self._cond:
+                lifetime_left = self._expires_at - time.time()
+                # 有効期間が短いトークンは残り時間の半分で更新する
+                ahead = min(self.refresh_ahead, max(lifetime_left / 2, 0))
+                wait = max(lifetime_left - ahead, 1.0)
+            time.sleep(wait)
+
+            with self._cond:
+                if self._refreshing or self._expires_at - time.time() > self.refresh_ahead:
+                    continue
+                self._refreshing = True
+            try:
+                self._refresh(background=True)
+                retry_delay = 5.0
+            except Exception:
+                time.sleep(retry_delay)
+                retry_delay = min(retry_delay * 2, 60.0)
+
+    def invalidate(self):
+        """トークンを破棄（401 受信時など）"""
+        with self._cond:
+            self._token = None
+            self._expires_at = 0.0
+
+    def get_stats(self) -> Dict[str, Any]:
+        """キャッシュ統計取得"""
+        with self._cond:
+            stats = dict(self._stats)
+            stats['valid'] = self._is_valid(time.time())
+            stats['expires_in'] = round(max(self._expires_at - time.time(), 0.0), 1)
+            stats['refreshing'] = self._refreshing
+            stats['last_error'] = self._last_error
+        stats['name'] = self.name
+        return stats
@@ -0,0 +1,188 @@
+import heapq
+import itertools
+import queue
+import threading
+import time
+import zlib
+import logging
+from typing import Dict, Any, Callable
+
+logger = logging.getLogger(__name__)
+
+class BoundedExecutor:
+    """上限付きキューを持つ固定サイズのワーカープール"""
+
+    def __init__(self, name: str, max_workers: int = 4, max_queue_size: int = 20,
+                 max_delayed: int = 100, enable_scheduler: bool = True):
+        self.name = name
+        self.max_workers = max_workers
+        self.max_queue_size = max_queue_size
+        self.max_delayed = max_delayed
+        # False の場合はスケジューラースレッドを起動せず、遅延実行の予約を受け付けない
+        self.enable_scheduler = enable_scheduler
+        self._queue: queue.Queue = queue.Queue(maxsize=max_queue_size)
+        self._lock = threading.Lock()
+        self._workers = []
+        self._started = False
+        # 遅延実行用（スケジューラースレッド1本で管理）
+        self._delayed = []
+        self._delayed_cond = threading.Condition(self._lock)
+        self._seq = itertools.count()
+        self._stats = {
+            'submitted': 0,
+            'completed': 0,
+            'failed': 0,
+            'rejected': 0,
+            'delayed': 0,
+            'max_queue_depth': 0,
+            'total_wait_time': 0.0,
+            'total_run_time': 0.0,
+            'max_run_time': 0.0
+        }
+        self._running = 0
+
+    def _ensure_started(self):
+        """ワーカースレッドを初回投入時に起動"""
+        with self._lock:
+            if self._started:
+                return
+            for i in range(self.max_workers):
+                worker = threading.Thread(target=self._worker_loop, name=f"{self.name}-{i}", daemon=True)
+                worker.start()
+                self._workers.append(worker)
+            if self.enable_scheduler:
+                scheduler = threading.Thread(target=self._scheduler_loop, name=f"{self.name}-scheduler", daemon=True)
+                scheduler.start()
+                self._workers.append(scheduler)
+            self._started = True
+
+    def submit(self, func: Callable, *args, **kwargs) -> bool:
+        """ジョブ投入（キューが満杯の場合は False を返す）"""
+        return self.submit_wait(0, func, *args, **kwargs)
+
+    def submit_wait(self, timeout: float, func: Callable, *args, **kwargs) -> bool:
+        """ジョブ投入（キューが満杯の場合は最大 timeout 秒待つ）"""
+        self._ensure_started()
+        try:
+            self._queue.put((time.time(), func, args, kwargs), block=timeout > 0, timeout=timeout or None)
+        except queue.Full:
+            with self._lock:
+                self._stats['rejected'] += 1
+            logger.warning(f"ワーカープール満杯: {self.name} (キュー: {self.max_queue_size})")
+            return False
+
+        with self._lock:
+            self._stats['submitted'] += 1
+            self._stats['max_queue_depth'] = max(self._stats['max_queue_depth'], self._queue.qsize())
+        return True
+
+    def schedule(self, delay: float, func: Callable, *args, **kwargs) -> bool:
+        """遅延実行の予約（func はスケジューラースレッドで呼ばれるため軽い処理に限る）"""
+        if not self.enable_scheduler:
+            raise RuntimeError(f"遅延実行は無効です: {self.name}")
+        self._ensure_started()
+        with self._delayed_cond:
+            if len(self._delayed) >= self.max_delayed:
+                self._stats['rejected'] += 1
+                return False
+            heapq.heappush(self._delayed, (time.time() + delay, next(self._seq), func, args, kwargs))
+            self._stats['delayed'] += 1
+            self._delayed_cond.notify()
+        return True
+
+    def _scheduler_loop(self):
+        """遅延実行スケジューラー"""
+        while True:
+            with self._delayed_cond:
+                while not self._delayed or self._delayed[0][0] > time.time():
+                    timeout = self._delayed[0][0] - time.time() if self._delayed else None
+                    self._delayed_cond.wait(timeout)
+                _, _, func, args, kwargs = heapq.heappop(self._delayed)
+            try:
+                func(*args, **kwargs)
+            except Exception as e:
+                logger.error(f"遅延ジョブエラー: {self.name}: {str(e)}")
+
+    def _worker_loop(self):
+        """ワーカースレッド本体"""
+        while True:
+            enqueued_at, func, args, kwargs = self._queue.get()
+            started_at = time.time()
+            wait_time = started_at - enqueued_at
+            with self._lock:
+                self._running += 1
+            succeeded = False
+            try:
+                func(*args, **kwargs)
+                succeeded = True
+            except Exception as e:
+                logger.error(f"ジョブ実行エラー: {self.name}: {str(e)}")
+            finally:
+                run_time = time.time() - started_at
+                with self._lock:
+                    self._running -= 1
+                    self._stats['completed' if succeeded else 'failed'] += 1
+                    self._stats['total_wait_time'] += wait_time
+                    self._stats['total_run_time'] += run_time
+                    self._stats['max_run_time'] = max(self._stats['max_run_time'], run_time)
+                self._queue.task_done()
+                logger.info(f"ジョブ完了: {self.name} (待ち時間: {wait_time:.2f}秒, 実行時間: {run_time:.2f}秒)")
+
+    def get_stats(self) -> Dict[str, Any]:
+        """プール統計取得"""
+        with self._lock:
+            stats = dict(self._stats)
+            stats['running'] = self._running
+            stats['pending_delayed'] = len(self._delayed)
+        finished = stats['completed'] + stats['failed']
+        stats['name'] = self.name
+        stats['max_workers'] = self.max_workers
+        stats['max_queue_size'] = self.max_queue_size
+        stats['queue_depth'] = self._queue.qsize()
+        stats['avg_wait_time'] = stats['total_wait_time'] / finished if finished else 0.0
+        stats['avg_run_time'] = stats['total_run_time'] / finished if finished else 0.0
+        return stats
+
+
+class ShardedExecutor:
+    """キー毎に実行順序を保証し、異なるキーは並列に実行するワーカープール"""
+
+    def __init__(self, name: str, num_shards: int = 4, max_queue_size: int = 50):
+        self.name = name
+        self.num_shards = num_shards
+        # 1シャード = 1スレッドとし、同じキーのジョブは必ず同じシャードで順番に実行する
+        # （遅延実行は使わないためシャード毎のスケジューラースレッドは起動しない）
+        self._shards = [
+            BoundedExecutor(f"{name}-shard{i}", max_workers=1, max_queue_size=max_queue_size,
+                            enable_scheduler=False)
+            for i in range(num_shards)
+        ]
+
+    def _shard_for(self, key: str) -> BoundedExecutor:
+        """キーに対応するシャード取得（プロセス間で安定なハッシュを使用）"""
+        return self._shards[zlib.crc32(key.encode('utf-8')) % self.num_shards]
+
+    def submit(self, key: str, func: Callable, *args, **kwargs) -> bool:
+        """キーを指定してジョブ投入（キューが満杯の場合は待たずに False を返す）"""
+        return self._shard_for(key or '').submit(func, *args, **kwargs)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """シャード全体の統計取得"""
+        shard_stats = [shard.get_stats() for shard in self._shards]
+        finished = sum(s['completed'] + s['failed'] for s in shard_stats)
+        total_wait = sum(s['total_wait_time'] for s in shard_stats)
+        total_run = sum(s['total_run_time'] for s in shard_stats)
+        return {
+            'name': self.name,
+            'num_shards': self.num_shards,
+            'submitted': sum(s['submitted'] for s in shard_stats),
+            'completed': sum(s['completed'] for s in shard_stats),
+            'failed': sum(s['failed'] for s in shard_stats),
+            'rejected': sum(s['rejected'] for s in shard_stats),
+            'queue_depth': sum(s['queue_depth'] for s in shard_stats),
+            'running': sum(s['running'] for s in shard_stats),
+            'avg_wait_time': total_wait / finished if finished else 0.0,
+            'avg_run_time': total_run / finished if finished else 0.0,
+            'max_run_time': max((s['max_run_time'] for s in shard_stats), default=0.0),
+            'shard_queue_depths': [s['queue_depth'] for s in shard_stats]
+        }